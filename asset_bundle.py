@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Paquet d'assets
+===============
+
+Toutes les images chargées par le jeu sont regroupées dans un seul fichier : un
+en-tête (magique, version, position et taille de l'index), les pixels RGBA de chaque
+image, bruts ou compressés (zlib), puis l'index JSON {nom: position, taille,
+compression, date de modification de la source}. Le fichier est projeté en mémoire
+(mmap) et chaque image n'est décodée qu'à la demande ; une image brute est lue sans
+copie (pygame.image.frombuffer). Construire le paquet avec :
+
+    python asset_bundle.py [--compress]
+
+Les images sont nommées par leur chemin relatif au dossier des assets, en minuscules
+(asset_name) : les chemins du code ("assets/Enemy/1.png") trouvent leur fichier quelle
+que soit la casse du disque (resolve_asset_path).
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+import pygame
+
+BUNDLE_FILE = "assets.lmsbundle"
+BUNDLE_MAGIC = b"LMSB"
+BUNDLE_VERSION = 1
+BUNDLE_HEADER = struct.Struct("<4sIQI")  # Magique, version, position et taille de l'index JSON
+
+# Images chargées par le jeu hors atlas (les images des atlas sont ajoutées d'après leur index)
+BUNDLE_FILES = [
+    "player/player2.png", "player/player3.png", "player/player4.png", "player/pointer2.png",
+    "grass7.png", "tileset.png",
+]
+
+_asset_files = None  # {nom en minuscules: chemin réel des fichiers et dossiers}, construit au premier chemin introuvable
+
+
+def asset_name(path):
+    """Nom d'un asset : chemin relatif au dossier des assets, en minuscules ("enemy/1.png")"""
+    name = path.replace("\\", "/").lower()
+    if name.startswith("assets/"):
+        name = name[len("assets/"):]
+    return name
+
+
+def resolve_asset_path(path):
+    """Chemin réel d'un asset (fichier ou dossier), sans tenir compte de la casse (systèmes de fichiers Linux)"""
+    global _asset_files
+    if os.path.exists(path):
+        return path
+    if _asset_files is None:
+        _asset_files = {}
+        for folder in os.listdir("."):
+            if folder.lower() == "assets" and os.path.isdir(folder):
+                for root, _, files in os.walk(folder):
+                    _asset_files[asset_name(os.path.relpath(root, folder))] = root
+                    for filename in files:
+                        file_path = os.path.join(root, filename)
+                        _asset_files[asset_name(os.path.relpath(file_path, folder))] = file_path
+    return _asset_files.get(asset_name(path), path)
+
+
+class AssetBundle:
+    """Paquet d'assets projeté en mémoire, images décodées à la demande"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_start, index_length = BUNDLE_HEADER.unpack_from(self.buffer)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError(f"{path} n'est pas un paquet d'assets version {BUNDLE_VERSION}")
+        self.entries = json.loads(self.buffer[index_start:index_start + index_length].decode('utf-8'))
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def is_current(self, name, source_path):
+        """Vrai si l'image du paquet correspond au fichier source (absent = paquet seul livré)"""
+        try:
+            return os.stat(source_path).st_mtime_ns == self.entries[name]["mtime_ns"]
+        except OSError:
+            return True
+
+    def load(self, name):
+        """Surface RGBA non convertie d'une image du paquet"""
+        entry = self.entries[name]
+        size = tuple(entry["size"])
+        data = memoryview(self.buffer)[entry["offset"]:entry["offset"] + entry["length"]]
+        if entry["compression"] == "zlib":
+            return pygame.image.frombytes(zlib.decompress(data), size, "RGBA")
+        return pygame.image.frombuffer(data, size, "RGBA")  # Pixels lus directement dans la projection
+
+
+def bundle_names(atlas_dir=os.path.join("assets", "atlas")):
+    """Images à empaqueter : BUNDLE_FILES et les images des atlas"""
+    from texture_atlas import ATLAS_INDEX_FILE
+
+    names = list(BUNDLE_FILES)
+    index_file = resolve_asset_path(os.path.join(atlas_dir, ATLAS_INDEX_FILE))
+    try:
+        with open(index_file, encoding='utf-8') as f:
+            atlases = json.load(f)["atlases"]
+        names += [asset_name(f"{atlas_dir}/{atlas['image']}") for atlas in atlases.values()]
+    except (OSError, ValueError, KeyError):
+        print(f"⚠️ Index des atlas illisible ({index_file}), paquet construit sans les atlas")
+    return names
+
+
+def build_bundle(output=BUNDLE_FILE, compress=False, names=None):
+    """Étape hors ligne : écrit le paquet des images (pixels RGBA bruts ou compressés)"""
+    from asset_cache import AssetCache
+
+    entries = {}
+    temp_file = f"{output}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(bytes(BUNDLE_HEADER.size))  # En-tête écrit une fois l'index placé
+        for name in names if names is not None else bundle_names():
+            source_path = resolve_asset_path(f"assets/{name}")
+            image = AssetCache._decode(source_path)
+            data = pygame.image.tobytes(image, "RGBA")
+            if compress:
+                data = zlib.compress(data, 6)
+            entries[name] = {
+                "offset": f.tell(),
+                "length": len(data),
+                "size": list(image.get_size()),
+                "compression": "zlib" if compress else "raw",
+                "mtime_ns": os.stat(source_path).st_mtime_ns,
+            }
+            f.write(data)
+        
+        index = json.dumps(entries, ensure_ascii=False).encode('utf-8')
+        index_start = f.tell()
+        f.write(index)
+        f.seek(0)
+        f.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, index_start, len(index)))
+        total = index_start + len(index)
+    os.replace(temp_file, output)
+    print(f"📦 Paquet d'assets écrit dans {output} : {len(entries)} images, {total / 1024 / 1024:.1f} Mo"
+          f" ({'zlib' if compress else 'pixels bruts'})")
+    return output
+
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))  # Chemins relatifs comme le jeu
+    build_bundle(compress="--compress" in sys.argv[1:])
@@ -0,0 +1,336 @@
+"""
+Cache d'images et préchargement en arrière-plan
+===============================================
+
+Toutes les images du jeu passent par AssetCache.get_image (ou get_frames pour les
+spritesheets) : chaque fichier est décodé une seule fois et chaque taille
+redimensionnée une seule fois. Pendant la carte de démarrage, un thread décode et
+redimensionne à l'avance les images du preset actif ; la conversion au format
+d'affichage (convert_alpha) reste sur le thread principal, qui intègre quelques
+images par frame.
+
+Les sprites des ennemis, les drops et les icônes viennent des atlas de
+texture_atlas.py (vues subsurface d'une image par couche) ; leurs versions
+redimensionnées sont copiées dans des pages d'atlas partagées par couche.
+
+Les images décodées et redimensionnées sont aussi écrites dans un cache disque
+versionné (pixels RGBA bruts, un fichier par (chemin, date de modification, taille,
+lissage)). Aux lancements suivants elles sont relues par mmap et
+pygame.image.frombuffer, sans décodage PNG ni redimensionnement.
+
+Les images d'origine sont lues dans le paquet d'assets (asset_bundle.py) s'il est
+construit et à jour, sinon dans les fichiers PNG ; les chemins sont résolus sans
+tenir compte de la casse.
+"""
+
+import hashlib
+import mmap
+import os
+import queue
+import struct
+import threading
+
+import pygame
+
+from asset_bundle import AssetBundle, asset_name, resolve_asset_path
+from texture_atlas import AtlasPage, load_atlas_index
+
+
+class AssetCache:
+    """Images converties partagées par tout le jeu, par (chemin, taille, lissage, frames)"""
+
+    images = {}  # {(chemin, (largeur, hauteur) ou None, lissage, nb frames ou None): Surface convertie}
+    _decoded = queue.Queue()  # (clé, Surface non convertie ou None) produits par le thread
+    _worker = None
+    total = 0  # Images demandées au préchargement
+    done = 0  # Images préchargées intégrées au cache (ou en échec)
+
+    # Cache disque : fichiers "<sha1>.rgba" = en-tête (magique, largeur, hauteur) + pixels RGBA
+    DISK_CACHE_VERSION = 1  # À incrémenter si le format ou les transformations changent
+    DISK_MAGIC = b"LMSR"
+    DISK_HEADER = struct.Struct("<4sII")
+    disk_dir = None  # Répertoire versionné (None = cache disque désactivé)
+    disk_hits = 0  # Images relues depuis le disque
+    disk_misses = 0  # Images décodées (et redimensionnées) puis écrites sur le disque
+    file_decodes = 0  # Fichiers PNG ouverts et décodés
+    bundle = None  # Paquet d'assets projeté en mémoire (asset_bundle.py), None = fichiers séparés
+    bundle_loads = 0  # Images lues depuis le paquet
+    
+    # Atlas (texture_atlas.py) : sprites d'origine dans un atlas, sprites redimensionnés dans des pages
+    atlas_regions = {}  # {nom du sprite: (chemin de l'atlas, couche, (x, y, largeur, hauteur))}
+    atlas_pages = {}  # {couche: [AtlasPage]}
+
+    @classmethod
+    def configure(cls, config):
+        """Active le cache disque (Config.ASSET_DISK_CACHE) et les atlas (Config.TEXTURE_ATLAS)"""
+        cls.atlas_regions = load_atlas_index(config.TEXTURE_ATLAS_DIR) if config.TEXTURE_ATLAS else {}
+        cls.bundle = None
+        if config.ASSET_BUNDLE and os.path.exists(config.ASSET_BUNDLE_FILE):
+            try:
+                cls.bundle = AssetBundle(config.ASSET_BUNDLE_FILE)
+            except (OSError, ValueError, struct.error) as e:
+                print(f"⚠️ Paquet d'assets {config.ASSET_BUNDLE_FILE} illisible, fichiers séparés utilisés: {e}")
+        cls.disk_dir = None
+        if config.ASSET_DISK_CACHE:
+            disk_dir = os.path.join(config.ASSET_CACHE_DIR, f"v{cls.DISK_CACHE_VERSION}")
+            try:
+                os.makedirs(disk_dir, exist_ok=True)
+                cls.disk_dir = disk_dir
+            except OSError as e:
+                print(f"⚠️ Cache disque des sprites indisponible: {e}")
+
+    @classmethod
+    def get_image(cls, path, size=None, smooth=True):
+        """Retourne l'image convertie (redimensionnée si size est donné), chargée à la demande
+
+        Lève pygame.error / FileNotFoundError comme pygame.image.load si le fichier manque.
+        """
+        key = cls._key(path, size, smooth)
+        if key not in cls.images:
+            region = cls.atlas_regions.get(asset_name(path))
+            if size is None and region is not None:
+                # Sprite d'origine : vue sur l'atlas de sa couche, sans ouvrir son fichier
+                atlas_path, _, rect = region
+                cls.images[key] = cls.get_image(atlas_path).subsurface(rect)
+                return cls.images[key]
+            
+            image = cls._read_disk(key)
+            if image is None:
+                source = cls._decode(path) if size is None else cls.get_image(path)
+                image = cls._transform(source, key)
+                cls._write_disk(key, image)
+            cls.images[key] = cls._store(key, image.convert_alpha())
+        return cls.images[key]
+
+    @classmethod
+    def get_frames(cls, path, num_frames, frame_size, smooth=True):
+        """Frames d'une spritesheet horizontale, chacune redimensionnée en frame_size x frame_size
+
+        Les frames sont des vues (subsurface) d'une seule bande mise en cache.
+        """
+        key = cls._key(path, (frame_size * num_frames, frame_size), smooth, num_frames)
+        if key not in cls.images:
+            image = cls._read_disk(key)
+            if image is None:
+                image = cls._transform(cls.get_image(path), key)
+                cls._write_disk(key, image)
+            cls.images[key] = image.convert_alpha()
+        strip = cls.images[key]
+        return [strip.subsurface((i * frame_size, 0, frame_size, frame_size)) for i in range(num_frames)]
+
+    @staticmethod
+    def _key(path, size, smooth, num_frames=None):
+        return (path, tuple(size) if size else None, bool(smooth) if size else False, num_frames)
+
+    @classmethod
+    def _decode(cls, path):
+        """Décode une image du paquet d'assets ou un PNG (24 ou 32 bits, exigé par smoothscale)"""
+        name = asset_name(path)
+        path = resolve_asset_path(path)
+        if cls.bundle is not None and name in cls.bundle and cls.bundle.is_current(name, path):
+            cls.bundle_loads += 1
+            return cls.bundle.load(name)
+        
+        source = pygame.image.load(path)
+        cls.file_decodes += 1
+        if source.get_bitsize() < 24:
+            rgba = pygame.Surface(source.get_size(), pygame.SRCALPHA, 32)
+            colorkey = source.get_colorkey()
+            if colorkey:
+                # Pixels transparents de la même couleur qu'avec convert_alpha (identique une fois relu du disque)
+                rgba.fill((*colorkey[:3], 0))
+            rgba.blit(source, (0, 0))
+            source = rgba
+        return source
+
+    @classmethod
+    def _store(cls, key, image):
+        """Place un sprite redimensionné d'un atlas dans une page de sa couche (vue subsurface)"""
+        region = cls.atlas_regions.get(asset_name(key[0]))
+        if region is None or key[1] is None:
+            return image
+        
+        pages = cls.atlas_pages.setdefault(region[1], [])
+        view = pages[-1].insert(image) if pages else None
+        if view is None:
+            pages.append(AtlasPage())
+            view = pages[-1].insert(image)
+        return view if view is not None else image  # Trop grand pour une page : surface séparée
+    
+    @classmethod
+    def _source(cls, path, sources):
+        """Image source non convertie d'un chemin pour le thread (atlas décodé une seule fois)"""
+        region = cls.atlas_regions.get(asset_name(path))
+        file_path = region[0] if region is not None else path
+        if file_path not in sources:
+            sources[file_path] = cls._decode(file_path)
+        if region is not None:
+            return sources[file_path].subsurface(region[2])
+        return sources[file_path]
+    
+    @staticmethod
+    def _transform(source, key):
+        """Applique à l'image source le découpage en frames et le redimensionnement d'une clé"""
+        path, size, smooth, num_frames = key
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        if size is None:
+            return source
+        if num_frames is None:
+            return scale(source, size)
+
+        # Bande de frames : chaque frame est redimensionnée séparément (pas de débordement entre frames)
+        frame_size = size[1]
+        frame_width = source.get_width() // num_frames
+        strip = pygame.Surface(size, pygame.SRCALPHA, 32)
+        for i in range(num_frames):
+            frame = source.subsurface((i * frame_width, 0, frame_width, source.get_height()))
+            strip.blit(scale(frame, (frame_size, frame_size)), (i * frame_size, 0))
+        return strip
+
+    @classmethod
+    def _disk_file(cls, key):
+        """Fichier du cache disque d'une clé (None si désactivé ou si la source est absente)"""
+        if cls.disk_dir is None:
+            return None
+        region = cls.atlas_regions.get(asset_name(key[0]))
+        try:
+            # Un sprite d'atlas est invalidé quand son atlas est reconstruit
+            mtime = os.stat(resolve_asset_path(region[0] if region is not None else key[0])).st_mtime_ns
+        except OSError:
+            return None
+        digest = hashlib.sha1(repr((key, mtime)).encode("utf-8")).hexdigest()
+        return os.path.join(cls.disk_dir, f"{digest}.rgba")
+
+    @classmethod
+    def _read_disk(cls, key):
+        """Relit une image du cache disque par mmap (None si absente ou invalide)"""
+        cache_file = cls._disk_file(key)
+        if cache_file is None or not os.path.exists(cache_file):
+            return None
+        buffer = None
+        try:
+            with open(cache_file, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, width, height = cls.DISK_HEADER.unpack_from(buffer)
+            if magic != cls.DISK_MAGIC or len(buffer) != cls.DISK_HEADER.size + width * height * 4:
+                buffer.close()
+                return None
+            # La surface référence directement la projection mémoire (libérée avec elle)
+            image = pygame.image.frombuffer(memoryview(buffer)[cls.DISK_HEADER.size:], (width, height), "RGBA")
+        except (OSError, ValueError, struct.error, pygame.error):
+            if buffer is not None:
+                buffer.close()  # Fichier tronqué ou illisible : ne pas garder la projection ouverte
+            return None
+        cls.disk_hits += 1
+        return image
+
+    @classmethod
+    def _write_disk(cls, key, image):
+        """Écrit les pixels RGBA bruts d'une image dans le cache disque (écriture atomique)"""
+        cache_file = cls._disk_file(key)
+        if cache_file is None:
+            return
+        cls.disk_misses += 1
+        temp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(cls.DISK_HEADER.pack(cls.DISK_MAGIC, *image.get_size()))
+                f.write(pygame.image.tobytes(image, "RGBA"))
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            print(f"⚠️ Écriture du cache disque impossible ({key[0]}): {e}")
+
+    @classmethod
+    def disk_stats(cls):
+        """Statistiques du cache disque (pour le rapport de démarrage)"""
+        return {"disk_cache_hits": cls.disk_hits, "disk_cache_misses": cls.disk_misses,
+                "png_decodes": cls.file_decodes, "bundle_loads": cls.bundle_loads}
+
+    @classmethod
+    def start_warm_up(cls, requests):
+        """Décode en arrière-plan une liste de (chemin, taille ou None, lissage[, nb frames]) absents du cache"""
+        if cls._worker is not None and cls._worker.is_alive():
+            return
+        pending = []
+        for request in requests:
+            key = cls._key(*request)
+            region = cls.atlas_regions.get(asset_name(key[0]))
+            if key[1] is None and region is not None:
+                key = cls._key(region[0], None, False)  # Sprite d'origine : précharger son atlas
+            if key not in cls.images and key not in pending:
+                pending.append(key)
+        cls.total = len(pending)
+        cls.done = 0
+        cls._worker = threading.Thread(target=cls._decode_all, args=(pending,), daemon=True)
+        cls._worker.start()
+
+    @classmethod
+    def _decode_all(cls, keys):
+        """Thread de préchargement : cache disque, sinon décodage et redimensionnement, sans conversion"""
+        sources = {}
+        for key in keys:
+            path = key[0]
+            image = None  # En cas d'échec, le chargement à la demande signalera l'erreur
+            try:
+                image = cls._read_disk(key)
+                if image is None:
+                    image = cls._transform(cls._source(path, sources), key)
+                    cls._write_disk(key, image)
+            except (pygame.error, FileNotFoundError, ValueError):
+                pass
+            cls._decoded.put((key, image))
+
+    @classmethod
+    def integrate_decoded(cls, max_images=8):
+        """Convertit au format d'affichage les images décodées (thread principal, chaque frame)"""
+        for _ in range(max_images):
+            try:
+                key, image = cls._decoded.get_nowait()
+            except queue.Empty:
+                return
+            if image is not None and key not in cls.images:
+                cls.images[key] = cls._store(key, image.convert_alpha())
+            cls.done += 1
+
+    @classmethod
+    def progress(cls):
+        """Avancement du préchargement (0.0 à 1.0 ; 1.0 sans préchargement en cours)"""
+        if cls.total == 0:
+            return 1.0
+        return cls.done / cls.total
+
+
+def get_preset_assets(config):
+    """Images utilisées en jeu, aux tailles du preset actif : [(chemin, taille ou None, lissage[, nb frames])]
+
+    Les tailles viennent des attributs de classe et de la config lus par les chargeurs
+    des entités, pour que le préchauffage produise exactement les mêmes entrées du cache.
+    """
+    # Import local : entities et start_map importent ce module
+    from entities import Player, Enemy, Heart, Coin
+    from start_map import PlayerSelector
+
+    smooth = config.SPRITE_SMOOTHING
+    enemy_size = config.ENEMY_SIZE
+    requests = [
+        ("assets/enemy/boss1.png", (enemy_size * 4, enemy_size * 4), smooth),
+        ("assets/enemy/mort.png", (enemy_size * 2, enemy_size * 2), smooth),  # Effet de mort
+        ("assets/enemy/mort.png", (enemy_size, enemy_size), smooth),  # Crânes du boss
+        ("assets/drops/heart.png", (Heart.SIZE, Heart.SIZE), False),
+        ("assets/drops/coin.png", (Coin.SIZE * Coin.FRAME_COUNT, Coin.SIZE), False, Coin.FRAME_COUNT),
+    ]
+    # Spritesheets des joueurs à la taille du preset et à celle du sélecteur
+    for player_size in (config.PLAYER_SIZE, PlayerSelector.PLAYER_SIZE):
+        frame_size = player_size * Player.SPRITE_SCALE
+        for path, num_frames, _ in Player.SPRITE_TYPES.values():
+            requests.append((path, (frame_size * num_frames, frame_size), smooth, num_frames))
+    for sprite_id in range(1, Enemy.SPRITE_COUNT + 1):
+        # Image d'origine (Enemy.sprites), ennemis normaux et spéciaux (taille x2)
+        requests.append((f"assets/enemy/{sprite_id}.png", None, False))
+        requests.append((f"assets/enemy/{sprite_id}.png", (enemy_size, enemy_size), smooth))
+        requests.append((f"assets/enemy/{sprite_id}.png", (enemy_size * 2, enemy_size * 2), smooth))
+    for filename in ("canon", "orb", "lightning", "beam"):
+        requests.append((f"assets/weapons/{filename}.png", None, False))
+    for filename in ("vitesse", "régénération", "bouclier", "aimant"):
+        requests.append((f"assets/competences/{filename}.png", None, False))
+    return requests
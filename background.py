@@ -5,39 +5,51 @@ Système de génération procédurale d'arrière-plan
 import pygame
 import random
 import math
+import numpy as np
+from startup_trace import StartupTrace
+from asset_cache import AssetCache
 
 class Background:
     """Classe pour générer et afficher un arrière-plan procédural basé sur un tileset"""
     
-    def __init__(self, config):
+    def __init__(self, config, map_width=100, map_height=100):
         self.config = config
         self.tile_size = 32  # Taille pour les props de décoration
         self.grass_tile_size = 64  # Taille des tiles d'herbe
-        self.map_width = 100
-        self.map_height = 100
-        
-        # Charger les tiles d'herbe (nouveau système)
-        try:
-            self.grass_tileset = pygame.image.load("assets/grass7.png").convert_alpha()
-            self.extract_grass_tiles()
-        except pygame.error:
-            print("⚠️  Impossible de charger assets/grass7.png")
-            self.grass_tileset = None
-            self.grass_tiles = None
-        
-        # Charger le tileset pour les props de décoration (ancien système)
-        try:
-            self.tileset = pygame.image.load("assets/Tileset.png").convert_alpha()
-            self.extract_decoration_tiles()
-        except pygame.error:
-            print("⚠️  Impossible de charger assets/Tileset.png")
-            self.tileset = None
-            self.decoration_tiles = None
+        self.map_width = map_width  # La carte de démarrage n'utilise que 30x30 tiles
+        self.map_height = map_height
+        
+        with StartupTrace.phase("background_assets"):
+            # Charger les tiles d'herbe (nouveau système)
+            try:
+                self.grass_tileset = AssetCache.get_image("assets/grass7.png")
+                self.extract_grass_tiles()
+            except pygame.error:
+                print("⚠️  Impossible de charger assets/grass7.png")
+                self.grass_tileset = None
+                self.grass_tiles = None
+            
+            # Charger le tileset pour les props de décoration (ancien système)
+            try:
+                self.tileset = AssetCache.get_image("assets/Tileset.png")
+                self.extract_decoration_tiles()
+            except pygame.error:
+                print("⚠️  Impossible de charger assets/Tileset.png")
+                self.tileset = None
+                self.decoration_tiles = None
             
+        # Tiles redimensionnés par échelle de rendu interne {échelle: (herbe, décorations, taille déco)}
+        self.scaled_tiles_cache = {}
+        
+        # Terrain pré-rendu par chunks opaques (même grille que les traces au sol, traces comprises)
+        self.chunk_size = config.TERRAIN_CHUNK_SIZE
+        self.terrain_chunks = {}  # {(chunk_x, chunk_y): (échelle, révision des traces, Surface)}
+        
         # Générer la carte
         self.base_map = []  # Terrain de fond (herbe)
         self.decoration_map = []  # Éléments de décoration (props)
-        self.generate_map()
+        with StartupTrace.phase("background_generation"):
+            self.generate_map()
         
         # Calculer les limites du monde basées sur la taille des tiles d'herbe
         self.world_width = self.map_width * self.scaled_grass_tile_size if hasattr(self, 'scaled_grass_tile_size') else self.map_width * self.grass_tile_size
@@ -47,45 +59,35 @@ class Background:
         """Extrait les 7 tiles d'herbe du fichier grass7.png"""
         if not self.grass_tileset:
             return
-            
-        self.grass_tiles = []
-        
-        # Le fichier contient 7 tiles de 64x64 en ligne horizontale
-        for i in range(7):
-            tile_rect = pygame.Rect(i * self.grass_tile_size, 0, 
-                                  self.grass_tile_size, self.grass_tile_size)
-            tile = self.grass_tileset.subsurface(tile_rect).copy()
-            
-            # Redimensionner le tile pour s'adapter à l'échelle du jeu
-            scale_factor = max(1, self.config.WINDOW_WIDTH // 960)  # Échelle adaptative
-            scaled_size = self.grass_tile_size * scale_factor
-            tile = pygame.transform.scale(tile, (scaled_size, scaled_size))
-            self.grass_tiles.append(tile)
         
+        # Le fichier contient 7 tiles de 64x64 en ligne horizontale, redimensionnées une fois (cache disque)
+        scale_factor = max(1, self.config.WINDOW_WIDTH // 960)  # Échelle adaptative
         self.scaled_grass_tile_size = self.grass_tile_size * scale_factor
+        self.grass_tiles = AssetCache.get_frames("assets/grass7.png", 7, self.scaled_grass_tile_size, smooth=False)
+        # L'herbe est entièrement opaque : des tiles sans canal alpha se blittent par simple copie
+        self.grass_tiles = [tile.convert() for tile in self.grass_tiles]
     
     def extract_decoration_tiles(self):
         """Extrait les tiles de décoration du tileset original (pour les props)"""
         if not self.tileset:
             return
-            
-        self.decoration_tiles = []
+        
+        # Facteur entier + redimensionnement sans lissage : identique à redimensionner chaque tile
+        scale_factor = max(1, self.config.WINDOW_WIDTH // 960)  # Échelle adaptative
+        scaled_size = self.tile_size * scale_factor
         tileset_width = self.tileset.get_width() // self.tile_size
         tileset_height = self.tileset.get_height() // self.tile_size
+        scaled_tileset = AssetCache.get_image("assets/Tileset.png", (tileset_width * scaled_size, tileset_height * scaled_size),
+                                              smooth=False)
         
-        # Extraire chaque tile de décoration
+        # Extraire chaque tile de décoration (vues sur le tileset redimensionné)
+        self.decoration_tiles = []
         for y in range(tileset_height):
             for x in range(tileset_width):
-                tile_rect = pygame.Rect(x * self.tile_size, y * self.tile_size, 
-                                      self.tile_size, self.tile_size)
-                tile = self.tileset.subsurface(tile_rect).copy()
-                # Redimensionner le tile pour s'adapter à l'échelle du jeu
-                scale_factor = max(1, self.config.WINDOW_WIDTH // 960)  # Échelle adaptative
-                scaled_size = self.tile_size * scale_factor
-                tile = pygame.transform.scale(tile, (scaled_size, scaled_size))
-                self.decoration_tiles.append(tile)
+                tile_rect = pygame.Rect(x * scaled_size, y * scaled_size, scaled_size, scaled_size)
+                self.decoration_tiles.append(scaled_tileset.subsurface(tile_rect))
         
-        self.scaled_decoration_tile_size = self.tile_size * scale_factor
+        self.scaled_decoration_tile_size = scaled_size
     
     def generate_map(self, forced_seed=None):
         """Génère la carte procéduralement"""
@@ -96,6 +98,7 @@ class Background:
             seed = random.randint(0, 1000000)
         random.seed(seed)
         print(f"Génération du terrain avec le seed: {seed}")
+        self.terrain_chunks.clear()
         
         # Initialiser les cartes
         self.base_map = [[0 for _ in range(self.map_width)] for _ in range(self.map_height)]
@@ -196,40 +199,246 @@ class Background:
             player.y = bounds['max_y'] - player.size
             player.vel_y = 0
     
-    def draw(self, screen, camera_x=0, camera_y=0):
-        """Dessine l'arrière-plan avec les tiles d'herbe et les props de décoration"""
+    def get_scaled_tiles(self, scale):
+        """Retourne (et met en cache) les tiles redimensionnés pour une échelle de rendu interne"""
+        if scale not in self.scaled_tiles_cache:
+            # Arrondi supérieur : les tiles se chevauchent d'au plus 1 pixel, jamais de jointure visible
+            grass_size = math.ceil(self.scaled_grass_tile_size * scale)
+            grass_tiles = [pygame.transform.scale(tile, (grass_size, grass_size)).convert() for tile in self.grass_tiles]
+            decoration_tiles = None
+            decoration_size = 0
+            if self.decoration_tiles:
+                decoration_size = math.ceil(self.scaled_decoration_tile_size * scale)
+                decoration_tiles = [pygame.transform.scale(tile, (decoration_size, decoration_size))
+                                    for tile in self.decoration_tiles]
+            self.scaled_tiles_cache[scale] = (grass_tiles, decoration_tiles, decoration_size)
+        return self.scaled_tiles_cache[scale]
+    
+    def draw(self, screen, camera_x=0, camera_y=0, scale=1.0, decals=None):
+        """Dessine l'arrière-plan : un blit par chunk de terrain visible
+        
+        Chaque chunk (herbe, props et traces au sol de decals) est rendu une fois dans une
+        surface opaque, puis réutilisé tant que l'échelle et la révision de ses traces ne
+        changent pas. Avec scale < 1.0, screen est la surface du monde à résolution
+        interne : les positions monde sont multipliées par scale.
+        """
         if not self.grass_tiles:
             # Fallback: fond coloré simple VISIBLE
             screen.fill((0, 150, 0))  # Vert visible
             return
         
-        # Calculer les tiles visibles basés sur la taille des tiles d'herbe
-        start_x = max(0, int(camera_x // self.scaled_grass_tile_size))
-        end_x = min(self.map_width, int((camera_x + self.config.WINDOW_WIDTH) // self.scaled_grass_tile_size) + 1)
-        start_y = max(0, int(camera_y // self.scaled_grass_tile_size))
-        end_y = min(self.map_height, int((camera_y + self.config.WINDOW_HEIGHT) // self.scaled_grass_tile_size) + 1)
+        # Chunks visibles, limités à la carte
+        chunk_size = self.chunk_size
+        world_width = self.map_width * self.scaled_grass_tile_size
+        world_height = self.map_height * self.scaled_grass_tile_size
+        start_x = max(0, int(camera_x // chunk_size))
+        end_x = min(int((world_width - 1) // chunk_size), int((camera_x + self.config.WINDOW_WIDTH) // chunk_size))
+        start_y = max(0, int(camera_y // chunk_size))
+        end_y = min(int((world_height - 1) // chunk_size), int((camera_y + self.config.WINDOW_HEIGHT) // chunk_size))
+        
+        visible = []
+        for chunk_y in range(start_y, end_y + 1):
+            for chunk_x in range(start_x, end_x + 1):
+                key = (chunk_x, chunk_y)
+                revision = decals.chunk_revisions.get(key, 0) if decals else 0
+                cached = self.terrain_chunks.get(key)
+                if cached is None or cached[0] != scale or cached[1] != revision:
+                    cached = (scale, revision, self.render_chunk(key, scale, decals))
+                    self.terrain_chunks[key] = cached
+                visible.append((cached[2], (int((chunk_x * chunk_size - camera_x) * scale),
+                                            int((chunk_y * chunk_size - camera_y) * scale))))
+        screen.blits(visible, doreturn=False)
+        
+        # Ne garder en mémoire que les chunks visibles quand le cache a doublé
+        if len(self.terrain_chunks) > 2 * len(visible):
+            visible_keys = {(chunk_x, chunk_y) for chunk_y in range(start_y, end_y + 1)
+                            for chunk_x in range(start_x, end_x + 1)}
+            self.terrain_chunks = {key: cached for key, cached in self.terrain_chunks.items() if key in visible_keys}
+    
+    def render_chunk(self, key, scale=1.0, decals=None):
+        """Rend un chunk de terrain (herbe, props et traces au sol) dans une surface opaque"""
+        if scale != 1.0:
+            grass_tiles, decoration_tiles, decoration_size = self.get_scaled_tiles(scale)
+        else:
+            grass_tiles, decoration_tiles, decoration_size = self.grass_tiles, self.decoration_tiles, getattr(self, 'scaled_decoration_tile_size', 0)
+        
+        chunk_size = self.chunk_size
+        tile_size = self.scaled_grass_tile_size
+        chunk_left = key[0] * chunk_size
+        chunk_top = key[1] * chunk_size
+        surface_size = math.ceil(chunk_size * scale)
+        chunk = pygame.Surface((surface_size, surface_size)).convert()
         
-        # Dessiner les tiles visibles
+        # Tiles qui chevauchent le chunk (les bords sont découpés par la surface)
+        start_x = chunk_left // tile_size
+        end_x = min(self.map_width, (chunk_left + chunk_size - 1) // tile_size + 1)
+        start_y = chunk_top // tile_size
+        end_y = min(self.map_height, (chunk_top + chunk_size - 1) // tile_size + 1)
         for y in range(start_y, end_y):
             for x in range(start_x, end_x):
-                # Position à l'écran pour les tiles d'herbe
-                screen_x = x * self.scaled_grass_tile_size - camera_x
-                screen_y = y * self.scaled_grass_tile_size - camera_y
+                # Position dans le chunk pour les tiles d'herbe
+                tile_x = int((x * tile_size - chunk_left) * scale)
+                tile_y = int((y * tile_size - chunk_top) * scale)
                 
                 # Dessiner le terrain de base (herbe)
                 grass_tile_id = self.base_map[y][x]
-                if grass_tile_id < len(self.grass_tiles):
-                    screen.blit(self.grass_tiles[grass_tile_id], (screen_x, screen_y))
+                if grass_tile_id < len(grass_tiles):
+                    chunk.blit(grass_tiles[grass_tile_id], (tile_x, tile_y))
                 
                 # Dessiner la décoration (props) si elle existe et si on a les tiles de décoration
-                if self.decoration_tiles:
+                if decoration_tiles:
                     decoration_tile_id = self.decoration_map[y][x]
-                    if decoration_tile_id is not None and decoration_tile_id < len(self.decoration_tiles):
+                    if decoration_tile_id is not None and decoration_tile_id < len(decoration_tiles):
                         # Centrer le prop sur la tile d'herbe (car les tailles peuvent être différentes)
-                        prop_x = screen_x + (self.scaled_grass_tile_size - self.scaled_decoration_tile_size) // 2
-                        prop_y = screen_y + (self.scaled_grass_tile_size - self.scaled_decoration_tile_size) // 2
-                        screen.blit(self.decoration_tiles[decoration_tile_id], (prop_x, prop_y))
+                        grass_size = grass_tiles[grass_tile_id].get_width() if grass_tile_id < len(grass_tiles) else decoration_size
+                        prop_x = tile_x + (grass_size - decoration_size) // 2
+                        prop_y = tile_y + (grass_size - decoration_size) // 2
+                        chunk.blit(decoration_tiles[decoration_tile_id], (prop_x, prop_y))
+        
+        # Traces au sol cuites dans le chunk (redimensionnées une fois par révision)
+        decal_chunk = decals.chunks.get(key) if decals else None
+        if decal_chunk is not None:
+            if scale != 1.0:
+                decal_chunk = pygame.transform.scale(decal_chunk, (surface_size, surface_size))
+            chunk.blit(decal_chunk, (0, 0))
+        return chunk
     
     def regenerate(self, forced_seed=None):
         """Régénère le terrain (pour le debug ou restart)"""
         self.generate_map(forced_seed)
+
+
+class GroundDecalLayer:
+    """Couche persistante de traces au sol (cendres retombées, brûlures d'explosion)
+
+    Les effets terminés sont « cuits » dans des chunks SRCALPHA en coordonnées monde, sur
+    la grille des chunks de terrain : Background les composite dans ses chunks opaques
+    (voir Background.render_chunk), que chaque modification invalide via chunk_revisions.
+    Une trace ne coûte donc plus rien par frame une fois posée. Les chunks s'estompent par
+    paliers (GROUND_DECAL_DECAY_*), décalés d'un chunk à l'autre pour répartir les rendus
+    de terrain, et ceux devenus invisibles ou les plus anciens au-delà du plafond sont libérés.
+    """
+    
+    def __init__(self, config):
+        self.config = config
+        self.chunk_size = config.TERRAIN_CHUNK_SIZE
+        self.chunks = {}  # {(chunk_x, chunk_y): Surface SRCALPHA}
+        self.last_stamp = {}  # {(chunk_x, chunk_y): frame de la dernière trace posée}
+        self.chunk_revisions = {}  # {(chunk_x, chunk_y): révision du contenu (chunk de terrain à refaire si elle change)}
+        self.revision = 0
+        self.pending_scorches = []  # [(frame de pose, x, y, rayon)] : brûlures des explosions en cours
+        self.frame = 0
+        # Frames nécessaires pour qu'une trace opaque disparaisse complètement
+        decay_step = config.GROUND_DECAL_DECAY_STEP
+        self.fade_frames = (255 // decay_step + 1) * config.GROUND_DECAL_DECAY_INTERVAL if decay_step > 0 else None
+    
+    def reset(self):
+        """Efface toutes les traces (redémarrage de partie)"""
+        self.chunks.clear()
+        self.last_stamp.clear()
+        self.chunk_revisions.clear()
+        self.pending_scorches.clear()
+        self.frame = 0
+    
+    def _get_chunk(self, key):
+        """Retourne le chunk demandé, créé à la volée (en libérant le plus ancien si besoin)"""
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            if len(self.chunks) >= self.config.GROUND_DECAL_MAX_CHUNKS:
+                oldest = min(self.last_stamp, key=self.last_stamp.get)
+                self._drop_chunk(oldest)
+            chunk = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA)
+            self.chunks[key] = chunk
+        self.last_stamp[key] = self.frame
+        self._touch(key)
+        return chunk
+    
+    def _touch(self, key):
+        """Marque le chunk comme modifié (révision unique, jamais réutilisée)"""
+        self.revision += 1
+        self.chunk_revisions[key] = self.revision
+    
+    def _drop_chunk(self, key):
+        self.chunks.pop(key, None)
+        self.last_stamp.pop(key, None)
+        self.chunk_revisions.pop(key, None)
+    
+    def stamp_ash(self, xs, ys, sizes, alphas, color):
+        """Pose les cendres retombées (tableaux de positions monde, tailles et opacités)
+
+        Chaque cendre couvre un carré de size px de la couleur color, réparti entre les
+        chunks qu'il chevauche ; les pixels sont écrits en un bloc par chunk (surfarray)
+        et un pixel déjà plus opaque garde son opacité.
+        """
+        chunk_size = self.chunk_size
+        offsets = np.arange(int(sizes.max()))
+        covered = ((offsets[None, :, None] < sizes[:, None, None]) &
+                   (offsets[None, None, :] < sizes[:, None, None]))
+        particle, dx, dy = np.nonzero(covered)
+        px = xs.astype(np.int32)[particle] + dx
+        py = ys.astype(np.int32)[particle] + dy
+        pixel_alphas = alphas[particle]
+        
+        # Regrouper les pixels par chunk touché (tri sur un identifiant entier de chunk)
+        chunk_xs = px // chunk_size
+        chunk_ys = py // chunk_size
+        order = np.argsort(chunk_xs * 65536 + chunk_ys, kind="stable")
+        px, py, pixel_alphas = px[order], py[order], pixel_alphas[order]
+        chunk_xs, chunk_ys = chunk_xs[order], chunk_ys[order]
+        starts = np.flatnonzero((np.diff(chunk_xs) != 0) | (np.diff(chunk_ys) != 0)) + 1
+        bounds = [0] + starts.tolist() + [px.size]
+        
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            chunk_x = int(chunk_xs[start])
+            chunk_y = int(chunk_ys[start])
+            chunk = self._get_chunk((chunk_x, chunk_y))
+            local_x = px[start:end] - chunk_x * chunk_size
+            local_y = py[start:end] - chunk_y * chunk_size
+            
+            rgb = pygame.surfarray.pixels3d(chunk)
+            rgb[local_x, local_y] = color
+            del rgb
+            alpha = pygame.surfarray.pixels_alpha(chunk)
+            np.maximum.at(alpha, (local_x, local_y), pixel_alphas[start:end])
+            del alpha  # Déverrouiller le chunk
+    
+    def schedule_scorch(self, x, y, radius, delay):
+        """Programme une brûlure, posée dans delay frames (à la fin de l'effet d'explosion)"""
+        self.pending_scorches.append((self.frame + delay, x, y, radius))
+    
+    def stamp_scorch(self, x, y, radius):
+        """Pose une brûlure circulaire (reste d'explosion) centrée en (x, y)"""
+        chunk_size = self.chunk_size
+        color = self.config.GROUND_DECAL_SCORCH_COLOR
+        # Une brûlure peut chevaucher jusqu'à 4 chunks
+        for chunk_x in range(int((x - radius) // chunk_size), int((x + radius) // chunk_size) + 1):
+            for chunk_y in range(int((y - radius) // chunk_size), int((y + radius) // chunk_size) + 1):
+                chunk = self._get_chunk((chunk_x, chunk_y))
+                center = (int(x) - chunk_x * chunk_size, int(y) - chunk_y * chunk_size)
+                pygame.draw.circle(chunk, color, center, radius)
+    
+    def update(self):
+        """Pose les brûlures arrivées à échéance, estompe les traces par paliers et libère les chunks devenus invisibles"""
+        self.frame += 1
+        if self.pending_scorches:
+            due = [scorch for scorch in self.pending_scorches if scorch[0] <= self.frame]
+            if due:
+                self.pending_scorches = [scorch for scorch in self.pending_scorches if scorch[0] > self.frame]
+                for _, x, y, radius in due:
+                    self.stamp_scorch(x, y, radius)
+        
+        if self.fade_frames is None:
+            return
+        
+        # Chaque chunk a son palier à une frame différente de ses voisins (phase selon sa
+        # position) : les chunks de terrain à refaire sont répartis sur tout l'intervalle
+        interval = self.config.GROUND_DECAL_DECAY_INTERVAL
+        decay = (0, 0, 0, self.config.GROUND_DECAL_DECAY_STEP)
+        for key in list(self.chunks):
+            if (self.frame + key[0] * 7 + key[1] * 13) % interval != 0:
+                continue
+            if self.frame - self.last_stamp[key] >= self.fade_frames:
+                self._drop_chunk(key)
+                continue
+            self.chunks[key].fill(decay, special_flags=pygame.BLEND_RGBA_SUB)
+            self._touch(key)
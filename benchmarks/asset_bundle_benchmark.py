@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark du paquet d'assets
+============================
+Compare le chargement des images du paquet (asset_bundle.py) à celui des fichiers
+PNG séparés, jusqu'à la conversion au format d'affichage (convert_alpha), sans fenêtre
+(driver SDL "dummy"). Trois sources : fichiers PNG, paquet brut et paquet zlib.
+
+Chaque mesure est faite dans un nouveau processus. À froid, les fichiers sont
+d'abord retirés du cache de pages du noyau (posix_fadvise, Linux) ; à chaud, ils
+viennent d'être lus.
+
+Usage : python benchmarks/asset_bundle_benchmark.py [mesures]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def load_once(source, bundle_file):
+    """Charge et convertit toutes les images d'une source ; affiche la durée (ms)"""
+    os.chdir(ROOT)  # Les assets sont chargés par chemins relatifs
+    import pygame
+    from asset_bundle import AssetBundle, bundle_names, resolve_asset_path
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    names = bundle_names()
+
+    start = time.perf_counter()
+    if source == "files":
+        for name in names:
+            pygame.image.load(resolve_asset_path(f"assets/{name}")).convert_alpha()
+    else:
+        bundle = AssetBundle(bundle_file)
+        for name in names:
+            bundle.load(name).convert_alpha()
+    print(1000 * (time.perf_counter() - start))
+
+
+def evict_from_page_cache(paths):
+    """Retire des fichiers du cache de pages (lecture suivante depuis le disque, Linux)"""
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)  # Les pages encore à écrire (paquet juste construit) ne seraient pas retirées
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def measure(source, bundle_file):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", source, bundle_file],
+        capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def run(measures=5):
+    os.chdir(ROOT)
+    from asset_bundle import build_bundle, bundle_names, resolve_asset_path
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        raw_bundle = build_bundle(os.path.join(tmp_dir, "raw.lmsbundle"), compress=False)
+        zlib_bundle = build_bundle(os.path.join(tmp_dir, "zlib.lmsbundle"), compress=True)
+        png_files = [resolve_asset_path(f"assets/{name}") for name in bundle_names()]
+        sources = (("fichiers PNG", "files", "", png_files),
+                   ("paquet brut", "bundle", raw_bundle, [raw_bundle]),
+                   ("paquet zlib", "bundle", zlib_bundle, [zlib_bundle]))
+
+        if not hasattr(os, "posix_fadvise"):
+            print("⚠️ posix_fadvise indisponible : les mesures à froid lisent le cache de pages")
+        print(f"📊 Chargement de {len(png_files)} images jusqu'à convert_alpha, médiane de {measures} mesures")
+        for label, source, bundle_file, files in sources:
+            cold = []
+            warm = []
+            for _ in range(measures):
+                if hasattr(os, "posix_fadvise"):
+                    evict_from_page_cache(files)
+                cold.append(measure(source, bundle_file))
+                warm.append(measure(source, bundle_file))
+            cold.sort()
+            warm.sort()
+            print(f"   {label:<14} : à froid {cold[len(cold) // 2]:7.1f} ms, "
+                  f"à chaud {warm[len(warm) // 2]:7.1f} ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 3 and sys.argv[1] == "--child":
+        load_once(sys.argv[2], sys.argv[3])
+    else:
+        run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
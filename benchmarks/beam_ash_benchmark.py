@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark des cendres de BeamDeathEffect
+========================================
+Mesure la mémoire et le temps par frame (update + draw) avec 50 désintégrations
+simultanées, sans fenêtre (driver SDL "dummy").
+
+Usage : python benchmarks/beam_ash_benchmark.py [nombre_d_effets] [frames]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from config import Config
+from entities import AshPool, BeamDeathEffect
+
+
+class FakeEnemy:
+    """Ennemi minimal : position, taille et sprite opaque"""
+
+    def __init__(self, x, y, size):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.sprite_id = 1  # Même sprite pour tous : gabarit de cendres partagé
+        self.sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(self.sprite, (180, 60, 60, 255), (size // 2, size // 2), size // 2)
+
+
+def run(effect_count=50, frames=120):
+    pygame.init()
+    config = Config(forced_screen_size=2)
+    screen = pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
+    screen.fill((50, 50, 50))
+
+    start = time.perf_counter()
+    effects = []
+    for index in range(effect_count):
+        x = 100 + (index % 10) * (config.WINDOW_WIDTH - 200) // 10
+        y = 100 + (index // 10) * 120
+        effects.append(BeamDeathEffect(FakeEnemy(x, y, config.ENEMY_SIZE * 2), config))
+    spawn_time = time.perf_counter() - start
+
+    peak_particles = AshPool.count()
+    peak_memory = AshPool.memory_usage()
+
+    update_times = []
+    draw_times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        AshPool.update()
+        effects = [effect for effect in effects if effect.update()]
+        update_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        AshPool.draw(screen, 0, 0)
+        draw_times.append(time.perf_counter() - start)
+
+        if not effects:
+            break
+
+    frame_count = len(update_times)
+    print(f"📊 {effect_count} désintégrations simultanées, {frame_count} frames")
+    print(f"   Particules au pic : {peak_particles}")
+    print(f"   Création des {effect_count} effets : {1000 * spawn_time:.3f} ms")
+    print(f"   Mémoire des tableaux au pic : {peak_memory / 1024:.1f} Ko")
+    print(f"   Update moyen : {1000 * sum(update_times) / frame_count:.3f} ms")
+    print(f"   Draw moyen   : {1000 * sum(draw_times) / frame_count:.3f} ms")
+    print(f"   Draw max     : {1000 * max(draw_times):.3f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    frame_total = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    run(count, frame_total)
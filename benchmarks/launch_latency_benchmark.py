@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark du lancement d'une partie
+===================================
+Mesure le délai entre l'action "play" de la carte de démarrage et la première frame
+du jeu affichée, pour plusieurs parties successives dans la même boucle GameManager,
+sans fenêtre (driver SDL "dummy"). La première partie crée le jeu principal, les
+suivantes réutilisent l'instance déjà chargée. Le preset 2560x1440 est utilisé par défaut.
+
+Usage : python benchmarks/launch_latency_benchmark.py [preset 1|2|3] [parties]
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Les assets sont chargés par chemins relatifs
+
+import pygame
+
+
+def run(preset=3, sessions=5):
+    pygame.init()
+
+    from config import Config
+    from game_manager import GameManager, GameState
+
+    config = Config(forced_screen_size=preset)
+    manager = GameManager(config)  # Sans GameSettings : rien n'est sauvegardé
+
+    results = []
+    for _ in range(sessions):
+        # Même enchaînement qu'une frame de GameManager.run après l'action "play"
+        manager._handle_start_map_action("play")
+        manager._draw()
+        pygame.display.flip()
+        manager._report_launch_latency()
+        results.append(manager.last_launch_latency_ms)
+
+        # Quitter la partie comme le menu de sortie
+        manager.main_game.running = False
+        manager._update(0)
+        assert manager.current_state == GameState.START_MAP
+
+    print(f"📊 Lancement d'une partie à {config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}, {sessions} parties")
+    for index, latency_ms in enumerate(results):
+        label = "création" if index == 0 else "réutilisée"
+        print(f"   Partie {index + 1} ({label}) : {latency_ms:7.1f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    preset_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    sessions_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    run(preset_arg, sessions_arg)
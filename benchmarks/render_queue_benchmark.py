@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la file de rendu
+=============================
+Compare le dessin entité par entité (un screen.blit par sprite, appelé depuis une
+méthode draw) avec la file de rendu par couches (un Surface.blits par couche),
+pour 500, 2 000 et 10 000 sprites, sans fenêtre (driver SDL "dummy"). Chaque mesure
+garde la meilleure de REPEATS séries de frames, pour écarter le bruit de la machine.
+
+Usage : python benchmarks/render_queue_benchmark.py [frames]
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from render_queue import RenderQueue, HAS_FBLITS
+
+SPRITE_COUNTS = (500, 2000, 10000)
+REPEATS = 5
+LAYERS = ("enemies", "projectiles", "effects", "collectibles")
+
+
+class FakeSprite:
+    """Entité minimale qui se dessine elle-même ou se soumet à la file"""
+
+    def __init__(self, surface, layer, width, height):
+        self.surface = surface
+        self.layer = layer
+        self.x = random.uniform(0, width)
+        self.y = random.uniform(0, height)
+
+    def draw(self, screen, camera_x=0, camera_y=0):
+        screen.blit(self.surface, (self.x - camera_x, self.y - camera_y))
+
+    def submit(self, queue, camera_x=0, camera_y=0):
+        queue.blit(self.layer, self.surface, (self.x - camera_x, self.y - camera_y))
+
+
+def make_sprites(count, width, height):
+    surfaces = []
+    for color in ((200, 60, 60), (60, 200, 60), (60, 60, 200), (220, 200, 60)):
+        surface = pygame.Surface((32, 32), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, 255), (16, 16), 15)
+        surfaces.append(surface.convert_alpha())
+    return [FakeSprite(surfaces[i % len(surfaces)], LAYERS[i % len(LAYERS)], width, height)
+            for i in range(count)]
+
+
+def time_frames(frames, render_frame):
+    """Temps moyen d'une frame (ms), meilleure de REPEATS séries"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(frames):
+            render_frame()
+        elapsed = 1000 * (time.perf_counter() - start) / frames
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(frames=60):
+    pygame.init()
+    screen = pygame.display.set_mode((1920, 1080))
+    queue = RenderQueue()
+
+    print(f"📊 Rendu par entité vs file de rendu ({'fblits' if HAS_FBLITS else 'blits'}), {frames} frames")
+    for count in SPRITE_COUNTS:
+        sprites = make_sprites(count, 1920, 1080)
+        by_layer = {layer: [sprite for sprite in sprites if sprite.layer == layer] for layer in LAYERS}
+
+        def per_entity_frame():
+            for layer in LAYERS:
+                for sprite in by_layer[layer]:
+                    sprite.draw(screen, 0, 0)
+
+        def batched_frame():
+            for layer in LAYERS:
+                for sprite in by_layer[layer]:
+                    sprite.submit(queue, 0, 0)
+            queue.flush(screen)
+
+        per_entity_ms = time_frames(frames, per_entity_frame)
+        batched_ms = time_frames(frames, batched_frame)
+        print(f"   {count:>6} sprites : par entité {per_entity_ms:7.3f} ms, "
+              f"groupé {batched_ms:7.3f} ms ({per_entity_ms / batched_ms:.2f}x)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 60)
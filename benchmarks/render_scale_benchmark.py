@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark de l'échelle de rendu interne
+=======================================
+Mesure le temps moyen de Game.draw pour chaque échelle de Config.RENDER_SCALES,
+sans fenêtre (driver SDL "dummy"). Le preset 2560x1440 est utilisé par défaut.
+Deux scènes : légère (40 ennemis) et chargée (ennemis, particules, projectiles et
+pièces en nombre), toutes deux placées dans la zone visible. Pour chaque scène, la
+résolution dynamique est ensuite activée sur les temps mesurés, avec le budget normal
+puis avec un budget serré (80 % du temps natif) qui force une descente : l'échelle
+retenue doit être moins chère que le natif (une descente sans gain est annulée).
+
+Usage : python benchmarks/render_scale_benchmark.py [preset 1|2|3] [frames]
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Les assets sont chargés par chemins relatifs
+
+import pygame
+
+
+SCENES = (
+    ("légère", {"enemies": 40}),
+    ("chargée", {"enemies": 300, "particles": 600, "projectiles": 150, "coins": 80}),
+)
+
+
+def fill_scene(game, enemies=0, particles=0, projectiles=0, coins=0):
+    """Remplit la zone visible avec des entités de chaque couche"""
+    from entities import CanonProjectile, Coin, Particle
+
+    config = game.config
+    random.seed(1)
+
+    def visible_position():
+        return (game.camera_x + random.uniform(0, config.WINDOW_WIDTH),
+                game.camera_y + random.uniform(0, config.WINDOW_HEIGHT))
+
+    for _ in range(enemies):
+        game.spawn_enemy()
+        game.enemies[-1].x, game.enemies[-1].y = visible_position()
+    game.particles.extend(Particle(*visible_position(), config) for _ in range(particles))
+    for _ in range(projectiles):
+        angle = random.uniform(0, 6.28)
+        game.canon_projectiles.append(CanonProjectile(*visible_position(), math.cos(angle), math.sin(angle), config))
+    game.collectibles.extend(Coin(*visible_position(), config) for _ in range(coins))
+
+
+def time_scales(game, frames):
+    """Temps moyen de Game.draw (ms) pour chaque échelle de rendu"""
+    results = []
+    for scale in game.config.RENDER_SCALES:
+        game.config.RENDER_SCALE = scale
+        game.draw()  # Préchauffage (surface du monde, tiles et sprites redimensionnés)
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            game.draw()
+        results.append((scale, 1000 * (time.perf_counter() - start) / frames))
+    return results
+
+
+def run_controller(game, frames, budget_ms=None):
+    """Laisse la résolution dynamique choisir l'échelle ; retourne (échelle, ms/frame)
+
+    budget_ms remplace le budget de frame (1000 / FPS) pour forcer les descentes.
+    """
+    from performance import DynamicResolutionController
+
+    config = game.config
+    config.RENDER_SCALE = config.RENDER_SCALES[0]
+    # Fenêtre et stabilisation courtes pour converger en quelques centaines de frames
+    config.DYNAMIC_RESOLUTION_WINDOW = 20
+    config.DYNAMIC_RESOLUTION_COOLDOWN = 10
+    controller = DynamicResolutionController(config)
+    controller.enabled = True
+    if budget_ms is not None:
+        controller.frame_budget_ms = budget_ms
+
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.draw()
+        controller.record_frame(1000 * (time.perf_counter() - start))
+    return config.RENDER_SCALE, controller.get_average_frame_time()
+
+
+def run(preset=3, frames=120):
+    pygame.init()
+
+    from config import Config
+    from game import Game
+
+    config = Config(forced_screen_size=preset)
+    print(f"📊 Game.draw à {config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}, {frames} frames par échelle")
+    for label, content in SCENES:
+        game = Game(config)
+        fill_scene(game, **content)
+        results = time_scales(game, frames)
+
+        native_ms = results[0][1]
+        print(f"   Scène {label} ({len(game.enemies)} ennemis, {len(game.particles)} particules) :")
+        for scale, frame_ms in results:
+            print(f"      {int(scale * 100):>3}% : {frame_ms:7.3f} ms/frame ({native_ms / frame_ms:.2f}x)")
+        for budget_ms in (1000 / config.FPS, native_ms * 0.8):
+            scale, frame_ms = run_controller(game, frames * 10, budget_ms)
+            print(f"      Résolution dynamique : {int(scale * 100)}% retenu, {frame_ms:.3f} ms/frame "
+                  f"(budget {budget_ms:.1f} ms)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    preset_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    frames_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    run(preset_arg, frames_arg)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark du démarrage
+======================
+Mesure le délai entre le lancement et la première frame de la carte de démarrage
+affichée (imports compris), sans fenêtre (driver SDL "dummy"). Chaque mesure est
+faite dans un nouveau processus pour que les imports soient à froid ; la
+chronologie de chaque lancement est écrite par StartupTrace dans un fichier JSON,
+avec les succès du cache disque des sprites (supprimer .asset_cache pour que le
+premier lancement soit à froid).
+
+La médiane de chaque phase est comparée à Config.STARTUP_BUDGETS_MS : le script
+se termine avec le code 1 si un budget est dépassé. Le preset 2560x1440 est
+utilisé par défaut.
+
+Usage : python benchmarks/startup_benchmark.py [preset 1|2|3] [lancements]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def measure_once(preset, trace_file):
+    """Démarre comme main() jusqu'au premier flip du menu, en écrivant la chronologie"""
+    os.chdir(ROOT)  # Les assets sont chargés par chemins relatifs
+
+    # L'import de main mesure les imports (pygame, modules du jeu) comme un vrai lancement
+    from startup_trace import StartupTrace
+    import main
+
+    with StartupTrace.phase("pygame_init"):
+        main.pygame.init()
+    with StartupTrace.phase("config"):
+        config = main.Config(forced_screen_size=preset)
+    config.STARTUP_TRACE_FILE = trace_file
+
+    manager = main.GameManager(config)  # Sans GameSettings : rien n'est lu ni sauvegardé
+    manager._run_frame()  # Première frame : le flip termine et écrit la chronologie
+
+
+def run(preset=3, launches=5):
+    totals = []
+    disk_stats = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trace_file = os.path.join(tmp_dir, "startup_trace.json")
+        for _ in range(launches):
+            subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", str(preset), trace_file],
+                capture_output=True, text=True, check=True
+            )
+            with open(trace_file, encoding='utf-8') as f:
+                trace = json.load(f)
+            totals.append(trace["totals_ms"])
+            disk_stats.append(trace.get("stats", {}))
+
+    from config import Config
+    budgets = Config(forced_screen_size=preset).STARTUP_BUDGETS_MS
+
+    def median(name):
+        values = sorted(run_totals.get(name, 0.0) for run_totals in totals)
+        return values[len(values) // 2]
+
+    print(f"📊 Démarrage jusqu'au premier flip du menu (preset {preset}), médiane de {launches} lancements")
+    names = [name for name in totals[0] if name != "total"] + ["total"]
+    exceeded = []
+    for name in names:
+        budget = budgets.get(name)
+        status = ""
+        if budget is not None:
+            status = f"(budget {budget} ms)"
+            if median(name) > budget:
+                status += " ❌ DÉPASSÉ"
+                exceeded.append(name)
+        print(f"   {name:<22} : {median(name):7.1f} ms {status}")
+    
+    # Le premier lancement remplit le cache disque des sprites s'il est vide, les suivants le relisent
+    for label, stats in (("premier lancement", disk_stats[0]), ("dernier lancement", disk_stats[-1])):
+        if stats:
+            print(f"💾 Cache disque ({label}) : {stats['disk_cache_hits']} relus, "
+                  f"{stats['disk_cache_misses']} décodés")
+
+    if exceeded:
+        print(f"❌ Budget de démarrage dépassé : {', '.join(exceeded)}")
+        return False
+    print("✅ Budget de démarrage respecté")
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 3 and sys.argv[1] == "--child":
+        measure_once(int(sys.argv[2]), sys.argv[3])
+    else:
+        preset_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+        launches_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+        sys.exit(0 if run(preset_arg, launches_arg) else 1)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark des transitions d'écran
+=================================
+Mesure le temps moyen de TransitionManager.render pour chaque effet, sur toute la
+durée d'une transition, sans fenêtre (driver SDL "dummy"). Le preset 2560x1440 est
+utilisé par défaut.
+
+Usage : python benchmarks/transition_benchmark.py [preset 1|2|3] [frames]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+PRESETS = {1: (1280, 720), 2: (1920, 1080), 3: (2560, 1440)}
+
+
+def run(preset=3, frames=30):
+    pygame.init()
+    width, height = PRESETS[preset]
+    screen = pygame.display.set_mode((width, height))
+
+    from transitions import TransitionManager, TRANSITION_TYPES
+
+    manager = TransitionManager(width, height)
+    manager.set_screen_reference(screen)
+
+    new_screen = pygame.Surface((width, height)).convert()
+    new_screen.fill((200, 40, 40))
+
+    print(f"📊 TransitionManager.render à {width}x{height}, {frames} frames par effet")
+    for effect in TRANSITION_TYPES:
+        screen.fill((40, 40, 200))
+        manager.start_transition(effect, duration=1.0)
+        manager.update_new_surface(new_screen)
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            manager.progress = frame / max(1, frames - 1)
+            manager.render(screen)
+        frame_ms = 1000 * (time.perf_counter() - start) / frames
+        manager.is_active = False
+
+        print(f"   {effect:<28} : {frame_ms:7.3f} ms/frame")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    preset_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    frames_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    run(preset_arg, frames_arg)
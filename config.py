@@ -34,6 +34,86 @@ class Config:
         # FPS fixe pour tous les presets
         self.FPS = 60
         
+        # Résolution interne du monde (le HUD et les menus restent en résolution native)
+        self.RENDER_SCALE = 1.0  # 1.0 = natif, < 1.0 = monde rendu plus petit puis agrandi
+        # Échelles proposées (F4 en jeu) : seul l'agrandissement x2 exact est rapide (~1.5 ms à
+        # 1440p contre 5 à 6 ms pour 75 % ou 66 %, qui ne faisaient rien gagner)
+        self.RENDER_SCALES = (1.0, 0.5)
+        self.TERRAIN_CHUNK_SIZE = 256  # Chunk de terrain pré-rendu, traces au sol comprises (px monde)
+        
+        # Résolution dynamique : ajuste RENDER_SCALE selon le temps de frame (F5 en jeu)
+        self.DYNAMIC_RESOLUTION = False  # Désactivée par défaut
+        self.DYNAMIC_RESOLUTION_WINDOW = 60  # Frames dans la fenêtre glissante
+        self.DYNAMIC_RESOLUTION_DOWN_THRESHOLD = 1.0  # Descendre si moyenne > budget x 1.0
+        self.DYNAMIC_RESOLUTION_UP_THRESHOLD = 0.6  # Remonter si moyenne < budget x 0.6 (hystérésis)
+        self.DYNAMIC_RESOLUTION_COOLDOWN = 120  # Frames de stabilisation après un changement
+        self.DYNAMIC_RESOLUTION_MIN_GAIN = 0.05  # Une échelle plus basse doit réduire le temps de frame d'au moins 5 %
+        self.DYNAMIC_RESOLUTION_RETRY_FRAMES = 1800  # Frames avant de réessayer une échelle sans gain
+        self.DYNAMIC_RESOLUTION_LOG_SIZE = 5  # Décisions affichées dans l'overlay de debug
+        
+        # Qualité des effets (graphics.particles_quality) : "low", "medium", "high" ou "auto" (F6 en jeu)
+        self.PARTICLES_QUALITY = "high"  # Réglage choisi par le joueur
+        self.EFFECT_QUALITY = "high"  # Niveau actif (différent du réglage en mode "auto")
+        # Budget par niveau :
+        #   particle_scale   : multiplicateur du nombre de particules par explosion (create_particles)
+        #   max_particles    : plafond de particules + particules de soudure vivantes
+        #   ash_density      : fraction des cendres émises par un BeamDeathEffect
+        #   welding_interval : frames entre deux gerbes de soudure du Beam
+        #   boss_skulls      : crânes émis à la mort du boss
+        self.EFFECT_QUALITY_LEVELS = {
+            "high": {"particle_scale": 1.0, "max_particles": 1500, "ash_density": 1.0, "welding_interval": 16, "boss_skulls": 15},
+            "medium": {"particle_scale": 0.6, "max_particles": 800, "ash_density": 0.5, "welding_interval": 24, "boss_skulls": 10},
+            "low": {"particle_scale": 0.3, "max_particles": 300, "ash_density": 0.25, "welding_interval": 32, "boss_skulls": 6},
+        }
+        self.EFFECT_QUALITY_ORDER = ("high", "medium", "low")  # Du plus riche au plus léger
+        # Mode "auto" : mêmes fenêtre et stabilisation que la résolution dynamique
+        self.EFFECT_QUALITY_DOWN_THRESHOLD = 0.9  # Baisser si moyenne > budget de frame x 0.9
+        self.EFFECT_QUALITY_UP_THRESHOLD = 0.5  # Remonter si moyenne < budget de frame x 0.5
+        
+        # Budget global des effets (primitives vivantes : particule, sprite, cendre ou crâne)
+        # Catégories de la plus prioritaire à la moins prioritaire (évincées en dernier -> en premier)
+        self.EFFECT_PRIORITIES = ("boss_death_effects", "death_effects", "orb_death_effects",
+                                  "beam_death_effects", "particles", "welding_particles")
+        self.EFFECT_BUDGET_LIMITS = {
+            "boss_death_effects": 60,    # Crânes du boss
+            "death_effects": 60,         # Sprites "mort" des ennemis spéciaux
+            "orb_death_effects": 80,     # Sprites repoussés par les orbes
+            "beam_death_effects": 6000,  # Cendres (AshPool) des désintégrations
+            "particles": 1500,           # Étincelles d'explosion
+            "welding_particles": 800,    # Étincelles de soudure du Beam
+        }
+        self.EFFECT_BUDGET_TOTAL = 8000  # Plafond global, toutes catégories confondues
+        self.EFFECT_NEAR_RADIUS = 400  # Tranches de distance au joueur (px) : les plus proches sont gardées
+        
+        # Traces au sol : les cendres retombées et les explosions sont cuites dans une couche persistante
+        self.GROUND_DECALS = False  # Mode optionnel (graphics.ground_decals)
+        self.GROUND_DECAL_MAX_CHUNKS = 64  # Plafond de chunks en mémoire (~256 Ko chacun)
+        self.GROUND_DECAL_DECAY_INTERVAL = 30  # Frames entre deux paliers d'estompage
+        self.GROUND_DECAL_DECAY_STEP = 4  # Alpha retiré par palier (0 = traces permanentes, ~32 s à 4)
+        self.GROUND_DECAL_ASH_LIFE = 45  # Durée de vol max des cendres avant de se poser (frames)
+        self.GROUND_DECAL_SCORCH_COLOR = (20, 15, 10, 90)  # Brûlures d'explosion
+        
+        # Touches de déplacement (GameSettings.controls, noms pygame ; QWERTY et flèches restent actives)
+        self.CONTROLS = {"move_up": "z", "move_down": "s", "move_left": "q", "move_right": "d"}
+        
+        # Cache disque des sprites redimensionnés (asset_cache.py) : pixels bruts relus par mmap au lancement
+        self.ASSET_DISK_CACHE = True  # Écrire/relire les images décodées et redimensionnées
+        self.ASSET_CACHE_DIR = ".asset_cache"  # Répertoire du cache (sous-dossier par version du format)
+        self.TEXTURE_ATLAS = True  # Sprites des ennemis, drops et icônes lus depuis les atlas (texture_atlas.py)
+        self.TEXTURE_ATLAS_DIR = "assets/atlas"  # Atlas PNG et index JSON produits par python texture_atlas.py
+        self.ASSET_BUNDLE = True  # Lire les images depuis le paquet d'assets s'il existe (asset_bundle.py)
+        self.ASSET_BUNDLE_FILE = "assets.lmsbundle"  # Produit par python asset_bundle.py [--compress]
+        
+        # Chronologie du démarrage (startup_trace.py) et budget vérifié par benchmarks/startup_benchmark.py
+        self.STARTUP_TRACE_FILE = None  # Fichier JSON écrit au premier flip du menu (ex. "startup_trace.json", None = désactivé)
+        self.STARTUP_BUDGETS_MS = {
+            "imports": 300,        # pygame, numpy et modules du jeu
+            "display_init": 100,   # Création de la fenêtre
+            "start_map": 150,      # Carte de démarrage (curseur, sprites, terrain)
+            "first_draw": 100,     # Dessin de la première frame du menu
+            "total": 600,          # Du lancement au premier flip
+        }
+        
         # Durée des transitions (en secondes)
         self.TRANSITION_DURATION = 0.2  # Durée par défaut pour toutes les transitions
         
@@ -79,8 +159,9 @@ class Config:
                 forced_screen_size = None
         
         if forced_screen_size is None:
-            # Obtenir la résolution de l'écran
-            pygame.init()
+            # Obtenir la résolution de l'écran (main() a déjà appelé pygame.init())
+            if not pygame.display.get_init():
+                pygame.display.init()
             info = pygame.display.Info()
             screen_width = info.current_w
             screen_height = info.current_h
@@ -435,4 +516,8 @@ class Config:
         self.BEAM_DEATH_ASH_LIFETIME = 60  # Durée de vie des cendres en frames
         self.BEAM_DEATH_ASH_COLOR = (30, 30, 30)  # Couleur des cendres
         
+        # === CULLING DU RENDU ===
+        self.CULLING_MARGIN = 32  # Marge hors écran avant d'ignorer une entité (rotations, barres de vie)
+        self.CULLING_DEFAULT_SIZE = 64  # Étendue utilisée pour les entités sans attribut size
+        
 
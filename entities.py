@@ -5,12 +5,29 @@ Classes du joueur et des entités du jeu
 import pygame
 import pygame.gfxdraw  # Pour l'antialiasing
 import pygame.surfarray  # Pour l'accès aux pixels
+import numpy as np
 import random
 import math
+from startup_trace import StartupTrace
+from asset_cache import AssetCache
+from font_registry import FontRegistry
+from render_queue import HAS_FBLITS
 
 class Player:
     """Classe du joueur avec déplacement à inertie et animation directionnelle"""
     
+    # Spritesheet, nombre de frames et séquence d'animation par type de sprite
+    SPRITE_TYPES = {
+        1: ("assets/player/player2.png", 5, (4, 3, 2, 1, 0)),  # Séquence 5-4-3-2-1 en boucle
+        2: ("assets/player/player3.png", 9, (0, 1, 2, 3, 4, 5, 6, 7, 8)),  # Séquence 1-2-3-4-5-6-7-8-9 en boucle
+        3: ("assets/player/player4.png", 5, (0, 1, 2, 3, 4, 3, 2, 1))  # Ping-pong 1-2-3-4-5-4-3-2-1 en boucle
+    }
+    
+    SPRITE_SCALE = 4  # Taille des frames = PLAYER_SIZE x 4 pour une meilleure visibilité
+    
+    # Frames d'animation (droite, gauche) partagées par toutes les instances, par (type, taille, lissage)
+    _frame_cache = {}
+    
     def __init__(self, x, y, config):
         self.x = x
         self.y = y
@@ -53,65 +70,29 @@ class Player:
             self.animation_delay = 9  # Valeur par défaut
     def _load_player_sprite(self, sprite_type):
         """Charge la spritesheet du joueur selon le type spécifié"""
+        if sprite_type not in self.SPRITE_TYPES:
+            print(f"Type de sprite non supporté : {sprite_type}, utilisation du type 1 par défaut")
+            return self._load_player_sprite(1)
+        
+        sprite_path, num_frames, frame_sequence = self.SPRITE_TYPES[sprite_type]
+        self.frame_sequence = list(frame_sequence)
+        sprite_size = self.size * self.SPRITE_SCALE
+        
         try:
-            if sprite_type == 1:
-                # Type 1 : player2.png (5 frames, séquence 5-4-3-2-1)
-                spritesheet = pygame.image.load("assets/player/player2.png").convert_alpha()
-                num_frames = 5
-                self.frame_sequence = [4, 3, 2, 1, 0]  # Séquence 5-4-3-2-1 en boucle
-                print(f"Chargement sprite type 1 : player2.png (5 frames, séquence 5-4-3-2-1)")
-                
-            elif sprite_type == 2:
-                # Type 2 : player3.png (9 frames, séquence 1-2-3-4-5-6-7-8-9)
-                spritesheet = pygame.image.load("assets/player/player3.png").convert_alpha()
-                num_frames = 9
-                self.frame_sequence = [0, 1, 2, 3, 4, 5, 6, 7, 8]  # Séquence 1-2-3-4-5-6-7-8-9 en boucle
-                print(f"Chargement sprite type 2 : player3.png (9 frames, séquence 1-2-3-4-5-6-7-8-9)")
-                
-            elif sprite_type == 3:
-                # Type 3 : player4.png (5 frames, animation ping-pong 1-2-3-4-5-4-3-2-1)
-                spritesheet = pygame.image.load("assets/player/player4.png").convert_alpha()
-                num_frames = 5
-                self.frame_sequence = [0, 1, 2, 3, 4, 3, 2, 1]  # Séquence ping-pong 1-2-3-4-5-4-3-2-1 en boucle
-                print(f"Chargement sprite type 3 : player4.png (5 frames, séquence ping-pong 1-2-3-4-5-4-3-2-1)")
-                
-            else:
-                print(f"Type de sprite non supporté : {sprite_type}, utilisation du type 1 par défaut")
-                return self._load_player_sprite(1)
-            
-            # Dimensions des sprites individuels
-            sprite_width = spritesheet.get_width() // num_frames  # Frames horizontalement
-            sprite_height = spritesheet.get_height()
-            
-            sprite_size = self.size * 4  # Facteur d'échelle x4 pour une meilleure visibilité
-            
-            # Extraire tous les sprites
-            for i in range(num_frames):
-                # Extraire le sprite à la position (i * sprite_width, 0)
-                frame_rect = pygame.Rect(i * sprite_width, 0, sprite_width, sprite_height)
-                frame = spritesheet.subsurface(frame_rect).copy()
-                
-                # Redimensionner le sprite avec antialiasing si activé
-                if self.config.SPRITE_SMOOTHING:
-                    frame_scaled = pygame.transform.smoothscale(frame, (sprite_size, sprite_size))
-                else:
-                    frame_scaled = pygame.transform.scale(frame, (sprite_size, sprite_size))
-                
-                # Optimiser le format pour un rendu plus rapide
-                frame_scaled = frame_scaled.convert_alpha()
-                self.animation_frames.append(frame_scaled)
-                
-                # Créer la version miroir pour la gauche
-                frame_left = pygame.transform.flip(frame_scaled, True, False)
-                frame_left = frame_left.convert_alpha()  # Optimiser aussi la version miroir
-                self.animation_frames_left.append(frame_left)
-            
+            key = (sprite_type, sprite_size, self.config.SPRITE_SMOOTHING)
+            if key not in Player._frame_cache:
+                with StartupTrace.phase("player_sprites"):
+                    Player._frame_cache[key] = self._build_animation_frames(sprite_path, num_frames, sprite_size)
+                # Calculer la vitesse d'animation pour ce type de sprite
+                total_animation_duration = 60  # frames (1 seconde à 60 FPS)
+                animation_delay = max(1, total_animation_duration // num_frames)
+                animation_fps = 60.0 / animation_delay
+                print(f"Chargement sprite type {sprite_type} : {sprite_path} ({num_frames} frames, {sprite_size}px)")
+                print(f"Animation spritesheet du joueur activée ({num_frames} frames, ~{animation_fps:.1f} FPS d'animation)")
+            
+            # Listes partagées entre instances (menu, sélecteur, parties successives) : jamais modifiées
+            self.animation_frames, self.animation_frames_left = Player._frame_cache[key]
             self.has_image = True
-            # Calculer la vitesse d'animation pour ce type de sprite
-            total_animation_duration = 60  # frames (1 seconde à 60 FPS)
-            animation_delay = max(1, total_animation_duration // num_frames)
-            animation_fps = 60.0 / animation_delay
-            print(f"Animation spritesheet du joueur activée ({num_frames} frames, ~{animation_fps:.1f} FPS d'animation)")
             
         except (pygame.error, FileNotFoundError) as e:
             print(f"Spritesheet du joueur non trouvée : {e}")
@@ -120,20 +101,24 @@ class Player:
             self.animation_frames_left = []
             self.has_image = False
     
-    def update(self, keys):
-        """Met à jour la position du joueur avec inertie et animation directionnelle"""
-        # Accélération basée sur les touches
-        accel_x = 0
-        accel_y = 0
-        
-        if keys[pygame.K_w] or keys[pygame.K_z]:  # W ou Z (AZERTY)
-            accel_y = -self.speed
-        if keys[pygame.K_s]:
-            accel_y = self.speed
-        if keys[pygame.K_a] or keys[pygame.K_q]:  # A ou Q (AZERTY)
-            accel_x = -self.speed
-        if keys[pygame.K_d]:
-            accel_x = self.speed
+    def _build_animation_frames(self, sprite_path, num_frames, sprite_size):
+        """Frames redimensionnées d'une spritesheet (cache disque) et leur miroir pour la gauche"""
+        frames = AssetCache.get_frames(sprite_path, num_frames, sprite_size, self.config.SPRITE_SMOOTHING)
+        
+        # Créer la version miroir pour la gauche
+        frames_left = [pygame.transform.flip(frame, True, False).convert_alpha() for frame in frames]
+        
+        return frames, frames_left
+    
+    def update(self, controls):
+        """Met à jour la position du joueur avec inertie et animation directionnelle
+        
+        controls : InputManager déjà mis à jour pour la frame (touches de GameSettings.controls).
+        """
+        # Accélération basée sur les actions de déplacement
+        move_x, move_y = controls.movement()
+        accel_x = move_x * self.speed
+        accel_y = move_y * self.speed
         
         # === DÉTECTION DE DIRECTION ===
         # Si le joueur se déplace horizontalement, mettre à jour la direction
@@ -160,7 +145,10 @@ class Player:
         self.x += self.vel_x
         self.y += self.vel_y
         
-        # === ANIMATION DES FRAMES ===
+        self.animate()
+    
+    def animate(self):
+        """Avance l'animation de la spritesheet d'une frame (aussi utilisé par le sélecteur du menu)"""
         # Mettre à jour l'animation seulement si on a des frames
         if self.has_image and self.animation_frames:
             # Avancer le timer d'animation (compteur de frames)
@@ -207,14 +195,63 @@ class Player:
             'damage_blocked': blocked_damage  # Dégâts bloqués par le bouclier
         }
     
-    def draw(self, screen, shield_hits=0):
+    def draw(self, screen, shield_hits=0, camera_x=0, camera_y=0):
         """Dessine le joueur avec l'animation de spritesheet et l'effet de bouclier"""
+        self.draw_shields(screen, shield_hits, camera_x, camera_y)
+        
+        # Position à l'écran (la caméra est passée explicitement, l'entité n'est pas modifiée)
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
+        # === DESSIN DU JOUEUR ===
+        current_image = self.get_current_image()
+        if current_image is not None:
+            # Utiliser l'image du joueur centrée sur sa position
+            image_rect = current_image.get_rect()
+            # Centrer l'image sur les coordonnées du joueur
+            image_rect.center = (int(screen_x + self.size//2), int(screen_y + self.size//2))
+            screen.blit(current_image, image_rect)
+        elif not (self.has_image and self.animation_frames and self.animation_frames_left):
+            self.draw_fallback(screen, screen_x, screen_y)
+    
+    def submit(self, queue, shield_hits=0, camera_x=0, camera_y=0):
+        """Soumet le joueur à la file de rendu : boucliers (primitives) puis sprite en blit groupé"""
+        if shield_hits > 0 or getattr(self, 'shield_points', 0) > 0:
+            queue.draw('player', self.draw_shields, shield_hits, camera_x, camera_y)
+        
+        current_image = self.get_current_image()
+        if current_image is not None:
+            image_rect = current_image.get_rect()
+            image_rect.center = (int(self.x - camera_x + self.size//2), int(self.y - camera_y + self.size//2))
+            queue.blit('player', current_image, image_rect)
+        elif not (self.has_image and self.animation_frames and self.animation_frames_left):
+            queue.draw('player', self.draw_fallback, self.x - camera_x, self.y - camera_y)
+    
+    def get_current_image(self):
+        """Frame d'animation courante selon la direction (None si pas de sprite)"""
+        if not (self.has_image and self.animation_frames and self.animation_frames_left):
+            return None
+        # Choisir la bonne liste de frames selon la direction
+        current_frames = self.animation_frames if self.facing_direction == "right" else self.animation_frames_left
+        
+        # S'assurer que current_frame est dans les limites
+        if self.current_frame < len(current_frames):
+            return current_frames[self.current_frame]
+        # Fallback si problème avec les frames
+        self.current_frame = 0
+        return None
+    
+    def draw_shields(self, screen, shield_hits=0, camera_x=0, camera_y=0, scale=1.0):
+        """Dessine les boucliers (bonus temporaire et compétence) sous le sprite du joueur
+        
+        scale : échelle de la surface de dessin (surface du monde réduite, voir RenderQueue)
+        """
+        center_x = int((self.x - camera_x + self.size//2) * scale)
+        center_y = int((self.y - camera_y + self.size//2) * scale)
         
         # === EFFET DE BOUCLIER TEMPORAIRE ===
         if shield_hits > 0:
-            center_x = int(self.x + self.size//2)
-            center_y = int(self.y + self.size//2)
-            shield_radius = int(self.size * 0.8)  # Rayon plus grand que le joueur
+            shield_radius = int(self.size * 0.8 * scale)  # Rayon plus grand que le joueur
             
             # Couleur bleue pour le bouclier avec transparence
             shield_color = (100, 150, 255)  # Bleu clair
@@ -235,9 +272,7 @@ class Player:
         
         # === EFFET DE BOUCLIER DE LA COMPÉTENCE ===
         if hasattr(self, 'shield_points') and self.shield_points > 0:
-            center_x = int(self.x + self.size//2)
-            center_y = int(self.y + self.size//2)
-            shield_radius = int(self.size * 0.6)  # Plus petit que le bouclier temporaire
+            shield_radius = int(self.size * 0.6 * scale)  # Plus petit que le bouclier temporaire
             
             # Couleur dorée/orange pour le bouclier de compétence
             shield_opacity = min(255, int(255 * (self.shield_points / getattr(self, 'max_shield_points', 100))))
@@ -249,67 +284,56 @@ class Player:
                 pygame.gfxdraw.aacircle(screen, center_x, center_y, shield_radius, shield_border_color)
             else:
                 pygame.draw.circle(screen, shield_border_color, (center_x, center_y), shield_radius, 1)
+    
+    def draw_fallback(self, screen, screen_x, screen_y, scale=1.0):
+        """Dessine le joueur sans sprite : cercle et indicateur de direction (scale : échelle de la surface)"""
+        # Position et taille à l'échelle de la surface de dessin
+        size = max(2, int(self.size * scale))
+        screen_x *= scale
+        screen_y *= scale
         
-        # === DESSIN DU JOUEUR ===
-        if self.has_image and self.animation_frames and self.animation_frames_left:
-            # Choisir la bonne liste de frames selon la direction
-            current_frames = self.animation_frames if self.facing_direction == "right" else self.animation_frames_left
-            
-            # S'assurer que current_frame est dans les limites
-            if self.current_frame < len(current_frames):
-                current_image = current_frames[self.current_frame]
-                
-                # Utiliser l'image du joueur centrée sur sa position
-                image_rect = current_image.get_rect()
-                # Centrer l'image sur les coordonnées du joueur
-                image_rect.center = (int(self.x + self.size//2), int(self.y + self.size//2))
-                screen.blit(current_image, image_rect)
-            else:
-                # Fallback si problème avec les frames
-                self.current_frame = 0
+        # Fallback : dessiner un cercle si l'image n'est pas disponible
+        center_x = int(screen_x + size//2)
+        center_y = int(screen_y + size//2)
+        radius = size//2
+        
+        # Utiliser l'antialiasing si activé
+        if self.config.ENABLE_ANTIALIASING:
+            pygame.gfxdraw.filled_circle(screen, center_x, center_y, radius, self.config.PLAYER_COLOR)
+            pygame.gfxdraw.aacircle(screen, center_x, center_y, radius, self.config.PLAYER_COLOR)
+            # Contour blanc avec antialiasing
+            pygame.gfxdraw.aacircle(screen, center_x, center_y, radius, self.config.WHITE)
         else:
-            # Fallback : dessiner un cercle si l'image n'est pas disponible
-            center_x = int(self.x + self.size//2)
-            center_y = int(self.y + self.size//2)
-            radius = self.size//2
-            
-            # Utiliser l'antialiasing si activé
-            if self.config.ENABLE_ANTIALIASING:
-                pygame.gfxdraw.filled_circle(screen, center_x, center_y, radius, self.config.PLAYER_COLOR)
-                pygame.gfxdraw.aacircle(screen, center_x, center_y, radius, self.config.PLAYER_COLOR)
-                # Contour blanc avec antialiasing
-                pygame.gfxdraw.aacircle(screen, center_x, center_y, radius, self.config.WHITE)
-            else:
-                pygame.draw.circle(screen, self.config.PLAYER_COLOR, (center_x, center_y), radius)
-                # Contour blanc
-                pygame.draw.circle(screen, self.config.WHITE, (center_x, center_y), radius, 1)
-            pygame.draw.circle(screen, self.config.WHITE,
-                             (int(self.x + self.size//2), int(self.y + self.size//2)),
-                             self.size//2, 2)
-            
-            # === INDICATEUR DE DIRECTION EN MODE FALLBACK ===
-            # Dessiner un petit triangle pour indiquer la direction
-            center_x = int(self.x + self.size//2)
-            center_y = int(self.y + self.size//2)
-            triangle_size = self.size // 4
-            
-            if self.facing_direction == "right":
-                # Triangle pointant vers la droite
-                points = [
-                    (center_x + triangle_size, center_y),
-                    (center_x - triangle_size//2, center_y - triangle_size//2),
-                    (center_x - triangle_size//2, center_y + triangle_size//2)
-                ]
-            else:  # facing_direction == "left"
-                # Triangle pointant vers la gauche
-                points = [
-                    (center_x - triangle_size, center_y),
-                    (center_x + triangle_size//2, center_y - triangle_size//2),
-                    (center_x + triangle_size//2, center_y + triangle_size//2)
-                ]
-            
-            pygame.draw.polygon(screen, self.config.WHITE, points)
-    
+            pygame.draw.circle(screen, self.config.PLAYER_COLOR, (center_x, center_y), radius)
+            # Contour blanc
+            pygame.draw.circle(screen, self.config.WHITE, (center_x, center_y), radius, 1)
+        pygame.draw.circle(screen, self.config.WHITE,
+                         (int(screen_x + size//2), int(screen_y + size//2)),
+                         size//2, 2)
+        
+        # === INDICATEUR DE DIRECTION EN MODE FALLBACK ===
+        # Dessiner un petit triangle pour indiquer la direction
+        center_x = int(screen_x + size//2)
+        center_y = int(screen_y + size//2)
+        triangle_size = size // 4
+        
+        if self.facing_direction == "right":
+            # Triangle pointant vers la droite
+            points = [
+                (center_x + triangle_size, center_y),
+                (center_x - triangle_size//2, center_y - triangle_size//2),
+                (center_x - triangle_size//2, center_y + triangle_size//2)
+            ]
+        else:  # facing_direction == "left"
+            # Triangle pointant vers la gauche
+            points = [
+                (center_x - triangle_size, center_y),
+                (center_x + triangle_size//2, center_y - triangle_size//2),
+                (center_x + triangle_size//2, center_y + triangle_size//2)
+            ]
+        
+        pygame.draw.polygon(screen, self.config.WHITE, points)
+        
     def change_sprite_type(self, sprite_type):
         """Change le type de sprite du joueur et recharge les animations"""
         try:
@@ -326,17 +350,18 @@ class Enemy:
     # Variables de classe pour les sprites (chargés une seule fois)
     sprites = None
     sprites_loaded = False
+    SPRITE_COUNT = 23  # Sprites assets/enemy/1.png à 23.png
     
     @classmethod
     def load_sprites(cls):
-        """Charge tous les sprites d'ennemis une seule fois"""
+        """Charge tous les sprites d'ennemis une seule fois (vues sur l'atlas des ennemis)"""
         if not cls.sprites_loaded:
             cls.sprites = {}
             try:
-                # Charger les sprites 1.png à 5.png
-                for i in range(1, 24):
-                    sprite_path = f"assets/Enemy/{i}.png"
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
+                # Charger les sprites 1.png à SPRITE_COUNT.png
+                for i in range(1, cls.SPRITE_COUNT + 1):
+                    sprite_path = f"assets/enemy/{i}.png"
+                    sprite = AssetCache.get_image(sprite_path)
                     # Les sprites sont maintenant redimensionnés selon le preset actuel
                     # La taille sera définie lors de l'initialisation de l'ennemi
                     cls.sprites[i] = sprite  # Garder le sprite original pour le redimensionner plus tard
@@ -366,14 +391,8 @@ class Enemy:
             else:
                 self.sprite_id = random.choice(list(Enemy.sprites.keys()))
             
-            # Redimensionner le sprite original à la taille définie dans le preset avec antialiasing
-            original_sprite = Enemy.sprites[self.sprite_id]
-            if config.SPRITE_SMOOTHING:
-                self.sprite = pygame.transform.smoothscale(original_sprite, (self.size, self.size))
-            else:
-                self.sprite = pygame.transform.scale(original_sprite, (self.size, self.size))
-            # Optimiser le format pour un rendu plus rapide
-            self.sprite = self.sprite.convert_alpha()
+            # Sprite redimensionné à la taille du preset (préchargé, partagé entre ennemis)
+            self.sprite = AssetCache.get_image(f"assets/enemy/{self.sprite_id}.png", (self.size, self.size), config.SPRITE_SMOOTHING)
         else:
             self.sprite_id = None
             self.sprite = None
@@ -391,14 +410,9 @@ class Enemy:
             self.bonus_type = random.choice(config.BONUS_TYPES)
             # Taille x2 pour les ennemis spéciaux
             self.size = config.ENEMY_SIZE * 2
-            # Redimensionner le sprite à la nouvelle taille avec antialiasing
+            # Sprite à la nouvelle taille (préchargé, partagé entre ennemis spéciaux)
             if self.sprite:
-                if config.SPRITE_SMOOTHING:
-                    self.sprite = pygame.transform.smoothscale(Enemy.sprites[self.sprite_id], (self.size, self.size))
-                else:
-                    self.sprite = pygame.transform.scale(Enemy.sprites[self.sprite_id], (self.size, self.size))
-                # Optimiser le format
-                self.sprite = self.sprite.convert_alpha()
+                self.sprite = AssetCache.get_image(f"assets/enemy/{self.sprite_id}.png", (self.size, self.size), config.SPRITE_SMOOTHING)
         else:
             # Points de vie normaux avec progression par vague
             self.max_health = base_health + wave_bonus * config.ENEMY_HEALTH_INCREASE_PER_WAVE
@@ -512,85 +526,115 @@ class Enemy:
     
     def draw(self, screen, camera_x=0, camera_y=0):
         """Dessine l'ennemi avec animation de rotation"""
+        # Position à l'écran (la caméra est passée explicitement, l'entité n'est pas modifiée)
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
         if self.sprite:
             # Appliquer la rotation au sprite
             rotated_sprite = pygame.transform.rotate(self.sprite, self.rotation_angle)
             
             # Calculer la nouvelle position pour centrer le sprite tourné
             rotated_rect = rotated_sprite.get_rect()
-            sprite_center_x = self.x + self.size // 2
-            sprite_center_y = self.y + self.size // 2
+            sprite_center_x = screen_x + self.size // 2
+            sprite_center_y = screen_y + self.size // 2
             rotated_rect.center = (sprite_center_x, sprite_center_y)
             
             # Dessiner le sprite tourné
             screen.blit(rotated_sprite, rotated_rect)
         else:
-            # Fallback : dessiner des carrés colorés si les sprites ne sont pas chargés
-            enemy_color = self.config.ENEMY_COLOR  # Couleur normale pour tous les ennemis
+            self.draw_fallback(screen, camera_x, camera_y)
+        
+        # Barre de santé si endommagé (au-dessus du sprite)
+        if self.health < self.max_health:
+            self.draw_health_bar(screen, camera_x, camera_y)
+    
+    def draw_fallback(self, screen, camera_x=0, camera_y=0, scale=1.0):
+        """Dessine l'ennemi sans sprite (scale : échelle de la surface de dessin)"""
+        screen_x = (self.x - camera_x) * scale
+        screen_y = (self.y - camera_y) * scale
+        size = max(1, int(self.size * scale))
+        
+        # Fallback : dessiner des carrés colorés si les sprites ne sont pas chargés
+        enemy_color = self.config.ENEMY_COLOR  # Couleur normale pour tous les ennemis
+        
+        # Corps principal avec antialiasing si activé
+        if self.config.ENABLE_ANTIALIASING:
+            # Utiliser un rectangle avec antialiasing (approximation avec gfxdraw)
+            points = [
+                (int(screen_x), int(screen_y)),
+                (int(screen_x + size), int(screen_y)),
+                (int(screen_x + size), int(screen_y + size)),
+                (int(screen_x), int(screen_y + size))
+            ]
+            pygame.gfxdraw.filled_polygon(screen, points, enemy_color)
+            pygame.gfxdraw.aapolygon(screen, points, enemy_color)
+            
+            # Contour blanc avec antialiasing (plus épais pour les ennemis spéciaux)
+            border_width = max(1, round((3 if self.is_special else 2) * scale))
+            for i in range(border_width):
+                border_points = [
+                    (int(screen_x - i), int(screen_y - i)),
+                    (int(screen_x + size + i), int(screen_y - i)),
+                    (int(screen_x + size + i), int(screen_y + size + i)),
+                    (int(screen_x - i), int(screen_y + size + i))
+                ]
+                pygame.gfxdraw.aapolygon(screen, border_points, self.config.WHITE)
+        else:
+            # Rendu normal sans antialiasing
+            pygame.draw.rect(screen, enemy_color,
+                            (int(screen_x), int(screen_y), size, size))
             
-            # Corps principal avec antialiasing si activé
+            # Contour blanc (plus épais pour les ennemis spéciaux)
+            border_width = max(1, round((3 if self.is_special else 2) * scale))
+            pygame.draw.rect(screen, self.config.WHITE,
+                            (int(screen_x), int(screen_y), size, size), border_width)
+        
+        # Effet scintillant pour les ennemis spéciaux (inchangé)
+        if self.is_special:
+            pulse = int(50 * (1 + math.sin(pygame.time.get_ticks() * 0.01)))
+            glow_color = (255, 255, 255, pulse)
+            glow_rect = pygame.Rect(screen_x - 2, screen_y - 2, size + 4, size + 4)
             if self.config.ENABLE_ANTIALIASING:
-                # Utiliser un rectangle avec antialiasing (approximation avec gfxdraw)
-                points = [
-                    (int(self.x), int(self.y)),
-                    (int(self.x + self.size), int(self.y)),
-                    (int(self.x + self.size), int(self.y + self.size)),
-                    (int(self.x), int(self.y + self.size))
+                # Contour avec antialiasing pour l'effet de scintillement
+                glow_points = [
+                    (int(screen_x - 2), int(screen_y - 2)),
+                    (int(screen_x + size + 2), int(screen_y - 2)),
+                    (int(screen_x + size + 2), int(screen_y + size + 2)),
+                    (int(screen_x - 2), int(screen_y + size + 2))
                 ]
-                pygame.gfxdraw.filled_polygon(screen, points, enemy_color)
-                pygame.gfxdraw.aapolygon(screen, points, enemy_color)
-                
-                # Contour blanc avec antialiasing (plus épais pour les ennemis spéciaux)
-                border_width = 3 if self.is_special else 2
-                for i in range(border_width):
-                    border_points = [
-                        (int(self.x - i), int(self.y - i)),
-                        (int(self.x + self.size + i), int(self.y - i)),
-                        (int(self.x + self.size + i), int(self.y + self.size + i)),
-                        (int(self.x - i), int(self.y + self.size + i))
-                    ]
-                    pygame.gfxdraw.aapolygon(screen, border_points, self.config.WHITE)
+                pygame.gfxdraw.aapolygon(screen, glow_points, self.config.WHITE)
             else:
-                # Rendu normal sans antialiasing
-                pygame.draw.rect(screen, enemy_color,
-                                (int(self.x), int(self.y), self.size, self.size))
-                
-                # Contour blanc (plus épais pour les ennemis spéciaux)
-                border_width = 3 if self.is_special else 2
-                pygame.draw.rect(screen, self.config.WHITE,
-                                (int(self.x), int(self.y), self.size, self.size), border_width)
-            
-            # Effet scintillant pour les ennemis spéciaux (inchangé)
-            if self.is_special:
-                pulse = int(50 * (1 + math.sin(pygame.time.get_ticks() * 0.01)))
-                glow_color = (255, 255, 255, pulse)
-                glow_rect = pygame.Rect(self.x - 2, self.y - 2, self.size + 4, self.size + 4)
-                if self.config.ENABLE_ANTIALIASING:
-                    # Contour avec antialiasing pour l'effet de scintillement
-                    glow_points = [
-                        (int(self.x - 2), int(self.y - 2)),
-                        (int(self.x + self.size + 2), int(self.y - 2)),
-                        (int(self.x + self.size + 2), int(self.y + self.size + 2)),
-                        (int(self.x - 2), int(self.y + self.size + 2))
-                    ]
-                    pygame.gfxdraw.aapolygon(screen, glow_points, self.config.WHITE)
-                else:
-                    pygame.draw.rect(screen, self.config.WHITE, glow_rect, 1)
+                pygame.draw.rect(screen, self.config.WHITE, glow_rect, 1)
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet l'ennemi à la file de rendu : sprite tourné en blit groupé, barre de vie à part"""
+        if self.sprite:
+            # Sprite tourné (par la file, à l'échelle de rendu) centré sur la position à l'écran
+            queue.blit_rotated('enemies', self.sprite, self.rotation_angle,
+                               (self.x - camera_x + self.size // 2, self.y - camera_y + self.size // 2))
+        else:
+            queue.draw('enemies', self.draw_fallback, camera_x, camera_y)
         
-        # Barre de santé si endommagé (au-dessus du sprite)
         if self.health < self.max_health:
-            health_ratio = self.health / self.max_health
-            bar_width = self.size
-            bar_height = 4
-            
-            # Fond rouge
-            pygame.draw.rect(screen, self.config.RED,
-                           (int(self.x), int(self.y - 8), bar_width, bar_height))
-            
-            # Santé actuelle
-            current_width = int(bar_width * health_ratio)
-            pygame.draw.rect(screen, self.config.GREEN,
-                           (int(self.x), int(self.y - 8), current_width, bar_height))
+            queue.draw('enemy_bars', self.draw_health_bar, camera_x, camera_y)
+    
+    def draw_health_bar(self, screen, camera_x=0, camera_y=0, scale=1.0):
+        """Dessine la barre de santé au-dessus de l'ennemi (scale : échelle de la surface de dessin)"""
+        screen_x = (self.x - camera_x) * scale
+        screen_y = (self.y - camera_y - 8) * scale
+        health_ratio = self.health / self.max_health
+        bar_width = int(self.size * scale)
+        bar_height = max(1, round(4 * scale))
+        
+        # Fond rouge
+        pygame.draw.rect(screen, self.config.RED,
+                       (int(screen_x), int(screen_y), bar_width, bar_height))
+        
+        # Santé actuelle
+        current_width = int(bar_width * health_ratio)
+        pygame.draw.rect(screen, self.config.GREEN,
+                       (int(screen_x), int(screen_y), current_width, bar_height))
 
 class Boss:
     """Classe du Boss - Ennemi puissant qui apparaît à certains niveaux"""
@@ -606,11 +650,7 @@ class Boss:
 
         # Charger le sprite du boss
         try:
-            boss_sprite = pygame.image.load("assets/enemy/boss1.png").convert_alpha()
-            if config.SPRITE_SMOOTHING:
-                self.sprite = pygame.transform.smoothscale(boss_sprite, (self.size, self.size))
-            else:
-                self.sprite = pygame.transform.scale(boss_sprite, (self.size, self.size))
+            self.sprite = AssetCache.get_image("assets/enemy/boss1.png", (self.size, self.size), config.SPRITE_SMOOTHING)
             print(f"🔥 Sprite du boss chargé : boss1.png ({self.size}x{self.size})")
         except Exception as e:
             print(f"⚠️ Erreur lors du chargement du sprite boss : {e}")
@@ -767,45 +807,76 @@ class Boss:
             else:
                 screen.blit(self.sprite, (screen_x, screen_y))
         else:
-            # Fallback : dessiner un grand cercle rouge
-            center_x = int(screen_x + self.size//2)
-            center_y = int(screen_y + self.size//2)
-            radius = self.size//2
-            
-            # Couleur rouge pour le boss
-            boss_color = (200, 50, 50)
-            pygame.draw.circle(screen, boss_color, (center_x, center_y), radius)
-            pygame.draw.circle(screen, self.config.WHITE, (center_x, center_y), radius, 3)
+            self.draw_fallback(screen, camera_x, camera_y)
         
         # Barre de vie du boss (plus grande et plus visible)
         if not self.is_dead:
-            bar_width = self.size
-            bar_height = 8
-            health_ratio = self.health / self.max_health
-            
-            # Contour de la barre
-            pygame.draw.rect(screen, self.config.WHITE,
-                           (int(screen_x), int(screen_y - 15), bar_width, bar_height), 2)
-            
-            # Fond rouge
-            pygame.draw.rect(screen, self.config.RED,
-                           (int(screen_x), int(screen_y - 15), bar_width, bar_height))
-            
-            # Santé actuelle
-            current_width = int(bar_width * health_ratio)
-            pygame.draw.rect(screen, self.config.GREEN,
-                           (int(screen_x), int(screen_y - 15), current_width, bar_height))
-            
-            # Afficher le pourcentage de vie
-            health_percent = int(health_ratio * 100)
-            font = pygame.font.Font(None, 24)
-            text = font.render(f"BOSS: {health_percent}%", True, self.config.WHITE)
-            text_rect = text.get_rect(center=(screen_x + bar_width//2, screen_y - 25))
-            screen.blit(text, text_rect)
+            self.draw_health_bar(screen, camera_x, camera_y)
+    
+    def draw_fallback(self, screen, camera_x=0, camera_y=0, scale=1.0):
+        """Dessine le boss sans sprite : grand cercle rouge (scale : échelle de la surface de dessin)"""
+        center_x = int((self.x - camera_x + self.size//2) * scale)
+        center_y = int((self.y - camera_y + self.size//2) * scale)
+        radius = int(self.size//2 * scale)
+        
+        # Couleur rouge pour le boss
+        boss_color = (200, 50, 50)
+        pygame.draw.circle(screen, boss_color, (center_x, center_y), radius)
+        pygame.draw.circle(screen, self.config.WHITE, (center_x, center_y), radius, max(1, round(3 * scale)))
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet le boss à la file de rendu : sprite en blit groupé puis barre de vie"""
+        if self.is_dead and self.death_timer >= self.death_duration:
+            return  # Ne plus dessiner le boss si complètement mort
+        
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        if not self.sprite:
+            queue.draw('boss', self.draw_fallback, camera_x, camera_y)
+        elif self.rotation_angle != 0:
+            queue.blit_rotated('boss', self.sprite, self.rotation_angle,
+                               (screen_x + self.size//2, screen_y + self.size//2))
+        else:
+            queue.blit('boss', self.sprite, (screen_x, screen_y))
+        
+        if not self.is_dead:
+            queue.draw('boss', self.draw_health_bar, camera_x, camera_y)
+    
+    def draw_health_bar(self, screen, camera_x=0, camera_y=0, scale=1.0):
+        """Dessine la barre de vie et le pourcentage au-dessus du boss (scale : échelle de la surface)"""
+        screen_x = (self.x - camera_x) * scale
+        screen_y = (self.y - camera_y) * scale
+        bar_width = int(self.size * scale)
+        bar_height = max(2, round(8 * scale))
+        bar_y = int(screen_y - 15 * scale)
+        health_ratio = self.health / self.max_health
+        
+        # Contour de la barre
+        pygame.draw.rect(screen, self.config.WHITE,
+                       (int(screen_x), bar_y, bar_width, bar_height), 2)
+        
+        # Fond rouge
+        pygame.draw.rect(screen, self.config.RED,
+                       (int(screen_x), bar_y, bar_width, bar_height))
+        
+        # Santé actuelle
+        current_width = int(bar_width * health_ratio)
+        pygame.draw.rect(screen, self.config.GREEN,
+                       (int(screen_x), bar_y, current_width, bar_height))
+        
+        # Afficher le pourcentage de vie (police à la taille de la surface de dessin)
+        health_percent = int(health_ratio * 100)
+        font = FontRegistry.get(max(8, round(24 * scale)))
+        text = font.render(f"BOSS: {health_percent}%", True, self.config.WHITE)
+        text_rect = text.get_rect(center=(screen_x + bar_width//2, screen_y - 25 * scale))
+        screen.blit(text, text_rect)
 
 class CanonProjectile:
     """Classe des projectiles du canon"""
     
+    # Sprites pré-rendus par extrémité du trait {(dx, dy) arrondis: (surface, origine)}
+    _sprites = {}
+    
     def __init__(self, x, y, dx, dy, config):
         self.x = x
         self.y = y
@@ -823,23 +894,45 @@ class CanonProjectile:
         self.x += self.dx * self.speed
         self.y += self.dy * self.speed
     
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0, camera_y=0):
         """Dessine le projectile du canon"""
+        # Position à l'écran (la caméra est passée explicitement, l'entité n'est pas modifiée)
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
         # Ligne principale (trait d'énergie)
-        end_x = self.x + self.dx * 20
-        end_y = self.y + self.dy * 20
+        end_x = screen_x + self.dx * 20
+        end_y = screen_y + self.dy * 20
         
         pygame.draw.line(screen, self.config.YELLOW,
-                        (int(self.x), int(self.y)),
+                        (int(screen_x), int(screen_y)),
                         (int(end_x), int(end_y)), 2)
         
         # Point lumineux au centre
         pygame.draw.circle(screen, self.config.WHITE,
-                         (int(self.x), int(self.y)), self.size)
+                         (int(screen_x), int(screen_y)), self.size)
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet le projectile pré-rendu (trait et point lumineux) en blit groupé"""
+        trail = (round(self.dx * 20), round(self.dy * 20))
+        sprite = self._sprites.get(trail)
+        if sprite is None:
+            # Origine du projectile dans le sprite : marge du point lumineux côté opposé au trait
+            margin = self.size + 1
+            origin = (margin + max(0, -trail[0]), margin + max(0, -trail[1]))
+            surface = pygame.Surface((abs(trail[0]) + 2 * margin + 1, abs(trail[1]) + 2 * margin + 1), pygame.SRCALPHA)
+            pygame.draw.line(surface, self.config.YELLOW, origin,
+                             (origin[0] + trail[0], origin[1] + trail[1]), 2)
+            pygame.draw.circle(surface, self.config.WHITE, origin, self.size)
+            sprite = self._sprites[trail] = (surface, origin)
+        surface, origin = sprite
+        queue.blit('projectiles', surface, (int(self.x - camera_x) - origin[0], int(self.y - camera_y) - origin[1]))
 
 class EnemyProjectile:
     """Classe des projectiles d'ennemis"""
     
+    _sprites = {}  # Sprites pré-rendus par taille de projectile
+    
     def __init__(self, x, y, target_x, target_y, config):
         self.x = x
         self.y = y
@@ -873,10 +966,22 @@ class EnemyProjectile:
         # Projectile rouge avec contour noir
         pygame.draw.circle(screen, (255, 100, 100), (screen_x, screen_y), self.size)
         pygame.draw.circle(screen, (100, 0, 0), (screen_x, screen_y), self.size, 2)
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet le projectile pré-rendu en blit groupé"""
+        radius = self.size + 1
+        sprite = self._sprites.get(self.size)
+        if sprite is None:
+            sprite = self._sprites[self.size] = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (255, 100, 100), (radius, radius), self.size)
+            pygame.draw.circle(sprite, (100, 0, 0), (radius, radius), self.size, 2)
+        queue.blit('projectiles', sprite, (int(self.x - camera_x) - radius, int(self.y - camera_y) - radius))
 
 class BossProjectile:
     """Classe des projectiles du boss - Gros et lents"""
     
+    _sprites = {}  # Sprites pré-rendus par taille de projectile
+    
     def __init__(self, x, y, target_x, target_y, config):
         self.x = x
         self.y = y
@@ -916,6 +1021,19 @@ class BossProjectile:
         pygame.draw.circle(screen, (255, 200, 100), (screen_x, screen_y), self.size - 8)
         # Contour noir
         pygame.draw.circle(screen, (50, 0, 0), (screen_x, screen_y), self.size, 3)
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet le projectile pré-rendu (avec sa lueur) en blit groupé"""
+        radius = self.size + 4
+        sprite = self._sprites.get(self.size)
+        if sprite is None:
+            sprite = self._sprites[self.size] = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            center = (radius, radius)
+            pygame.draw.circle(sprite, (255, 150, 0), center, self.size + 3)
+            pygame.draw.circle(sprite, (255, 80, 0), center, self.size)
+            pygame.draw.circle(sprite, (255, 200, 100), center, self.size - 8)
+            pygame.draw.circle(sprite, (50, 0, 0), center, self.size, 3)
+        queue.blit('projectiles', sprite, (int(self.x - camera_x) - radius, int(self.y - camera_y) - radius))
 
 class Lightning:
     """Classe pour les éclairs instantanés"""
@@ -957,51 +1075,83 @@ class Lightning:
             points.append((x, y))
         
         points.append((self.target_x, self.target_y))
+        
+        # Pré-rendre l'éclair une seule fois : chaque frame ne fait plus qu'un blit avec alpha
+        self._render_bolt_surface(points)
         return points
     
-    def update(self):
-        """Met à jour l'éclair"""
-        self.current_life -= 1
-        return self.current_life > 0
-    
-    def draw(self, screen, camera_x=0, camera_y=0):
-        """Dessine l'éclair avec effet de zigzag"""
-        if self.current_life <= 0:
-            return
-        
-        # Intensité basée sur la durée de vie restante
-        intensity = self.current_life / self.lifetime
-        
+    def _render_bolt_surface(self, points):
+        """Dessine le zigzag dans une surface ajustée à sa boîte englobante"""
         # Couleurs différentes selon le type d'éclair
         if self.is_chained:
             # Éclair chaîné : couleur violette/magenta
-            color = tuple(int(c * intensity) for c in (255, 100, 255))
-            secondary_color = tuple(int(c * intensity) for c in (200, 50, 200))
+            color = (255, 100, 255)
+            secondary_color = (200, 50, 200)
             thickness = 4  # Augmenté de 2 à 4
         else:
             # Éclair principal : couleur blanche/bleue
-            color = tuple(int(c * intensity) for c in self.config.LIGHTNING_COLOR)
-            secondary_color = tuple(int(c * intensity) for c in self.config.LIGHTNING_SECONDARY_COLOR)
+            color = tuple(self.config.LIGHTNING_COLOR)
+            secondary_color = tuple(self.config.LIGHTNING_SECONDARY_COLOR)
             thickness = 6  # Augmenté de 3 à 6
         
-        # Dessiner les segments de l'éclair avec ajustement de caméra
-        for i in range(len(self.points) - 1):
-            start_point = (int(self.points[i][0] - camera_x), int(self.points[i][1] - camera_y))
-            end_point = (int(self.points[i + 1][0] - camera_x), int(self.points[i + 1][1] - camera_y))
+        # Ligne centrale ultra-brillante
+        inner_color = tuple(min(255, int(c * 1.5)) for c in color)
+        
+        # Boîte englobante des points, élargie de l'épaisseur du trait
+        min_x = int(min(point[0] for point in points)) - thickness
+        min_y = int(min(point[1] for point in points)) - thickness
+        max_x = int(max(point[0] for point in points)) + thickness
+        max_y = int(max(point[1] for point in points)) + thickness
+        
+        # Position monde du coin haut-gauche de la surface
+        self.bolt_origin = (min_x, min_y)
+        self.bolt_surface = pygame.Surface((max_x - min_x + 1, max_y - min_y + 1), pygame.SRCALPHA)
+        
+        for i in range(len(points) - 1):
+            start_point = (int(points[i][0]) - min_x, int(points[i][1]) - min_y)
+            end_point = (int(points[i + 1][0]) - min_x, int(points[i + 1][1]) - min_y)
             
             # Ligne principale (plus épaisse)
-            pygame.draw.line(screen, color, start_point, end_point, thickness)
+            pygame.draw.line(self.bolt_surface, color, start_point, end_point, thickness)
             
             # Ligne secondaire pour l'effet de lueur (plus épaisse aussi)
-            pygame.draw.line(screen, secondary_color, start_point, end_point, thickness // 2)
+            pygame.draw.line(self.bolt_surface, secondary_color, start_point, end_point, thickness // 2)
             
             # Ligne centrale ultra-brillante
-            inner_color = tuple(min(255, int(c * 1.5)) for c in color)
-            pygame.draw.line(screen, inner_color, start_point, end_point, max(1, thickness // 3))
+            pygame.draw.line(self.bolt_surface, inner_color, start_point, end_point, max(1, thickness // 3))
+    
+    def get_bounds(self):
+        """Rectangle monde occupé par l'éclair pré-rendu"""
+        return pygame.Rect(self.bolt_origin, self.bolt_surface.get_size())
+    
+    def update(self):
+        """Met à jour l'éclair"""
+        self.current_life -= 1
+        return self.current_life > 0
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet l'éclair pré-rendu à la file de rendu (blit groupé)"""
+        if self.current_life <= 0:
+            return
+        self.bolt_surface.set_alpha(int(255 * self.current_life / self.lifetime))
+        queue.blit('effects', self.bolt_surface, (self.bolt_origin[0] - int(camera_x), self.bolt_origin[1] - int(camera_y)))
+    
+    def draw(self, screen, camera_x=0, camera_y=0):
+        """Dessine l'éclair pré-rendu avec un fondu basé sur la durée de vie restante"""
+        if self.current_life <= 0:
+            return
+        
+        # Intensité basée sur la durée de vie restante
+        intensity = self.current_life / self.lifetime
+        
+        self.bolt_surface.set_alpha(int(255 * intensity))
+        screen.blit(self.bolt_surface, (self.bolt_origin[0] - int(camera_x), self.bolt_origin[1] - int(camera_y)))
 
 class Particle:
     """Classe pour les particules d'explosion"""
     
+    _sprites = {}  # Sprites pré-rendus par (couleur atténuée, taille)
+    
     def __init__(self, x, y, config):
         self.x = x
         self.y = y
@@ -1040,8 +1190,12 @@ class Particle:
         
         return self.current_life > 0
     
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0, camera_y=0):
         """Dessine la particule"""
+        # Position à l'écran (la caméra est passée explicitement, l'entité n'est pas modifiée)
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
         if self.current_life <= 0:
             return
         
@@ -1052,7 +1206,21 @@ class Particle:
         color = tuple(int(c * alpha) for c in self.color)
         
         # Dessiner la particule
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
+        pygame.draw.circle(screen, color, (int(screen_x), int(screen_y)), self.size)
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet la particule pré-rendue (couleur atténuée selon la durée de vie) en blit groupé"""
+        if self.current_life <= 0:
+            return
+        alpha = self.current_life / self.lifetime
+        color = tuple(int(c * alpha) for c in self.color)
+        radius = self.size + 1
+        key = (color, self.size)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), self.size)
+        queue.blit('effects', sprite, (int(self.x - camera_x) - radius, int(self.y - camera_y) - radius))
 
 class WeldingParticle:
     """Classe pour les particules de soudure (effet du Beam)"""
@@ -1119,8 +1287,15 @@ class WeldingParticle:
         
         return self.current_life > 0
     
-    def draw(self, screen):
-        """Dessine la particule de soudure avec effet TRÈS brillant"""
+    def draw(self, screen, camera_x=0, camera_y=0, scale=1.0):
+        """Dessine la particule de soudure avec effet TRÈS brillant
+        
+        scale : échelle de la surface de dessin (les étincelles gardent au moins 1 pixel)
+        """
+        # Position à l'écran (la caméra est passée explicitement, l'entité n'est pas modifiée)
+        screen_x = (self.x - camera_x) * scale
+        screen_y = (self.y - camera_y) * scale
+        
         if self.current_life <= 0:
             return
         
@@ -1136,7 +1311,7 @@ class WeldingParticle:
         color = tuple(min(255, int(c * alpha * brightness_multiplier)) for c in self.color)
         
         # Dessiner la particule avec effet de halo INTENSE mais adapté à la petite taille
-        center_x, center_y = int(self.x), int(self.y)
+        center_x, center_y = int(screen_x), int(screen_y)
         
         if self.config.ENABLE_ANTIALIASING:
             # Version avec antialiasing - effet de halo réduit pour petites particules
@@ -1171,6 +1346,8 @@ class WeldingParticle:
 class EnergyOrb:
     """Classe pour les boules d'énergie qui orbitent autour du joueur"""
     
+    _sprites = {}  # Sprites pré-rendus par (couleur du noyau, couleur de l'aura, taille)
+    
     def __init__(self, player_x, player_y, orb_index, total_orbs, config):
         self.config = config
         self.orb_index = orb_index
@@ -1214,8 +1391,12 @@ class EnergyOrb:
         
         return True  # Les orbes persistent maintenant
     
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0, camera_y=0):
         """Dessine la boule d'énergie avec effet de lueur"""
+        # Position à l'écran (la caméra est passée explicitement, l'entité n'est pas modifiée)
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
         # Intensité basée sur la pulsation (plus de diminution due à la durée de vie)
         intensity = self.pulse_intensity
         
@@ -1225,14 +1406,30 @@ class EnergyOrb:
         
         # Dessiner l'aura (cercle plus grand, semi-transparent)
         aura_size = int(self.size * 1.5)
-        pygame.draw.circle(screen, glow_color, (int(self.x), int(self.y)), aura_size)
+        pygame.draw.circle(screen, glow_color, (int(screen_x), int(screen_y)), aura_size)
         
         # Dessiner le noyau principal
-        pygame.draw.circle(screen, core_color, (int(self.x), int(self.y)), self.size)
+        pygame.draw.circle(screen, core_color, (int(screen_x), int(screen_y)), self.size)
         
         # Dessiner le point lumineux central
         center_color = tuple(min(255, int(c * 1.2)) for c in self.config.WHITE)
-        pygame.draw.circle(screen, center_color, (int(self.x), int(self.y)), self.size // 2)
+        pygame.draw.circle(screen, center_color, (int(screen_x), int(screen_y)), self.size // 2)
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet l'orbe pré-rendu (par intensité de pulsation) en blit groupé"""
+        core_color = tuple(int(c * self.pulse_intensity) for c in self.config.ENERGY_ORB_COLOR)
+        glow_color = tuple(int(c * self.pulse_intensity * 0.7) for c in self.config.ENERGY_ORB_GLOW_COLOR)
+        radius = int(self.size * 1.5) + 1
+        key = (core_color, glow_color, self.size)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            center = (radius, radius)
+            pygame.draw.circle(sprite, glow_color, center, int(self.size * 1.5))
+            pygame.draw.circle(sprite, core_color, center, self.size)
+            center_color = tuple(min(255, int(c * 1.2)) for c in self.config.WHITE)
+            pygame.draw.circle(sprite, center_color, center, self.size // 2)
+        queue.blit('effects', sprite, (int(self.x - camera_x) - radius, int(self.y - camera_y) - radius))
     
     def get_collision_rect(self):
         """Retourne le rectangle de collision"""
@@ -1527,8 +1724,9 @@ class Beam:
                 impact_x = enemy_center_x
                 impact_y = enemy_center_y
                 
-                # OPTIMISATION : Réduire la fréquence des particules (÷4)
-                if game and self.particle_timer % 16 == 0:  # Toutes les 16 frames au lieu de 4
+                # Fréquence des gerbes de soudure selon la qualité des effets (16 frames en "high")
+                welding_interval = self.config.EFFECT_QUALITY_LEVELS[self.config.EFFECT_QUALITY]["welding_interval"]
+                if game and self.particle_timer % welding_interval == 0:
                     game.create_welding_particles(impact_x, impact_y, 
                                                  current_direction_x, 
                                                  current_direction_y)
@@ -1630,8 +1828,8 @@ class Beam:
         """Projette un point sur la ligne et retourne la position normalisée (0-1) - VERSION LEGACY"""
         return self.project_point_on_line_optimized(px, py)
     
-    def draw(self, screen, camera_x=0, camera_y=0):
-        """Dessine le rayon laser avec effet néon bleu optimisé"""
+    def draw(self, screen, camera_x=0, camera_y=0, scale=1.0):
+        """Dessine le rayon laser avec effet néon bleu optimisé (scale : échelle de la surface de dessin)"""
         # Intensité constante pour l'effet néon persistant
         intensity = 1.0
         
@@ -1641,28 +1839,28 @@ class Beam:
         core_color = tuple(int(c * intensity) for c in (255, 255, 255))  # Blanc pur pour le centre
         
         # Points ajustés pour la caméra (utiliser les coordonnées actuelles)
-        start_point = (int(self.start_x - camera_x), int(self.start_y - camera_y))
-        end_point = (int(self.end_x - camera_x), int(self.end_y - camera_y))
+        start_point = (int((self.start_x - camera_x) * scale), int((self.start_y - camera_y) * scale))
+        end_point = (int((self.end_x - camera_x) * scale), int((self.end_y - camera_y) * scale))
         
         # Utiliser la surface statique pour l'effet de halo (OPTIMISATION MAJEURE)
         halo_surface = self._get_halo_surface(screen)
         halo_surface.fill((0, 0, 0, 0))  # Effacer le contenu précédent
-        halo_width = int(self.width + 8)
+        halo_width = int((self.width + 8) * scale)
         if halo_width > 0:
             pygame.draw.line(halo_surface, halo_color, start_point, end_point, halo_width)
             screen.blit(halo_surface, (0, 0))
         
         # Dessiner la couche périphérique (bleu clair)
         if self.width > 2:
-            pygame.draw.line(screen, edge_color, start_point, end_point, int(self.width))
+            pygame.draw.line(screen, edge_color, start_point, end_point, max(1, int(self.width * scale)))
         
         # Dessiner le cœur du laser (blanc, plus fin)
         core_width = max(2, int(self.width * 0.5))
-        pygame.draw.line(screen, core_color, start_point, end_point, core_width)
+        pygame.draw.line(screen, core_color, start_point, end_point, max(1, int(core_width * scale)))
         
         # Point lumineux au départ (effet néon)
-        pygame.draw.circle(screen, core_color, start_point, max(3, int(self.width * 0.4)))
-        pygame.draw.circle(screen, edge_color, start_point, max(5, int(self.width * 0.6)))
+        pygame.draw.circle(screen, core_color, start_point, int(max(3, int(self.width * 0.4)) * scale))
+        pygame.draw.circle(screen, edge_color, start_point, int(max(5, int(self.width * 0.6)) * scale))
 
 class DeathEffect:
     """Effet spécial pour la mort des ennemis spéciaux"""
@@ -1688,14 +1886,11 @@ class DeathEffect:
         
         # Charger le sprite mort.png
         try:
-            self.sprite = pygame.image.load("assets/enemy/mort.png").convert_alpha()
-            # Redimensionner le sprite (par exemple à la taille d'un ennemi spécial)
+            # Sprite redimensionné (par exemple à la taille d'un ennemi spécial)
             sprite_size = config.ENEMY_SIZE * 2  # Taille d'un ennemi spécial
-            if config.SPRITE_SMOOTHING:
-                self.sprite = pygame.transform.smoothscale(self.sprite, (sprite_size, sprite_size))
-            else:
-                self.sprite = pygame.transform.scale(self.sprite, (sprite_size, sprite_size))
-            self.sprite = self.sprite.convert_alpha()
+            self.sprite = AssetCache.get_image("assets/enemy/mort.png", (sprite_size, sprite_size), config.SPRITE_SMOOTHING)
+            # Copie propre à l'effet : son alpha change à chaque frame sans toucher au sprite partagé
+            self.faded_sprite = self.sprite.copy()
             self.has_sprite = True
         except (pygame.error, FileNotFoundError):
             print("Sprite assets/enemy/mort.png non trouvé, utilisation d'un effet par défaut")
@@ -1739,25 +1934,40 @@ class DeathEffect:
         screen_y = self.y - camera_y
         
         if self.has_sprite:
-            # Créer une copie du sprite avec l'alpha approprié
-            sprite_with_alpha = self.sprite.copy()
-            sprite_with_alpha.set_alpha(self.alpha)
+            # Appliquer l'alpha à la copie propre à l'effet
+            self.faded_sprite.set_alpha(self.alpha)
             
             # Centrer le sprite
-            sprite_rect = sprite_with_alpha.get_rect()
+            sprite_rect = self.faded_sprite.get_rect()
             sprite_rect.center = (screen_x, screen_y)
             
-            screen.blit(sprite_with_alpha, sprite_rect)
+            screen.blit(self.faded_sprite, sprite_rect)
         else:
-            # Effet par défaut si le sprite n'est pas disponible
-            # Cercle rouge qui disparaît
-            radius = max(10, 30 - int(20 * (self.life_time / self.total_duration)))
-            color = (255, 0, 0, self.alpha)  # Rouge avec alpha
-            
-            # Créer une surface temporaire pour l'alpha
-            temp_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, color, (radius, radius), radius)
-            screen.blit(temp_surface, (screen_x - radius, screen_y - radius))
+            self.draw_fallback(screen, camera_x, camera_y)
+    
+    def draw_fallback(self, screen, camera_x, camera_y, scale=1.0):
+        """Effet par défaut si le sprite n'est pas disponible (scale : échelle de la surface de dessin)"""
+        # Cercle rouge qui disparaît
+        radius = max(10, 30 - int(20 * (self.life_time / self.total_duration)))
+        radius = max(1, int(radius * scale))
+        color = (255, 0, 0, self.alpha)  # Rouge avec alpha
+        
+        # Créer une surface temporaire pour l'alpha
+        temp_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(temp_surface, color, (radius, radius), radius)
+        screen.blit(temp_surface, ((self.x - camera_x) * scale - radius, (self.y - camera_y) * scale - radius))
+    
+    def submit(self, queue, camera_x, camera_y):
+        """Soumet l'effet à la file de rendu (sprite à l'alpha courant en blit groupé)"""
+        if self.is_finished or self.alpha <= 0:
+            return
+        if not self.has_sprite:
+            queue.draw('effects', self.draw_fallback, camera_x, camera_y)
+            return
+        self.faded_sprite.set_alpha(self.alpha)
+        sprite_rect = self.faded_sprite.get_rect()
+        sprite_rect.center = (self.x - camera_x, self.y - camera_y)
+        queue.blit('effects', self.faded_sprite, sprite_rect)
 
 
 class BossDeathEffect:
@@ -1775,7 +1985,7 @@ class BossDeathEffect:
         
         # Créer plusieurs crânes qui partent dans toutes les directions
         self.skulls = []
-        skull_count = 15  # 15 crânes
+        skull_count = config.EFFECT_QUALITY_LEVELS[config.EFFECT_QUALITY]["boss_skulls"]  # 15 crânes en qualité "high"
         
         for i in range(skull_count):
             # Angle aléatoire pour chaque crâne
@@ -1801,14 +2011,9 @@ class BossDeathEffect:
         
         # Charger le sprite mort.png
         try:
-            self.sprite = pygame.image.load("assets/enemy/mort.png").convert_alpha()
-            # Redimensionner le sprite (taille d'ennemi normal pour les crânes du boss)
+            # Sprite redimensionné (taille d'ennemi normal pour les crânes du boss)
             sprite_size = config.ENEMY_SIZE
-            if config.SPRITE_SMOOTHING:
-                self.sprite = pygame.transform.smoothscale(self.sprite, (sprite_size, sprite_size))
-            else:
-                self.sprite = pygame.transform.scale(self.sprite, (sprite_size, sprite_size))
-            self.sprite = self.sprite.convert_alpha()
+            self.sprite = AssetCache.get_image("assets/enemy/mort.png", (sprite_size, sprite_size), config.SPRITE_SMOOTHING)
             self.has_sprite = True
         except (pygame.error, FileNotFoundError):
             print("Sprite assets/enemy/mort.png non trouvé pour BossDeathEffect")
@@ -1850,6 +2055,9 @@ class BossDeathEffect:
         """Dessine tous les crânes du boss"""
         if self.is_finished:
             return
+        if not self.has_sprite:
+            self.draw_fallback(screen, camera_x, camera_y)
+            return
         
         for skull in self.skulls:
             if skull['alpha'] <= 0:
@@ -1859,25 +2067,42 @@ class BossDeathEffect:
             screen_x = skull['x'] - camera_x
             screen_y = skull['y'] - camera_y
             
-            if self.has_sprite:
-                # Appliquer la rotation au sprite
-                rotated_sprite = pygame.transform.rotate(self.sprite, skull['rotation'])
-                rotated_sprite.set_alpha(skull['alpha'])
-                
-                # Centrer le sprite après rotation
-                sprite_rect = rotated_sprite.get_rect()
-                sprite_rect.center = (screen_x, screen_y)
-                
-                screen.blit(rotated_sprite, sprite_rect)
-            else:
-                # Effet par défaut si le sprite n'est pas disponible
-                radius = 15
-                color = (255, 0, 0, skull['alpha'])  # Rouge avec alpha
-                
-                # Créer une surface temporaire pour l'alpha
-                temp_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(temp_surface, color, (radius, radius), radius)
-                screen.blit(temp_surface, (screen_x - radius, screen_y - radius))
+            # Appliquer la rotation au sprite
+            rotated_sprite = pygame.transform.rotate(self.sprite, skull['rotation'])
+            rotated_sprite.set_alpha(skull['alpha'])
+            
+            # Centrer le sprite après rotation
+            sprite_rect = rotated_sprite.get_rect()
+            sprite_rect.center = (screen_x, screen_y)
+            
+            screen.blit(rotated_sprite, sprite_rect)
+    
+    def draw_fallback(self, screen, camera_x, camera_y, scale=1.0):
+        """Effet par défaut si le sprite n'est pas disponible (scale : échelle de la surface de dessin)"""
+        radius = max(1, int(15 * scale))
+        for skull in self.skulls:
+            if skull['alpha'] <= 0:
+                continue
+            color = (255, 0, 0, skull['alpha'])  # Rouge avec alpha
+            
+            # Créer une surface temporaire pour l'alpha
+            temp_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(temp_surface, color, (radius, radius), radius)
+            screen.blit(temp_surface, ((skull['x'] - camera_x) * scale - radius,
+                                       (skull['y'] - camera_y) * scale - radius))
+    
+    def submit(self, queue, camera_x, camera_y):
+        """Soumet les crânes (tournés, à leur alpha) à la file de rendu en blits groupés"""
+        if self.is_finished:
+            return
+        if not self.has_sprite:
+            queue.draw('effects', self.draw_fallback, camera_x, camera_y)
+            return
+        for skull in self.skulls:
+            if skull['alpha'] <= 0:
+                continue
+            queue.blit_rotated('effects', self.sprite, skull['rotation'],
+                               (skull['x'] - camera_x, skull['y'] - camera_y), skull['alpha'])
 
 
 class Collectible:
@@ -1920,10 +2145,14 @@ class Collectible:
                 # Collecté ! 
                 self.is_collected = True
     
-    def draw(self, screen, camera_x, camera_y):
-        """Dessine l'objet collectible (à redéfinir dans les sous-classes)"""
+    def draw(self, screen, camera_x, camera_y, scale=1.0):
+        """Dessine l'objet collectible (à redéfinir dans les sous-classes, scale : échelle de la surface)"""
         pass
     
+    def submit(self, queue, camera_x, camera_y):
+        """Soumet l'objet à la file de rendu (par défaut : appel de draw à l'échelle de rendu)"""
+        queue.draw('collectibles', self.draw, camera_x, camera_y)
+    
     def on_collect(self, player):
         """Effet appliqué au joueur lors de la collecte (à redéfinir dans les sous-classes)"""
         pass
@@ -1931,17 +2160,19 @@ class Collectible:
 class Heart(Collectible):
     """Objet collectible coeur qui restaure la vie"""
     
+    _pulse_images = {}  # Coeur redimensionné par taille de pulsation (partagé entre coeurs)
+    SIZE = 24  # Taille du coeur
+    
     def __init__(self, x, y, config):
         super().__init__(x, y, config)
-        self.size = 24  # Taille du coeur
+        self.size = self.SIZE
         self.pulse_timer = 0
         self.pulse_scale = 1.0
         
         # Charger le sprite du coeur
         try:
-            self.image = pygame.image.load("assets/drops/heart.png").convert_alpha()
-            # Redimensionner le coeur
-            self.image = pygame.transform.scale(self.image, (self.size, self.size))
+            # Coeur redimensionné (préchargé, partagé entre coeurs)
+            self.image = AssetCache.get_image("assets/drops/heart.png", (self.size, self.size), smooth=False)
             self.has_image = True
         except (pygame.error, FileNotFoundError):
             print("Image assets/drops/heart.png non trouvée, utilisation du rendu par défaut")
@@ -1962,18 +2193,41 @@ class Heart(Collectible):
         
         if self.has_image:
             # Appliquer l'effet de pulsation
-            scaled_size = int(self.size * self.pulse_scale)
-            scaled_image = pygame.transform.scale(self.image, (scaled_size, scaled_size))
+            scaled_image = self.get_pulse_image()
             
             # Centrer l'image
             image_rect = scaled_image.get_rect()
             image_rect.center = (screen_x, screen_y)
             screen.blit(scaled_image, image_rect)
         else:
-            # Rendu par défaut : coeur rouge
-            scaled_size = int(self.size * self.pulse_scale)
-            pygame.draw.circle(screen, (255, 0, 0), (screen_x, screen_y), scaled_size // 2)
-            pygame.draw.circle(screen, (255, 100, 100), (screen_x, screen_y), scaled_size // 4)
+            self.draw_fallback(screen, camera_x, camera_y)
+    
+    def draw_fallback(self, screen, camera_x, camera_y, scale=1.0):
+        """Rendu par défaut : coeur rouge (scale : échelle de la surface de dessin)"""
+        screen_x = int((self.x - camera_x) * scale)
+        screen_y = int((self.y - camera_y) * scale)
+        scaled_size = int(self.size * self.pulse_scale * scale)
+        pygame.draw.circle(screen, (255, 0, 0), (screen_x, screen_y), scaled_size // 2)
+        pygame.draw.circle(screen, (255, 100, 100), (screen_x, screen_y), scaled_size // 4)
+    
+    def get_pulse_image(self):
+        """Coeur à la taille de pulsation courante (redimensionné une fois par taille)"""
+        scaled_size = int(self.size * self.pulse_scale)
+        scaled_image = self._pulse_images.get(scaled_size)
+        if scaled_image is None:
+            scaled_image = pygame.transform.scale(self.image, (scaled_size, scaled_size))
+            self._pulse_images[scaled_size] = scaled_image
+        return scaled_image
+    
+    def submit(self, queue, camera_x, camera_y):
+        """Soumet le coeur pulsant en blit groupé"""
+        if not self.has_image:
+            queue.draw('collectibles', self.draw_fallback, camera_x, camera_y)
+            return
+        scaled_image = self.get_pulse_image()
+        image_rect = scaled_image.get_rect()
+        image_rect.center = (int(self.x - camera_x), int(self.y - camera_y))
+        queue.blit('collectibles', scaled_image, image_rect)
     
     def on_collect(self, player, game=None):
         """Restaure la vie du joueur"""
@@ -1988,9 +2242,13 @@ class Heart(Collectible):
 class Coin(Collectible):
     """Objet collectible pièce animée qui donne des points/monnaie"""
     
+    SIZE = 32  # Taille de la pièce
+    FRAME_COUNT = 6  # Sprites horizontaux de assets/drops/coin.png
+    animation_logged = False  # Chargement de l'animation annoncé une seule fois (pas à chaque pièce)
+    
     def __init__(self, x, y, config, throw_direction=None):
         super().__init__(x, y, config)
-        self.size = 32  # Taille de la pièce
+        self.size = self.SIZE
         self.animation_timer = 0
         self.current_frame = 0
         self.frames_per_sprite = config.COIN_ANIMATION_SPEED  # Utiliser la config
@@ -2018,27 +2276,13 @@ class Coin(Collectible):
         
         # Charger les sprites de la pièce animée
         try:
-            # Charger l'image complète
-            full_image = pygame.image.load("assets/drops/coin.png").convert_alpha()
-            image_width = full_image.get_width()
-            image_height = full_image.get_height()
-            
-            # Calculer la taille de chaque frame (6 sprites horizontaux)
-            frame_width = image_width // 6
-            frame_height = image_height
-            
-            # Extraire chaque frame
-            for i in range(6):
-                frame_rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
-                frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame_surface.blit(full_image, (0, 0), frame_rect)
-                
-                # Redimensionner la frame à la taille désirée
-                scaled_frame = pygame.transform.scale(frame_surface, (self.size, self.size))
-                self.sprite_frames.append(scaled_frame)
+            # Sprites horizontaux, redimensionnés une fois pour toutes les pièces (cache disque)
+            self.sprite_frames = AssetCache.get_frames("assets/drops/coin.png", self.FRAME_COUNT, self.size, smooth=False)
             
             self.has_animation = True
-            print(f"🪙 Animation de pièce chargée : {len(self.sprite_frames)} frames")
+            if not Coin.animation_logged:
+                Coin.animation_logged = True
+                print(f"🪙 Animation de pièce chargée : {len(self.sprite_frames)} frames")
             
         except (pygame.error, FileNotFoundError):
             print("Image assets/drops/coin.png non trouvée, utilisation du rendu par défaut")
@@ -2086,10 +2330,26 @@ class Coin(Collectible):
             image_rect.center = (screen_x, screen_y)
             screen.blit(current_sprite, image_rect)
         else:
-            # Rendu par défaut : cercle doré
-            pygame.draw.circle(screen, (255, 215, 0), (screen_x, screen_y), self.size // 2)
-            pygame.draw.circle(screen, (255, 255, 0), (screen_x, screen_y), self.size // 3)
-            pygame.draw.circle(screen, (255, 215, 0), (screen_x, screen_y), self.size // 6)
+            self.draw_fallback(screen, camera_x, camera_y)
+    
+    def draw_fallback(self, screen, camera_x, camera_y, scale=1.0):
+        """Rendu par défaut : cercle doré (scale : échelle de la surface de dessin)"""
+        screen_x = int((self.x - camera_x) * scale)
+        screen_y = int((self.y - camera_y) * scale)
+        size = int(self.size * scale)
+        pygame.draw.circle(screen, (255, 215, 0), (screen_x, screen_y), size // 2)
+        pygame.draw.circle(screen, (255, 255, 0), (screen_x, screen_y), size // 3)
+        pygame.draw.circle(screen, (255, 215, 0), (screen_x, screen_y), size // 6)
+    
+    def submit(self, queue, camera_x, camera_y):
+        """Soumet la frame courante de la pièce en blit groupé"""
+        if not (self.has_animation and self.sprite_frames):
+            queue.draw('collectibles', self.draw_fallback, camera_x, camera_y)
+            return
+        current_sprite = self.sprite_frames[self.current_frame]
+        image_rect = current_sprite.get_rect()
+        image_rect.center = (int(self.x - camera_x), int(self.y - camera_y))
+        queue.blit('collectibles', current_sprite, image_rect)
     
     def on_collect(self, player, game=None):
         """Donne des points/monnaie au joueur et met à jour la progression"""
@@ -2134,6 +2394,8 @@ class OrbDeathEffect:
         # Position actuelle
         self.x = self.original_x
         self.y = self.original_y
+        
+        self.tinted_surface = None  # Sprite teinté, composé au premier dessin
     
     def update(self):
         """Met à jour l'effet de mort"""
@@ -2153,32 +2415,256 @@ class OrbDeathEffect:
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y - camera_y)
         
-        # Calcul de l'alpha pour le fade
-        alpha = int(255 * (self.current_life / self.max_life))
+        screen.blit(self.get_faded_surface(), (screen_x, screen_y))
+    
+    def get_faded_surface(self):
+        """Sprite teinté (composé une seule fois par effet) à l'alpha du fade courant"""
+        if self.tinted_surface is None:
+            self.tinted_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            if self.sprite and self.config.SPRITE_SMOOTHING:
+                # Sprite avec teinte rouge
+                self.tinted_surface.blit(self.sprite, (0, 0))
+                red_overlay = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+                red_overlay.fill((*self.config.ORB_DEATH_COLOR_TINT, 128))  # 50% de rouge
+                self.tinted_surface.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
+            else:
+                # Rendu de fallback avec rectangle rouge qui fade
+                self.tinted_surface.fill((*self.config.ORB_DEATH_COLOR_TINT, 255))
         
-        if self.sprite and self.config.SPRITE_SMOOTHING:
-            # Créer une surface temporaire avec teinte rouge et fade
-            temp_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            temp_surface.blit(self.sprite, (0, 0))
-            
-            # Appliquer la teinte rouge
-            red_overlay = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            red_overlay.fill((*self.config.ORB_DEATH_COLOR_TINT, 128))  # 50% de rouge
-            temp_surface.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-            
-            # Appliquer l'alpha
-            temp_surface.set_alpha(alpha)
-            
-            screen.blit(temp_surface, (screen_x, screen_y))
+        # Calcul de l'alpha pour le fade
+        self.tinted_surface.set_alpha(int(255 * (self.current_life / self.max_life)))
+        return self.tinted_surface
+    
+    def submit(self, queue, camera_x=0, camera_y=0):
+        """Soumet le sprite teinté à l'alpha courant en blit groupé"""
+        queue.blit('effects', self.get_faded_surface(), (int(self.x - camera_x), int(self.y - camera_y)))
+
+class AshPool:
+    """Pool partagé des particules de cendres de tous les BeamDeathEffect actifs
+
+    Les particules sont stockées dans des tableaux NumPy (une colonne par attribut)
+    mis à jour en une seule passe vectorisée par frame et dessinés en un seul appel
+    blits de carrés pré-rendus (un par taille et par niveau d'opacité).
+    """
+
+    GRAVITY = 0.08  # Gravité légère appliquée à la vitesse verticale
+    MAX_LIFE = 120  # Durée de vie maximale d'une cendre (frames)
+    COLOR = (40, 40, 40)  # Gris très foncé (cendres)
+    ALPHA_LEVELS = 32  # Niveaux d'opacité des carrés pré-rendus
+    _squares = []  # Carrés pré-rendus (voir _get_squares)
+
+    # Colonnes du pool et leur type (land : vie à laquelle la cendre se pose au sol, 0 = jamais)
+    FIELDS = (("x", np.float32), ("y", np.float32), ("vel_x", np.float32), ("vel_y", np.float32),
+              ("size", np.int32), ("life", np.int32), ("land", np.int32), ("owner", np.int32))
+    MIN_CAPACITY = 256  # Capacité initiale des tableaux (doublée quand elle est atteinte)
+
+    # Tableaux alloués à capacité fixe ; les particules vivantes occupent les live premières cases
+    storage = {name: np.zeros(0, dtype=dtype) for name, dtype in FIELDS}
+    live = 0
+
+    # Vues sur les particules vivantes (une entrée par particule)
+    x = storage["x"]
+    y = storage["y"]
+    vel_x = storage["vel_x"]
+    vel_y = storage["vel_y"]
+    size = storage["size"]
+    life = storage["life"]
+    land = storage["land"]
+    owner = storage["owner"]
+
+    # Propriétaires ayant encore des particules vivantes
+    alive_owners = set()
+    next_owner_id = 0
+
+    @classmethod
+    def new_owner(cls):
+        """Réserve un identifiant pour un nouvel effet de désintégration"""
+        cls.next_owner_id += 1
+        return cls.next_owner_id
+
+    @classmethod
+    def spawn(cls, owner_id, xs, ys, vel_x_range, size_range, flight_frames=None):
+        """Ajoute un lot de particules avec vitesses, tailles et durées tirées en bloc
+
+        Avec flight_frames, chaque cendre se pose au sol après au plus flight_frames
+        frames de vol, avant d'avoir pâli (voir update(collect_landed=True)).
+        """
+        count = len(xs)
+        if count == 0:
+            return
+        cls._reserve(count)
+        # Écriture directe dans la fin libre des tableaux (pas de copie du pool existant)
+        tail = slice(cls.live, cls.live + count)
+        storage = cls.storage
+        storage["x"][tail] = xs
+        storage["y"][tail] = ys
+        storage["vel_x"][tail] = np.random.uniform(vel_x_range[0], vel_x_range[1], count)
+        storage["vel_y"][tail] = np.random.uniform(0.5, 2.0, count)
+        storage["size"][tail] = np.random.randint(size_range[0], size_range[1] + 1, count)
+        storage["life"][tail] = np.random.randint(60, cls.MAX_LIFE + 1, count)
+        if flight_frames:
+            flight = np.random.randint(flight_frames // 2, flight_frames + 1, count)
+            storage["land"][tail] = storage["life"][tail] - flight
         else:
-            # Rendu de fallback avec rectangle rouge qui fade
-            rect_color = (*self.config.ORB_DEATH_COLOR_TINT, alpha)
-            temp_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            temp_surface.fill(rect_color)
-            screen.blit(temp_surface, (screen_x, screen_y))
+            storage["land"][tail] = 0
+        storage["owner"][tail] = owner_id
+        cls._set_live(cls.live + count)
+        cls.alive_owners.add(owner_id)
+
+    @classmethod
+    def _reserve(cls, count):
+        """Garantit la place pour count particules de plus (croissance géométrique)"""
+        needed = cls.live + count
+        capacity = cls.storage["x"].size
+        if needed <= capacity:
+            return
+        capacity = max(cls.MIN_CAPACITY, capacity * 2, needed)
+        for name, dtype in cls.FIELDS:
+            grown = np.zeros(capacity, dtype=dtype)
+            grown[:cls.live] = cls.storage[name][:cls.live]
+            cls.storage[name] = grown
+        cls._set_live(cls.live)
+
+    @classmethod
+    def _set_live(cls, live):
+        """Fixe le nombre de particules vivantes et met à jour les vues x, y, ..."""
+        cls.live = live
+        for name, _ in cls.FIELDS:
+            setattr(cls, name, cls.storage[name][:live])
+
+    @classmethod
+    def update(cls, collect_landed=False):
+        """Met à jour toutes les cendres en une seule passe vectorisée (une fois par frame)
+
+        Avec collect_landed, les cendres qui atteignent leur vie d'atterrissage quittent le
+        pool et sont retournées (xs, ys, sizes, alphas), avec l'opacité qu'elles avaient à
+        l'écran, pour être posées dans la couche de traces au sol ; sinon retourne None et
+        toutes les cendres pâlissent jusqu'à s'éteindre.
+        """
+        if cls.x.size == 0:
+            return None
+        cls.x += cls.vel_x
+        cls.y += cls.vel_y
+        cls.vel_y += cls.GRAVITY
+        cls.life -= 1
+
+        # Compacter les tableaux pour ne garder que les particules vivantes (et en vol)
+        alive = cls.life > (cls.land if collect_landed else 0)
+        if alive.all():
+            return None
+        landed = None
+        if collect_landed:
+            landed_mask = ~alive & (cls.land > 0)
+            if landed_mask.any():
+                alphas = (cls.life[landed_mask] * 255 // cls.MAX_LIFE).astype(np.uint8)
+                landed = (cls.x[landed_mask], cls.y[landed_mask], cls.size[landed_mask], alphas)
+        cls._keep(alive)
+        return landed
+
+    @classmethod
+    def _keep(cls, mask):
+        """Ne conserve que les particules sélectionnées par le masque (compactage sur place)"""
+        kept = int(np.count_nonzero(mask))
+        for name, _ in cls.FIELDS:
+            cls.storage[name][:kept] = getattr(cls, name)[mask]
+        cls._set_live(kept)
+        cls.alive_owners = set(np.unique(cls.owner).tolist())
+
+    @classmethod
+    def remove_owners(cls, owner_ids):
+        """Supprime toutes les cendres des effets donnés (éviction par le budget d'effets)"""
+        if cls.x.size == 0 or not owner_ids:
+            return
+        cls._keep(~np.isin(cls.owner, list(owner_ids)))
+
+    @classmethod
+    def counts_by_owner(cls):
+        """Nombre de cendres vivantes par effet {owner_id: count}"""
+        owners, counts = np.unique(cls.owner, return_counts=True)
+        return dict(zip(owners.tolist(), counts.tolist()))
+
+    @classmethod
+    def is_alive(cls, owner_id):
+        """Indique si un effet possède encore des particules"""
+        return owner_id in cls.alive_owners
+
+    @classmethod
+    def count(cls):
+        """Nombre de particules de cendres actives"""
+        return int(cls.x.size)
+
+    @classmethod
+    def memory_usage(cls):
+        """Mémoire occupée par les tableaux de particules, capacité réservée comprise (octets)"""
+        return sum(array.nbytes for array in cls.storage.values())
+
+    @classmethod
+    def clear(cls):
+        """Supprime toutes les cendres (redémarrage de partie ; la capacité est conservée)"""
+        cls._set_live(0)
+        cls.alive_owners = set()
+
+    @classmethod
+    def draw(cls, screen, camera_x=0, camera_y=0, owner_id=None, scale=1.0):
+        """Dessine les cendres en blits groupés de carrés pré-rendus (scale : échelle de la surface)"""
+        if cls.x.size == 0:
+            return
+
+        screen_width, screen_height = screen.get_size()
+        screen_x = ((cls.x - camera_x) * scale).astype(np.int32)
+        screen_y = ((cls.y - camera_y) * scale).astype(np.int32)
+        sizes = cls.size if scale == 1.0 else np.maximum(1, (cls.size * scale).astype(np.int32))
+        alpha = cls.life.astype(np.float32) / cls.MAX_LIFE
+
+        # Ne garder que les particules visibles (et du propriétaire demandé)
+        visible = ((screen_x + sizes > 0) & (screen_x < screen_width) &
+                   (screen_y + sizes > 0) & (screen_y < screen_height))
+        if owner_id is not None:
+            visible &= cls.owner == owner_id
+        if not visible.any():
+            return
+
+        screen_x = screen_x[visible]
+        screen_y = screen_y[visible]
+        sizes = sizes[visible]
+        alpha = alpha[visible]
+
+        # Un carré pré-rendu par particule (taille et opacité arrondie) : les cendres qui se
+        # chevauchent s'assombrissent l'une l'autre comme des blits successifs
+        levels = (alpha * cls.ALPHA_LEVELS + 0.5).astype(np.int32)
+        squares = cls._get_squares(int(sizes.max()))
+        batch = list(zip([squares[key] for key in (sizes * (cls.ALPHA_LEVELS + 1) + levels).tolist()],
+                         zip(screen_x.tolist(), screen_y.tolist())))
+        if HAS_FBLITS:
+            screen.fblits(batch)
+        else:
+            screen.blits(batch, doreturn=False)
+
+    @classmethod
+    def _get_squares(cls, max_size):
+        """Carrés opaques de couleur COLOR jusqu'à max_size pixels, un par niveau d'opacité
+
+        Liste indexée par taille * (ALPHA_LEVELS + 1) + niveau, complétée à la demande.
+        """
+        levels = cls.ALPHA_LEVELS + 1
+        for index in range(len(cls._squares), (max_size + 1) * levels):
+            size, level = divmod(index, levels)
+            square = pygame.Surface((max(1, size), max(1, size)))
+            square.fill(cls.COLOR)
+            square.set_alpha(level * 255 // cls.ALPHA_LEVELS)
+            cls._squares.append(square)
+        return cls._squares
+
 
 class BeamDeathEffect:
-    """Effet de mort par beam : désintégration en cendres du sprite réel"""
+    """Effet de mort par beam : désintégration en cendres du sprite réel
+
+    Les particules sont stockées dans AshPool, partagé par tous les effets actifs.
+    """
+    
+    # Gabarits d'origine des cendres, par (sprite_id, taille) : offsets relatifs à l'ennemi
+    _ash_templates = {}
+    ASH_ALPHA_THRESHOLD = 64  # Alpha minimal pour qu'un pixel produise de la cendre
     
     def __init__(self, enemy, config):
         self.config = config
@@ -2186,114 +2672,79 @@ class BeamDeathEffect:
         self.y = enemy.y
         self.size = enemy.size
         self.sprite = enemy.sprite
+        self.sprite_id = getattr(enemy, 'sprite_id', None)
         
         # Générer les particules de cendres à partir des pixels du sprite
-        self.ash_particles = []
+        self.owner_id = AshPool.new_owner()
         self._generate_ash_from_sprite()
     
-    def _generate_ash_from_sprite(self):
-        """Génère les particules de cendres à partir des pixels du sprite de l'ennemi"""
-        if not self.sprite:
-            return
+    @classmethod
+    def _get_ash_template(cls, sprite, sprite_id, size):
+        """Retourne (et met en cache) les offsets des cendres pour un sprite à une taille donnée"""
+        key = (sprite_id, size)
+        if sprite_id is not None and key in cls._ash_templates:
+            return cls._ash_templates[key]
         
-        # Créer un masque noir du sprite
-        sprite_rect = self.sprite.get_rect()
+        sprite_width, sprite_height = sprite.get_size()
         
         # Échantillonner les pixels du sprite (pas tous pour éviter trop de particules)
-        sample_rate = max(1, self.size // 16)  # Échantillonner 1 pixel sur N
+        sample_rate = max(1, size // 16)  # Échantillonner 1 pixel sur N
+        
+        # Masque d'opacité échantillonné à partir du vrai canal alpha
+        alpha = pygame.surfarray.array_alpha(sprite)[::sample_rate, ::sample_rate]
+        sample_x, sample_y = np.nonzero(alpha >= cls.ASH_ALPHA_THRESHOLD)
+        
+        # Offsets relatifs au coin de l'ennemi, à l'échelle de sa taille
+        offsets_x = ((sample_x * sample_rate * size) // sprite_width).astype(np.float32)
+        offsets_y = ((sample_y * sample_rate * size) // sprite_height).astype(np.float32)
+        template = (offsets_x, offsets_y)
+        
+        if sprite_id is not None:
+            cls._ash_templates[key] = template
+        return template
+    
+    def _ash_step(self):
+        """Pas d'échantillonnage des cendres pour la densité du niveau de qualité actif"""
+        density = self.config.EFFECT_QUALITY_LEVELS[self.config.EFFECT_QUALITY]["ash_density"]
+        return max(1, round(1 / density))
+    
+    def _ash_flight_frames(self):
+        """Durée de vol max des cendres avant de se poser (mode traces au sol), sinon None"""
+        return self.config.GROUND_DECAL_ASH_LIFE if self.config.GROUND_DECALS else None
+    
+    def _generate_ash_from_sprite(self):
+        """Génère les particules de cendres en décalant le gabarit du sprite à la position de l'ennemi"""
+        if not self.sprite:
+            return
         
         try:
-            # Obtenir les données de pixels du sprite
-            sprite_array = pygame.surfarray.array3d(self.sprite)
+            offsets_x, offsets_y = self._get_ash_template(self.sprite, self.sprite_id, self.size)
+            
+            # Densité des cendres selon la qualité des effets (1 pixel sur step)
+            step = self._ash_step()
+            offsets_x, offsets_y = offsets_x[::step], offsets_y[::step]
             
-            for x in range(0, sprite_rect.width, sample_rate):
-                for y in range(0, sprite_rect.height, sample_rate):
-                    if x < sprite_array.shape[0] and y < sprite_array.shape[1]:
-                        # Vérifier si le pixel n'est pas transparent
-                        pixel_color = sprite_array[x, y]
-                        # Si le pixel a une couleur (pas transparent), créer une particule de cendre
-                        if not (pixel_color[0] == 0 and pixel_color[1] == 0 and pixel_color[2] == 0):
-                            # Position absolue de la particule
-                            world_x = self.x + (x * self.size) // sprite_rect.width
-                            world_y = self.y + (y * self.size) // sprite_rect.height
-                            
-                            particle = {
-                                'x': float(world_x),
-                                'y': float(world_y),
-                                'vel_x': random.uniform(-0.8, 0.8),  # Légère dérive horizontale
-                                'vel_y': random.uniform(0.5, 2.0),   # Vitesse de chute variable
-                                'size': random.randint(2, 4),        # Particules plus grosses pour meilleure visibilité
-                                'life': random.randint(60, 120),     # Durée de vie variable
-                                'max_life': 120,
-                                'color': (40, 40, 40)  # Gris très foncé (cendres)
-                            }
-                            self.ash_particles.append(particle)
+            # Légère dérive horizontale, particules de 2 à 4 px pour la visibilité
+            AshPool.spawn(self.owner_id, offsets_x + self.x, offsets_y + self.y, (-0.8, 0.8), (2, 4), self._ash_flight_frames())
         except Exception:
             # Si l'extraction des pixels échoue, utiliser l'ancienne méthode
             self._generate_fallback_ash()
     
     def _generate_fallback_ash(self):
         """Méthode de secours si l'extraction des pixels échoue"""
-        particle_count = self.config.BEAM_DEATH_ASH_COUNT
+        particle_count = self.config.BEAM_DEATH_ASH_COUNT // self._ash_step()
         
-        for _ in range(particle_count):
-            # Position aléatoire dans la zone de l'ennemi
-            offset_x = random.uniform(-self.size/2, self.size/2)
-            offset_y = random.uniform(-self.size/2, self.size/2)
-            
-            particle = {
-                'x': self.x + self.size/2 + offset_x,
-                'y': self.y + self.size/2 + offset_y,
-                'vel_x': random.uniform(-0.5, 0.5),
-                'vel_y': random.uniform(0.5, 2.0),
-                'size': random.randint(3, 5),  # Particules plus grosses pour la méthode de secours
-                'life': random.randint(60, 120),
-                'max_life': 120,
-                'color': (40, 40, 40)
-            }
-            self.ash_particles.append(particle)
+        # Positions aléatoires dans la zone de l'ennemi
+        xs = self.x + self.size / 2 + np.random.uniform(-self.size / 2, self.size / 2, particle_count)
+        ys = self.y + self.size / 2 + np.random.uniform(-self.size / 2, self.size / 2, particle_count)
+        
+        # Particules plus grosses pour la méthode de secours
+        AshPool.spawn(self.owner_id, xs, ys, (-0.5, 0.5), (3, 5), self._ash_flight_frames())
     
     def update(self):
-        """Met à jour les particules de cendres"""
-        active_particles = []
-        
-        for particle in self.ash_particles:
-            # Mise à jour de la position
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            
-            # Gravité légère pour un effet réaliste
-            particle['vel_y'] += 0.08
-            
-            # Diminuer la durée de vie
-            particle['life'] -= 1
-            
-            # Garder seulement les particules vivantes
-            if particle['life'] > 0:
-                active_particles.append(particle)
-        
-        self.ash_particles = active_particles
-        return len(self.ash_particles) > 0
+        """Indique si l'effet a encore des cendres (AshPool.update() fait la simulation)"""
+        return AshPool.is_alive(self.owner_id)
     
     def draw(self, screen, camera_x=0, camera_y=0):
-        """Dessine les particules de cendres"""
-        for particle in self.ash_particles:
-            screen_x = int(particle['x'] - camera_x)
-            screen_y = int(particle['y'] - camera_y)
-            
-            # Alpha basé sur la durée de vie restante pour effet de disparition
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            
-            # Couleur des cendres avec transparence
-            color = particle['color'] + (alpha,)
-            
-            # Dessiner la particule de cendre
-            if alpha > 0 and particle['size'] > 0:
-                try:
-                    temp_surface = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
-                    temp_surface.fill(color)
-                    screen.blit(temp_surface, (screen_x, screen_y))
-                except Exception:
-                    # Si le dessin échoue, utiliser un point simple
-                    pygame.draw.rect(screen, particle['color'], 
-                                   (screen_x, screen_y, particle['size'], particle['size']))
+        """Dessine uniquement les cendres de cet effet (préférer AshPool.draw pour tout dessiner)"""
+        AshPool.draw(screen, camera_x, camera_y, owner_id=self.owner_id)
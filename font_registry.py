@@ -0,0 +1,47 @@
+"""
+Registre des polices
+====================
+
+Les polices de tous les écrans (carte de démarrage, sélecteur de joueur, menus, jeu
+principal) sont partagées par (police, taille) : le fichier de police n'est ouvert et
+analysé qu'une fois par taille. Les tailles proportionnelles à Config.font_scale sont
+recréées seulement quand l'échelle change. Les compteurs (affichés avec F3 en jeu)
+permettent de vérifier qu'aucune police n'est créée à chaque frame.
+"""
+
+import pygame
+
+
+class FontRegistry:
+    """Polices partagées par tout le jeu, par (fichier de police ou None, taille)"""
+
+    fonts = {}  # {(fichier de police ou None, taille): pygame.font.Font}
+    font_scale = None  # Échelle des tailles proportionnelles actuellement en cache
+    created = 0  # Polices créées depuis le lancement
+    created_last_frame = 0  # Polices créées pendant la dernière frame
+    _created_at_frame_start = 0
+
+    @classmethod
+    def get(cls, size, face=None):
+        """Police de la taille donnée (face : fichier de police, None = police par défaut de pygame)"""
+        key = (face, size)
+        font = cls.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(face, size)
+            cls.fonts[key] = font
+            cls.created += 1
+        return font
+
+    @classmethod
+    def get_scaled(cls, config, base_size, face=None):
+        """Police de taille base_size x Config.font_scale (registre vidé si l'échelle a changé)"""
+        if cls.font_scale is not None and config.font_scale != cls.font_scale:
+            cls.fonts.clear()
+        cls.font_scale = config.font_scale
+        return cls.get(int(base_size * config.font_scale), face)
+
+    @classmethod
+    def end_frame(cls):
+        """Clôt les compteurs de la frame (appelé une fois par frame par GameManager)"""
+        cls.created_last_frame = cls.created - cls._created_at_frame_start
+        cls._created_at_frame_start = cls.created
@@ -2,35 +2,57 @@ import pygame
 import pygame.gfxdraw  # Pour l'antialiasing
 import random
 import math
-from entities import Player, Enemy, Boss, CanonProjectile, Lightning, Particle, WeldingParticle, EnergyOrb, BonusManager, Beam, DeathEffect, Heart, Coin, EnemyProjectile, OrbDeathEffect, BeamDeathEffect, BossProjectile, BossDeathEffect
-from background import Background
+from entities import Player, Enemy, Boss, CanonProjectile, Lightning, Particle, WeldingParticle, EnergyOrb, BonusManager, Beam, DeathEffect, Heart, Coin, EnemyProjectile, OrbDeathEffect, BeamDeathEffect, AshPool, BossProjectile, BossDeathEffect
+from background import Background, GroundDecalLayer
 from weapons import WeaponManager, SkillManager, CannonWeapon, LightningWeapon, OrbWeapon, BeamWeapon, SpeedSkill, RegenSkill, MagnetSkill, ShieldSkill
 from transitions import TransitionManager, TRANSITION_TYPES
+from render_queue import RenderQueue
+from performance import DynamicResolutionController, EffectQualityGovernor, EffectBudget
+from asset_cache import AssetCache
+from font_registry import FontRegistry
+from input_manager import InputManager
 
 class Game:
     """Classe principale du jeu"""
     
-    def __init__(self, config):
+    # Assombrissement (alpha, couleur) de l'écran de pause, intégré à l'instantané de la scène
+    PAUSE_DIM = (128, (0, 0, 0))
+    # Fond du menu de sortie : le gris (50, 50, 50) déjà assombri par l'ancien overlay (160, (20, 20, 20))
+    EXIT_MENU_FILL = (31, 31, 31)
+    
+    # Tailles des emplacements de l'écran des compétences et marges des icônes
+    WEAPON_SLOT_SIZE = 192
+    WEAPON_ICON_MARGIN = 8
+    SKILL_SLOT_SIZE = 144
+    SKILL_ICON_MARGIN = 6
+    UPGRADE_ICON_MARGIN = 10
+    
+    def __init__(self, config, screen=None, clock=None):
         self.config = config
-        # Configurer l'affichage avec antialiasing si disponible
-        flags = pygame.RESIZABLE
-        if config.ENABLE_ANTIALIASING:
-            # Essayer d'activer le multisampling (antialiasing matériel)
-            try:
-                pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLEBUFFERS, 1)
-                pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLESAMPLES, 4)
-            except:
-                # Si le multisampling n'est pas disponible, continuer sans
-                pass
-        
-        self.screen = pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT), flags)
-        pygame.display.set_caption("Last Man Standing")
-        self.clock = pygame.time.Clock()
+        if screen is None:
+            AssetCache.configure(config)  # Lancement autonome (sinon fait par GameManager)
+            
+            # Configurer l'affichage avec antialiasing si disponible
+            flags = pygame.RESIZABLE
+            if config.ENABLE_ANTIALIASING:
+                # Essayer d'activer le multisampling (antialiasing matériel)
+                try:
+                    pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLEBUFFERS, 1)
+                    pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLESAMPLES, 4)
+                except:
+                    # Si le multisampling n'est pas disponible, continuer sans
+                    pass
+            
+            screen = pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT), flags)
+            pygame.display.set_caption("Last Man Standing")
+        # Surface d'affichage et horloge partagées avec GameManager (une seule fenêtre, une seule boucle)
+        self.screen = screen
+        self.clock = clock or pygame.time.Clock()
         
         # === CURSEUR PERSONNALISÉ ===
         try:
             # Charger l'image du curseur
-            cursor_image = pygame.image.load("assets/player/pointer2.png").convert_alpha()
+            cursor_image = AssetCache.get_image("assets/player/pointer2.png")
             # Redimensionner si nécessaire (2x plus gros que la taille de base)
             cursor_size = max(48, int(48 * self.config.font_scale))  # Taille adaptative x2
             cursor_image = pygame.transform.scale(cursor_image, (cursor_size, cursor_size))
@@ -44,12 +66,14 @@ class Game:
             print("Utilisation du curseur par défaut")
         
         # Police adaptative
-        self.font = pygame.font.Font(None, int(36 * self.config.font_scale))
-        self.small_font = pygame.font.Font(None, int(24 * self.config.font_scale))
+        self.font = FontRegistry.get_scaled(self.config, 36)
+        self.small_font = FontRegistry.get_scaled(self.config, 24)
         
         # Cache pour les images d'armes et de compétences
         self.weapon_images = {}
         self.skill_images = {}
+        self.upgrade_icon_sources = {}  # Images sources des upgrades par (dossier, nom de fichier)
+        self.icon_cache = {}  # Icônes prêtes à dessiner par (item, taille)
         self._load_weapon_and_skill_images()
         
         # État du jeu
@@ -87,8 +111,21 @@ class Game:
         self.death_effects = []  # Nouvelle liste pour les effets de mort
         self.orb_death_effects = []  # Nouvelle liste pour les effets de mort par orbe
         self.beam_death_effects = []  # Nouvelle liste pour les effets de mort par beam
+        AshPool.clear()  # Pas de cendres résiduelles d'une partie précédente
         self.collectibles = []  # Nouvelle liste pour les objets collectibles
         
+        # Instrumentation du rendu (compteurs par couche, overlay de debug avec F3)
+        self.render_queue = RenderQueue()  # File de rendu par couches (blits groupés)
+        self.input = InputManager(config.CONTROLS)  # Touches de GameSettings.controls
+        self.world_surface = None  # Surface du monde à résolution interne (RENDER_SCALE < 1)
+        self.overlay_snapshots = {}  # Scène figée sous l'écran de pause {assombrissement: Surface}
+        self.resolution_controller = DynamicResolutionController(config)  # Résolution dynamique (F5)
+        self.effect_quality = EffectQualityGovernor(config)  # Qualité des effets (F6)
+        self.effect_budget = EffectBudget(config)  # Budget global des effets avec éviction
+        self.ground_decals = GroundDecalLayer(config)  # Traces au sol persistantes (GROUND_DECALS)
+        self.render_stats = {}  # {couche: (dessinés, ignorés)}
+        self.show_debug_overlay = False
+        
         # Système de score
         self.score = 0  # Score total du joueur
         
@@ -558,9 +595,11 @@ class Game:
             on_complete=hide_exit
         )
 
-    def handle_events(self):
-        """Gère les événements pygame"""
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        """Gère les événements pygame (ceux de la frame transmis par GameManager, sinon la file)"""
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return
@@ -640,6 +679,24 @@ class Game:
                 return
             
             elif event.type == pygame.KEYDOWN:
+                # Overlay de debug (compteurs de rendu)
+                if event.key == pygame.K_F3:
+                    self.show_debug_overlay = not self.show_debug_overlay
+                    self.overlay_snapshots.clear()
+                    return
+                # Échelle de rendu interne du monde
+                if event.key == pygame.K_F4:
+                    self.cycle_render_scale()
+                    self.overlay_snapshots.clear()
+                    return
+                # Résolution dynamique pilotée par le temps de frame
+                if event.key == pygame.K_F5:
+                    self.resolution_controller.toggle()
+                    return
+                # Qualité des effets : high -> medium -> low -> auto
+                if event.key == pygame.K_F6:
+                    self.effect_quality.cycle_mode()
+                    return
                 # Gestion de l'écran d'upgrade
                 if self.show_upgrade_screen:
                     if event.key == pygame.K_ESCAPE and not self.transition_manager.is_active:
@@ -711,10 +768,10 @@ class Game:
         if self.paused or self.game_over:
             return
         
-        # Met à jour le joueur
-        keys = pygame.key.get_pressed()
+        # Met à jour le joueur (clavier lu une fois par frame)
+        self.input.update()
         player_was_moving = self.player.vel_x != 0 or self.player.vel_y != 0
-        self.player.update(keys)
+        self.player.update(self.input)
         player_is_moving = self.player.vel_x != 0 or self.player.vel_y != 0
         
         # Contraindre le joueur dans les limites du monde généré
@@ -1137,10 +1194,11 @@ class Game:
         self.config.WINDOW_HEIGHT = new_height
         self.config.SCREEN_WIDTH = new_width
         self.config.SCREEN_HEIGHT = new_height
+        self.overlay_snapshots.clear()  # Les instantanés des overlays n'ont plus la bonne taille
         
         # Recalculer les polices avec la nouvelle échelle
-        self.font = pygame.font.Font(None, int(36 * self.config.font_scale))
-        self.small_font = pygame.font.Font(None, int(24 * self.config.font_scale))
+        self.font = FontRegistry.get_scaled(self.config, 36)
+        self.small_font = FontRegistry.get_scaled(self.config, 24)
         
         # Ajuster la position de la caméra pour maintenir le centrage
         camera_offset_x = (new_width - old_width) // 2
@@ -1265,10 +1323,19 @@ class Game:
             particle_type: "explosion", "lightning", "welding", "beam_explosion"
             multiplier: Multiplicateur du nombre de particules
             beam_direction: Tuple (dx, dy) pour les particules de soudure
+        
+        Le nombre de particules suit le niveau de qualité des effets (particle_scale),
+        et aucune particule n'est créée quand le plafond du niveau est atteint.
         """
+        first_new_particle = len(self.particles)
+        quality = self.effect_quality
+        if not quality.has_room(len(self.particles) + len(self.welding_particles)):
+            self.schedule_explosion_scorch(x, y, particle_type, multiplier, ())
+            return
+        
         if particle_type == "lightning":
             # Triple le nombre de particules pour un effet spectaculaire
-            count = int(self.config.PARTICLE_COUNT * 3 * multiplier)
+            count = quality.scale_count(self.config.PARTICLE_COUNT * 3 * multiplier)
             for _ in range(count):
                 particle = Particle(x, y, self.config)
                 # Effet électrique avec particules plus grosses
@@ -1286,7 +1353,7 @@ class Game:
         elif particle_type == "welding":
             # Particules de soudure spécialisées
             base_count = max(4, self.config.PARTICLE_COUNT // 2)
-            count = int(base_count * multiplier)
+            count = quality.scale_count(base_count * multiplier)
             
             beam_dir_x, beam_dir_y = beam_direction if beam_direction else (None, None)
             
@@ -1294,8 +1361,8 @@ class Game:
                 particle = WeldingParticle(x, y, self.config, beam_dir_x, beam_dir_y)
                 self.welding_particles.append(particle)
             
-            # Particules ultra-brillantes
-            for _ in range(max(1, count // 4)):
+            # Particules ultra-brillantes (aucune si le niveau de qualité n'en émet pas)
+            for _ in range(min(count, max(1, count // 4))):
                 particle = WeldingParticle(x, y, self.config, beam_dir_x, beam_dir_y)
                 particle.color = (255, 255, 255)
                 particle.size = 1
@@ -1305,17 +1372,30 @@ class Game:
                 
         elif particle_type == "beam_explosion":
             # Double explosion pour beam
-            count = int(self.config.PARTICLE_COUNT * 2 * multiplier)
+            count = quality.scale_count(self.config.PARTICLE_COUNT * 2 * multiplier)
             for _ in range(count):
                 particle = Particle(x, y, self.config)
                 self.particles.append(particle)
                 
         else:  # particle_type == "explosion" ou par défaut
             # Explosion normale
-            count = int(self.config.PARTICLE_COUNT * multiplier)
+            count = quality.scale_count(self.config.PARTICLE_COUNT * multiplier)
             for _ in range(count):
                 particle = Particle(x, y, self.config)
                 self.particles.append(particle)
+        
+        self.schedule_explosion_scorch(x, y, particle_type, multiplier, self.particles[first_new_particle:])
+    
+    def schedule_explosion_scorch(self, x, y, particle_type, multiplier, new_particles):
+        """Brûlure au sol laissée par une explosion (mode traces au sol)
+        
+        Posée quand la dernière particule de l'explosion disparaît, pour ne pas apparaître
+        sous l'effet encore en cours.
+        """
+        if not self.config.GROUND_DECALS or particle_type == "welding":
+            return
+        delay = max((particle.lifetime for particle in new_particles), default=0)
+        self.ground_decals.schedule_scorch(x, y, int(self.config.ENEMY_SIZE * 0.4 * multiplier), delay)
     
     # Méthodes legacy conservées pour compatibilité
     def create_explosion_particles(self, x, y):
@@ -1470,8 +1550,10 @@ class Game:
     
     def draw(self):
         """Dessine tous les éléments du jeu"""
+        if not self.paused:
+            self.overlay_snapshots.clear()  # Pause terminée : le prochain instantané sera recapturé
         # TOUJOURS remplir l'écran d'abord pour éviter l'écran noir
-        self.screen.fill((50, 50, 50))  # Fond gris foncé
+        self.screen.fill(self.EXIT_MENU_FILL if self.show_exit_menu else (50, 50, 50))  # Fond gris foncé
         
         # Si une transition est active, ne pas changer d'écran encore
         if self.transition_manager.is_active:
@@ -1503,22 +1585,28 @@ class Game:
         
         # Dessiner les transitions par-dessus tout le reste
         self.transition_manager.render(self.screen)
-        
-        # TOUJOURS faire le flip pour afficher à l'écran
-        pygame.display.flip()
     
     def _draw_game_screen(self):
         """Dessine l'écran de jeu principal"""
+        if self.paused and not self.game_over:
+            # Jeu en pause : le monde est figé, réutiliser l'instantané (assombri)
+            self.screen.blit(self.get_overlay_backdrop(*self.PAUSE_DIM), (0, 0))
+        else:
+            self._draw_game_scene()
+        
+        if self.paused:
+            self.draw_pause_screen()
+        elif self.game_over:
+            self.draw_game_over_screen()
+
+    def _draw_game_scene(self):
+        """Dessine le monde, la minimap et le HUD (sans les overlays de pause / game over)"""
         # Utiliser les coordonnées de caméra avec délai
         camera_x = self.camera_x
         camera_y = self.camera_y
         
-        # Dessiner l'arrière-plan procédural en premier
-        self.background.draw(self.screen, camera_x, camera_y)
-        
-        if not self.game_over:
-            # Dessiner toutes les entités
-            self.draw_entities(camera_x, camera_y)
+        # Dessiner le monde (arrière-plan procédural puis entités)
+        self.draw_world(camera_x, camera_y)
         
         # Minimap
         self.draw_minimap()
@@ -1526,11 +1614,73 @@ class Game:
         # Interface utilisateur
         self.draw_ui()
         
-        if self.paused:
-            self.draw_pause_screen()
-        elif self.game_over:
-            self.draw_game_over_screen()
-
+        if self.show_debug_overlay:
+            self.draw_debug_overlay()
+    
+    def get_overlay_backdrop(self, dim_alpha=0, dim_color=(0, 0, 0)):
+        """Instantané de la scène de jeu affiché sous l'écran de pause
+        
+        La scène n'est rendue qu'une fois à l'ouverture de la pause, et chaque variante
+        assombrie est calculée une seule fois ; les instantanés sont invalidés à la
+        reprise, au redimensionnement de la fenêtre et avec F3 / F4.
+        """
+        snapshot = self.overlay_snapshots.get(None)
+        if snapshot is None or snapshot.get_size() != self.screen.get_size():
+            self.overlay_snapshots.clear()
+            self._draw_game_scene()
+            snapshot = self.screen.copy()
+            self.overlay_snapshots[None] = snapshot
+        if dim_alpha <= 0:
+            return snapshot
+        
+        key = (dim_alpha, dim_color)
+        if key not in self.overlay_snapshots:
+            dimmed = snapshot.copy()
+            overlay = pygame.Surface(dimmed.get_size())
+            overlay.set_alpha(dim_alpha)
+            overlay.fill(dim_color)
+            dimmed.blit(overlay, (0, 0))
+            self.overlay_snapshots[key] = dimmed
+        return self.overlay_snapshots[key]
+    
+    def get_world_surface(self, scale):
+        """Surface hors écran du monde à la résolution interne (recréée si la fenêtre change)"""
+        size = (max(1, int(self.config.WINDOW_WIDTH * scale)), max(1, int(self.config.WINDOW_HEIGHT * scale)))
+        if self.world_surface is None or self.world_surface.get_size() != size:
+            self.world_surface = pygame.Surface(size).convert()
+        return self.world_surface
+    
+    def draw_world(self, camera_x, camera_y):
+        """Dessine le terrain et les entités, à la résolution interne si RENDER_SCALE < 1
+        
+        Le terrain (avec les traces au sol) puis toutes les couches de la file de rendu,
+        sprites et primitives (barres de vie, beams, étincelles, cendres, boucliers), sont
+        dessinés dans l'ordre dans une surface réduite, agrandie une seule fois à l'écran ;
+        seul le HUD, dessiné ensuite, reste en résolution native.
+        """
+        scale = self.config.RENDER_SCALE
+        if scale >= 1.0:
+            self.background.draw(self.screen, camera_x, camera_y, decals=self.ground_decals)
+            if not self.game_over:
+                self.draw_entities(camera_x, camera_y)
+                self.render_queue.flush(self.screen)
+            return
+        
+        world_surface = self.get_world_surface(scale)
+        self.background.draw(world_surface, camera_x, camera_y, scale, self.ground_decals)
+        if not self.game_over:
+            self.draw_entities(camera_x, camera_y)
+            self.render_queue.flush(world_surface, scale)
+        pygame.transform.scale(world_surface, self.screen.get_size(), self.screen)
+    
+    def cycle_render_scale(self):
+        """Passe à l'échelle de rendu interne suivante (F4)"""
+        scales = self.config.RENDER_SCALES
+        current = self.config.RENDER_SCALE
+        next_index = (scales.index(current) + 1) % len(scales) if current in scales else 0
+        self.config.RENDER_SCALE = scales[next_index]
+        print(f"🖥️ Échelle de rendu du monde: {int(self.config.RENDER_SCALE * 100)}%")
+    
     def draw_button(self, text, rect, color, text_color=None, border_radius=14):
         """
         Méthode helper pour dessiner un bouton standardisé
@@ -1550,20 +1700,11 @@ class Game:
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
     
-    def draw_overlay_background(self, alpha=160, color=(20, 20, 20)):
-        """Dessine un overlay semi-transparent pour les menus"""
-        screen_w, screen_h = self.config.WINDOW_WIDTH, self.config.WINDOW_HEIGHT
-        overlay = pygame.Surface((screen_w, screen_h))
-        overlay.set_alpha(alpha)
-        overlay.fill(color)
-        self.screen.blit(overlay, (0, 0))
-
     def draw_exit_menu(self):
         """Dessine le menu de sortie avec boutons cliquables"""
         screen_w, screen_h = self.config.WINDOW_WIDTH, self.config.WINDOW_HEIGHT
         
-        # Background overlay
-        self.draw_overlay_background()
+        # Background overlay : fond déjà assombri (EXIT_MENU_FILL, voir draw)
 
         # Titre
         title = "Menu de sortie"
@@ -1821,13 +1962,7 @@ class Game:
         self.screen.blit(progress_surface, progress_rect)
 
     def draw_pause_screen(self):
-        """Dessine l'écran de pause"""
-        # Overlay semi-transparent
-        overlay = pygame.Surface((self.config.WINDOW_WIDTH, self.config.WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(self.config.BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
+        """Dessine l'écran de pause (l'assombrissement PAUSE_DIM est intégré à l'instantané)"""
         # Texte de pause
         pause_text = "PAUSE"
         pause_surface = self.font.render(pause_text, True, self.config.WHITE)
@@ -2148,7 +2283,10 @@ class Game:
         self.death_effects.clear()
         self.orb_death_effects.clear()
         self.beam_death_effects.clear()
+        AshPool.clear()
         self.boss_death_effects.clear()
+        self.effect_budget.reset()
+        self.ground_decals.reset()
         self.collectibles.clear()  # ✅ IMPORTANT: Vider les drops (pièces, cœurs, etc.)
         
         # === RÉINITIALISER LE GESTIONNAIRE DE BONUS ===
@@ -2161,13 +2299,31 @@ class Game:
         print(f"   🎯 Compétences: {len(self.skill_manager.skills)}/14")
         print(f"   🎲 Bans disponibles: {self.ban_count}")
     
+    def start_session(self):
+        """Démarre une nouvelle partie en réutilisant l'instance (fenêtre, polices, icônes déjà chargées)"""
+        # Réglages graphiques éventuellement changés depuis la partie précédente
+        self.resolution_controller.enabled = self.config.DYNAMIC_RESOLUTION
+        self.effect_quality.set_mode(self.config.PARTICLES_QUALITY)
+        self.overlay_snapshots.clear()
+        self.transition_manager.is_active = False
+        self.restart_game()
+        self.running = True
+    
+    def record_frame_time(self):
+        """Transmet le temps de travail de la dernière frame (hors attente de tick) aux contrôleurs adaptatifs"""
+        frame_time = self.clock.get_rawtime()
+        self.resolution_controller.record_frame(frame_time)
+        self.effect_quality.record_frame(frame_time)
+    
     def run(self):
-        """Boucle principale du jeu"""
+        """Boucle autonome du jeu (GameManager utilise sa propre boucle et appelle les étapes ci-dessous)"""
         while self.running:
             self.handle_events()
             self.update()
             self.draw()
+            pygame.display.flip()
             self.clock.tick(self.config.FPS)
+            self.record_frame_time()
     
     def ensure_correct_orb_count(self):
         """S'assure que le joueur a le bon nombre d'orb selon son niveau (uniquement si débloqué)"""
@@ -2280,8 +2436,9 @@ class Game:
         for weapon_name, filename in weapon_files.items():
             try:
                 image_path = f"assets/weapons/{filename}"
-                image = pygame.image.load(image_path).convert_alpha()
+                image = AssetCache.get_image(image_path)
                 self.weapon_images[weapon_name] = image
+                self.upgrade_icon_sources[("weapons", filename[:-4])] = image
                 print(f"✅ Image d'arme chargée: {weapon_name} ({filename})")
             except (pygame.error, FileNotFoundError) as e:
                 print(f"❌ Impossible de charger l'image d'arme {weapon_name}: {e}")
@@ -2299,12 +2456,69 @@ class Game:
         for skill_name, filename in skill_files.items():
             try:
                 image_path = f"assets/competences/{filename}"
-                image = pygame.image.load(image_path).convert_alpha()
+                image = AssetCache.get_image(image_path)
                 self.skill_images[skill_name] = image
+                self.upgrade_icon_sources[("competences", filename[:-4])] = image
                 print(f"✅ Image de compétence chargée: {skill_name} ({filename})")
             except (pygame.error, FileNotFoundError) as e:
                 print(f"❌ Impossible de charger l'image de compétence {skill_name}: {e}")
                 self.skill_images[skill_name] = None
+        
+        # Préparer les icônes aux tailles utilisées par les écrans d'upgrade et de compétences
+        weapon_icon_size = self.WEAPON_SLOT_SIZE - self.WEAPON_ICON_MARGIN * 2
+        for weapon_name in self.weapon_images:
+            self.get_icon(("weapon", weapon_name), weapon_icon_size)
+        skill_icon_size = self.SKILL_SLOT_SIZE - self.SKILL_ICON_MARGIN * 2
+        for skill_name in self.skill_images:
+            self.get_icon(("skill", skill_name), skill_icon_size)
+        upgrade_icon_size = self.get_upgrade_icon_rects()[0].width - self.UPGRADE_ICON_MARGIN * 2
+        for folder, item_name in list(self.upgrade_icon_sources):
+            self.get_icon(("upgrade", folder, item_name), upgrade_icon_size)
+    
+    def get_icon(self, item, icon_size):
+        """Retourne l'icône carrée d'un item à la taille demandée (None si pas d'image)
+        
+        item vaut ("weapon", nom), ("skill", nom) ou ("upgrade", dossier, nom de fichier).
+        Chaque icône est redimensionnée une seule fois puis mise en cache par (item, taille).
+        """
+        key = (item, icon_size)
+        if key in self.icon_cache:
+            return self.icon_cache[key]
+        
+        kind = item[0]
+        icon = None
+        if kind == "weapon":
+            source = self.weapon_images.get(item[1])
+            if source:
+                icon = pygame.transform.scale(source, (icon_size, icon_size))
+        elif kind == "skill":
+            source = self.skill_images.get(item[1])
+            if source:
+                icon = pygame.transform.scale(source, (icon_size, icon_size))
+        else:
+            source = self._get_upgrade_icon_source(item[1], item[2])
+            if source:
+                # Rendre l'image carrée sans déformation (partie centrale) puis la lisser
+                original_w, original_h = source.get_size()
+                square_size = min(original_w, original_h)
+                crop_x = (original_w - square_size) // 2
+                crop_y = (original_h - square_size) // 2
+                square_surface = pygame.Surface((square_size, square_size))
+                square_surface.blit(source, (0, 0), pygame.Rect(crop_x, crop_y, square_size, square_size))
+                icon = pygame.transform.smoothscale(square_surface, (icon_size, icon_size))
+        
+        self.icon_cache[key] = icon
+        return icon
+    
+    def _get_upgrade_icon_source(self, folder, item_name):
+        """Image source d'une upgrade (chargée au démarrage ; une seule lecture disque sinon)"""
+        key = (folder, item_name)
+        if key not in self.upgrade_icon_sources:
+            try:
+                self.upgrade_icon_sources[key] = AssetCache.get_image(f"assets/{folder}/{item_name}.png")
+            except (pygame.error, FileNotFoundError):
+                self.upgrade_icon_sources[key] = None
+        return self.upgrade_icon_sources[key]
     
     def draw_skills_screen(self):
         """Affiche l'écran graphique des compétences et armes obtenues"""
@@ -2331,7 +2545,7 @@ class Game:
         self.screen.blit(weapons_label_surface, weapons_label_rect)
 
         # Affichage des armes (7 slots) - Agrandies de 50% supplémentaires et encore plus bas
-        slot_size = 192  # Agrandies de 50% : 128 → 192
+        slot_size = self.WEAPON_SLOT_SIZE  # Agrandies de 50% : 128 → 192
         slot_margin = 40  # Ajusté pour la nouvelle taille encore plus grande
         total_slots = 7
         start_x = (self.config.WINDOW_WIDTH - (total_slots * slot_size + (total_slots-1)*slot_margin)) // 2
@@ -2352,7 +2566,7 @@ class Game:
         self.screen.blit(skills_label_surface, skills_label_rect)
 
         # Affichage des compétences (14 slots, 2 lignes de 7) - Agrandies de 50% et encore plus bas
-        skill_slot_size = 144  # Agrandies de 50% : 96 → 144
+        skill_slot_size = self.SKILL_SLOT_SIZE  # Agrandies de 50% : 96 → 144
         skill_slot_margin = 32  # Ajusté pour la nouvelle taille encore plus grande
         total_skills = 14
         start_x = (self.config.WINDOW_WIDTH - (7 * skill_slot_size + 6*skill_slot_margin)) // 2
@@ -2377,14 +2591,10 @@ class Game:
     def draw_weapon_icon(self, weapon, rect):
         """Dessine l'icône d'une arme selon son type en utilisant les vraies images"""
         # Essayer d'utiliser l'image chargée
-        weapon_image = self.weapon_images.get(weapon.name)
+        # Image redimensionnée pour remplir presque tout le rect (avec une petite marge), en cache
+        scaled_image = self.get_icon(("weapon", weapon.name), rect.width - self.WEAPON_ICON_MARGIN * 2)
         
-        if weapon_image:
-            # Redimensionner l'image pour qu'elle remplisse presque tout le rect (avec une petite marge)
-            margin = 8  # Marge de 8px de chaque côté
-            target_size = (rect.width - margin*2, rect.height - margin*2)
-            scaled_image = pygame.transform.scale(weapon_image, target_size)
-            
+        if scaled_image:
             # Centrer l'image dans le rect
             image_rect = scaled_image.get_rect()
             image_rect.center = rect.center
@@ -2441,14 +2651,10 @@ class Game:
     def draw_skill_icon(self, skill, rect):
         """Dessine l'icône d'une compétence selon son type en utilisant les vraies images"""
         # Essayer d'utiliser l'image chargée
-        skill_image = self.skill_images.get(skill.name)
+        # Image redimensionnée (marge un peu plus petite pour les compétences), en cache
+        scaled_image = self.get_icon(("skill", skill.name), rect.width - self.SKILL_ICON_MARGIN * 2)
         
-        if skill_image:
-            # Redimensionner l'image pour qu'elle remplisse presque tout le rect (avec une petite marge)
-            margin = 6  # Marge un peu plus petite pour les compétences
-            target_size = (rect.width - margin*2, rect.height - margin*2)
-            scaled_image = pygame.transform.scale(skill_image, target_size)
-            
+        if scaled_image:
             # Centrer l'image dans le rect
             image_rect = scaled_image.get_rect()
             image_rect.center = rect.center
@@ -2542,8 +2748,8 @@ class Game:
         y = screen_h//2 - 160  # Ajusté pour la nouvelle hauteur
         return [pygame.Rect(screen_w//2-660+i*480, y, icon_size, icon_size) for i in range(3)]
     
-    def load_upgrade_icon(self, option):
-        """Charge l'icône appropriée pour une option d'upgrade"""
+    def get_upgrade_icon_item(self, option):
+        """Identifie l'icône d'une option d'upgrade : ("upgrade", dossier, nom) ou None"""
         try:
             name = option["name"]
             
@@ -2572,13 +2778,10 @@ class Game:
                 else:
                     return None
                 
-                # Charger l'image
-                image_path = f"assets/{folder}/{item_name}.png"
-                image = pygame.image.load(image_path).convert_alpha()
-                return image
+                return ("upgrade", folder, item_name)
                 
-        except (pygame.error, FileNotFoundError, IndexError):
-            # Image non trouvée ou erreur de parsing
+        except IndexError:
+            # Erreur de parsing
             return None
         
         return None
@@ -2631,28 +2834,11 @@ class Game:
             pygame.draw.rect(self.screen, icon_frame_color, icon_rect, border_radius=8)
             pygame.draw.rect(self.screen, (100, 100, 100), icon_rect, 3, border_radius=8)  # Bordure
             
-            # Charger et afficher l'icône si disponible
-            icon_image = self.load_upgrade_icon(option)
-            if icon_image:
-                # Traitement de l'image pour la rendre carrée sans déformation
-                original_w, original_h = icon_image.get_size()
-                
-                # Calculer la taille du carré (la plus petite dimension)
-                square_size = min(original_w, original_h)
-                
-                # Calculer la position pour centrer le crop
-                crop_x = (original_w - square_size) // 2
-                crop_y = (original_h - square_size) // 2
-                
-                # Créer une surface carrée avec la partie centrale de l'image
-                square_surface = pygame.Surface((square_size, square_size))
-                source_rect = pygame.Rect(crop_x, crop_y, square_size, square_size)
-                square_surface.blit(icon_image, (0, 0), source_rect)
-                
-                # Redimensionner à la taille de l'icône carrée (avec marge)
-                icon_size = icon_rect.width - 20  # Marge de 10px de chaque côté
-                scaled_icon = pygame.transform.smoothscale(square_surface, (icon_size, icon_size))
-                
+            # Afficher l'icône si disponible (carrée, redimensionnée et mise en cache au démarrage)
+            icon_size = icon_rect.width - self.UPGRADE_ICON_MARGIN * 2  # Marge de 10px de chaque côté
+            icon_item = self.get_upgrade_icon_item(option)
+            scaled_icon = self.get_icon(icon_item, icon_size) if icon_item else None
+            if scaled_icon:
                 # Centrer l'image carrée dans le cadre carré
                 icon_x = icon_rect.centerx - icon_size // 2
                 icon_y = icon_rect.centery - icon_size // 2
@@ -2761,86 +2947,129 @@ class Game:
         skip_rect_center = skip_surface.get_rect(center=skip_rect.center)
         self.screen.blit(skip_surface, skip_rect_center)
 
-    def draw_entity_with_camera_offset(self, entity, camera_x, camera_y):
-        """Dessine une entité en appliquant l'offset de caméra"""
-        entity_screen_x = entity.x - camera_x
-        entity_screen_y = entity.y - camera_y
-        temp_x, temp_y = entity.x, entity.y
-        entity.x, entity.y = entity_screen_x, entity_screen_y
-        
-        # Si c'est le joueur, passer l'état du bouclier
-        if entity == self.player:
-            entity.draw(self.screen, shield_hits=self.bonus_manager.shield_hits_remaining)
-        else:
-            entity.draw(self.screen)
+    def get_view_rect(self, camera_x, camera_y):
+        """Rectangle visible en coordonnées monde, élargi d'une marge (rotations, barres de vie)"""
+        margin = self.config.CULLING_MARGIN
+        return pygame.Rect(camera_x - margin, camera_y - margin,
+                           self.config.WINDOW_WIDTH + 2 * margin,
+                           self.config.WINDOW_HEIGHT + 2 * margin)
+    
+    def is_in_view(self, entity, view_rect):
+        """Vérifie si une entité touche la zone visible
         
-        entity.x, entity.y = temp_x, temp_y
+        La taille sert d'étendue dans les deux sens : couvre aussi bien les entités
+        positionnées par leur coin (ennemis) que par leur centre (projectiles, particules).
+        """
+        size = getattr(entity, 'size', self.config.CULLING_DEFAULT_SIZE)
+        return (entity.x + size >= view_rect.left and entity.x - size <= view_rect.right and
+                entity.y + size >= view_rect.top and entity.y - size <= view_rect.bottom)
+    
+    def cull_layer(self, layer_name, entities, view_rect):
+        """Retourne les entités visibles d'une couche et met à jour ses compteurs dessinés/ignorés"""
+        if layer_name == 'lightnings':
+            visible = [entity for entity in entities if view_rect.colliderect(entity.get_bounds())]
+        else:
+            visible = [entity for entity in entities if self.is_in_view(entity, view_rect)]
+        self.render_stats[layer_name] = (len(visible), len(entities) - len(visible))
+        return visible
     
     def draw_entities(self, camera_x, camera_y):
-        """Dessine toutes les entités du jeu avec l'offset de caméra"""
-        # Dessiner les ennemis en premier
-        for enemy in self.enemies:
-            self.draw_entity_with_camera_offset(enemy, camera_x, camera_y)
+        """Soumet toutes les entités visibles du jeu à la file de rendu (vidée par draw_world)"""
+        view_rect = self.get_view_rect(camera_x, camera_y)
+        self.render_stats = {}
+        queue = self.render_queue
+        
+        # Dessiner les ennemis en premier (sprites en blits groupés)
+        for enemy in self.cull_layer('enemies', self.enemies, view_rect):
+            enemy.submit(queue, camera_x, camera_y)
         
         # Dessiner le boss
         if self.boss and self.boss.health > 0:
-            self.draw_entity_with_camera_offset(self.boss, camera_x, camera_y)
+            for boss in self.cull_layer('boss', [self.boss], view_rect):
+                boss.submit(queue, camera_x, camera_y)
         
         # Dessiner les projectiles de canon
-        for canon_projectile in self.canon_projectiles:
-            self.draw_entity_with_camera_offset(canon_projectile, camera_x, camera_y)
+        for canon_projectile in self.cull_layer('canon_projectiles', self.canon_projectiles, view_rect):
+            canon_projectile.submit(queue, camera_x, camera_y)
         
         # Dessiner les projectiles ennemis
-        for projectile in self.enemy_projectiles:
-            self.draw_entity_with_camera_offset(projectile, camera_x, camera_y)
+        for projectile in self.cull_layer('enemy_projectiles', self.enemy_projectiles, view_rect):
+            projectile.submit(queue, camera_x, camera_y)
         
         # Dessiner les projectiles du boss
-        for projectile in self.boss_projectiles:
-            self.draw_entity_with_camera_offset(projectile, camera_x, camera_y)
+        for projectile in self.cull_layer('boss_projectiles', self.boss_projectiles, view_rect):
+            projectile.submit(queue, camera_x, camera_y)
         
-        # Dessiner les lightning (derrière le joueur)
-        for lightning in self.lightnings:
-            # Les lightning ont leurs propres coordonnées dans leurs points
-            lightning.draw(self.screen, camera_x, camera_y)
+        # Dessiner les lightning (derrière le joueur, surfaces pré-rendues en blits groupés)
+        for lightning in self.cull_layer('lightnings', self.lightnings, view_rect):
+            lightning.submit(queue, camera_x, camera_y)
         
-        # Dessiner les beams (rayons laser)
+        # Dessiner les beams (rayons laser, partent toujours du joueur : pas de culling ; primitives)
         for beam in self.beams:
-            beam.draw(self.screen, camera_x, camera_y)
+            queue.draw('effects', beam.draw, camera_x, camera_y)
         
         # Dessiner les particules
-        for particle in self.particles:
-            self.draw_entity_with_camera_offset(particle, camera_x, camera_y)
+        for particle in self.cull_layer('particles', self.particles, view_rect):
+            particle.submit(queue, camera_x, camera_y)
         
-        # Dessiner les particules de soudure (au premier plan pour effet brillant)
-        for welding_particle in self.welding_particles:
-            self.draw_entity_with_camera_offset(welding_particle, camera_x, camera_y)
+        # Dessiner les particules de soudure (au premier plan pour effet brillant ; halos en primitives)
+        for welding_particle in self.cull_layer('welding_particles', self.welding_particles, view_rect):
+            queue.draw('effects', welding_particle.draw, camera_x, camera_y)
         
         # Dessiner les orb
-        for orb in self.energy_orbs:
-            self.draw_entity_with_camera_offset(orb, camera_x, camera_y)
+        for orb in self.cull_layer('energy_orbs', self.energy_orbs, view_rect):
+            orb.submit(queue, camera_x, camera_y)
         
         # Dessiner les effets de mort (au premier plan, avant le joueur)
-        for death_effect in self.death_effects:
-            death_effect.draw(self.screen, camera_x, camera_y)
+        for death_effect in self.cull_layer('death_effects', self.death_effects, view_rect):
+            death_effect.submit(queue, camera_x, camera_y)
         
         # Dessiner les effets de mort par orbe
-        for orb_death_effect in self.orb_death_effects:
-            orb_death_effect.draw(self.screen, camera_x, camera_y)
+        for orb_death_effect in self.cull_layer('orb_death_effects', self.orb_death_effects, view_rect):
+            orb_death_effect.submit(queue, camera_x, camera_y)
         
-        # Dessiner les effets de mort par beam (cendres)
-        for beam_death_effect in self.beam_death_effects:
-            beam_death_effect.draw(self.screen, camera_x, camera_y)
+        # Dessiner les effets de mort par beam (cendres, en un seul lot ; AshPool ignore lui-même le hors-écran)
+        if self.beam_death_effects:
+            queue.draw('effects', AshPool.draw, camera_x, camera_y)
         
-        # Dessiner les effets de mort du boss (crânes multiples)
+        # Dessiner les effets de mort du boss (crânes dispersés sur tout l'écran : pas de culling)
         for boss_death_effect in self.boss_death_effects:
-            boss_death_effect.draw(self.screen, camera_x, camera_y)
+            boss_death_effect.submit(queue, camera_x, camera_y)
         
         # Dessiner les collectibles (coeurs, etc.)
-        for collectible in self.collectibles:
-            collectible.draw(self.screen, camera_x, camera_y)
+        for collectible in self.cull_layer('collectibles', self.collectibles, view_rect):
+            collectible.submit(queue, camera_x, camera_y)
         
         # Dessiner le joueur EN DERNIER (au premier plan)
-        self.draw_entity_with_camera_offset(self.player, camera_x, camera_y)
+        self.player.submit(queue, self.bonus_manager.shield_hits_remaining, camera_x, camera_y)
+    
+    def draw_debug_overlay(self):
+        """Affiche les compteurs de rendu (FPS, entités dessinées/ignorées par couche)"""
+        controller = self.resolution_controller
+        lines = [f"FPS: {self.clock.get_fps():.0f}  |  Rendu du monde: {int(self.config.RENDER_SCALE * 100)}% (F4)"]
+        lines.append(f"Résolution dynamique (F5): {'activée' if controller.enabled else 'désactivée'}, "
+                     f"moyenne {controller.get_average_frame_time():.1f} ms / budget {controller.frame_budget_ms:.1f} ms")
+        lines.extend(f"  {decision}" for decision in controller.decision_log)
+        lines.append(f"Qualité des effets (F6): {self.effect_quality.mode} -> {self.config.EFFECT_QUALITY}")
+        budget = self.effect_budget
+        evictions = ", ".join(f"{category} {count}" for category, count in budget.evictions.items())
+        lines.append(f"Budget effets: {budget.total_cost}/{self.config.EFFECT_BUDGET_TOTAL}, "
+                     f"évincés {budget.total_evictions}" + (f" (frame: {evictions})" if evictions else ""))
+        lines.append(f"Blits groupés: {self.render_queue.blit_count} en {self.render_queue.batch_count} appels, "
+                     f"dessins: {self.render_queue.call_count}")
+        lines.append(f"Polices: {len(FontRegistry.fonts)} en cache, {FontRegistry.created_last_frame} créées "
+                     f"à la dernière frame ({FontRegistry.created} depuis le lancement)")
+        for layer_name, (drawn, culled) in self.render_stats.items():
+            lines.append(f"{layer_name}: {drawn} dessinés / {culled} ignorés")
+        
+        texts = [self.small_font.render(line, True, self.config.WHITE) for line in lines]
+        line_height = self.small_font.get_linesize()
+        panel_width = max(text.get_width() for text in texts) + 16
+        panel = pygame.Surface((panel_width, line_height * len(texts) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        for i, text in enumerate(texts):
+            panel.blit(text, (8, 5 + i * line_height))
+        self.screen.blit(panel, (10, self.config.WINDOW_HEIGHT - panel.get_height() - 10))
 
     def cleanup_entities(self):
         """Nettoie les entités et gère les collisions"""
@@ -3063,6 +3292,10 @@ class Game:
                 self.orb_death_effects.remove(orb_death_effect)
         
         # Mettre à jour et nettoyer les effets de mort par beam
+        landed_ash = AshPool.update(collect_landed=self.config.GROUND_DECALS)
+        if landed_ash is not None:
+            self.ground_decals.stamp_ash(*landed_ash, AshPool.COLOR)
+        self.ground_decals.update()
         for beam_death_effect in self.beam_death_effects[:]:
             if not beam_death_effect.update():
                 self.beam_death_effects.remove(beam_death_effect)
@@ -3073,6 +3306,9 @@ class Game:
             if boss_death_effect.is_finished:
                 self.boss_death_effects.remove(boss_death_effect)
         
+        # Appliquer le budget global des effets (éviction des moins importants)
+        self.effect_budget.enforce(self)
+        
         # Nettoyer les orb et gérer leurs collisions
         player_center_x = self.player.x + self.player.size // 2
         player_center_y = self.player.y + self.player.size // 2
@@ -7,9 +7,14 @@ Gère les différents états du jeu : menu de démarrage, jeu principal, options
 
 import pygame
 import sys
+import time
+import importlib
+import threading
 from enum import Enum
 from start_map import StartMap
-from game import Game
+from startup_trace import StartupTrace
+from asset_cache import AssetCache, get_preset_assets
+from font_registry import FontRegistry
 
 
 class GameState(Enum):
@@ -24,11 +29,20 @@ class GameState(Enum):
 class GameManager:
     """Gestionnaire principal qui orchestre tous les états du jeu"""
     
-    def __init__(self, config, game_settings=None):
+    # Modules du jeu principal (écrans, armes, transitions, effets) : la carte de démarrage n'en a
+    # pas besoin, ils sont importés en arrière-plan après la première frame du menu
+    GAME_MODULES = ("weapons", "transitions", "performance", "render_queue", "game")
+    
+    def __init__(self, config, game_settings=None, started_at=None):
         self.config = config
         self.game_settings = game_settings
+        self.startup_started_at = started_at  # Instant d'entrée dans main() (mesure du démarrage)
+        self.last_startup_latency_ms = None
         self.current_state = GameState.START_MAP
         self.clock = pygame.time.Clock()
+        AssetCache.configure(config)
+        if game_settings:
+            game_settings.apply_to_config(config)  # Touches utilisées par la carte et le jeu
         
         # Créer l'écran principal (comme le fait Game.__init__)
         flags = pygame.RESIZABLE
@@ -39,42 +53,97 @@ class GameManager:
             except:
                 pass
         
-        self.screen = pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT), flags)
-        pygame.display.set_caption("Last Man Standing")
+        with StartupTrace.phase("display_init"):
+            self.screen = pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT), flags)
+            pygame.display.set_caption("Last Man Standing")
         
         # Initialiser la carte de démarrage avec les paramètres
-        self.start_map = StartMap(config, game_settings)
+        with StartupTrace.phase("start_map"):
+            self.start_map = StartMap(config, game_settings)
         
-        # Le jeu principal sera créé à la demande
+        # Le jeu principal sera créé à la demande, puis conservé entre les parties
         self.main_game = None
+        self.launch_started_at = None  # Instant de l'action "play" (mesure du délai de lancement)
+        self.module_warm_up = None  # Thread d'import des modules du jeu (démarré après la première frame)
+        self.last_launch_latency_ms = None
         
         # État de l'application
         self.running = True
     
     def run(self):
-        """Boucle principale du gestionnaire de jeu"""
+        """Boucle principale unique de l'application (carte de démarrage, jeu principal, menus)"""
         while self.running:
-            dt = self.clock.tick(60) / 1000.0  # Delta time en secondes
-            
-            # Gérer les événements
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                else:
-                    self._handle_event(event)
+            self._run_frame()
+        
+        # Sauvegarder les réglages d'une partie interrompue par la fermeture de la fenêtre
+        self._save_game_settings()
+        
+        # Nettoyage à la fermeture
+        pygame.quit()
+        sys.exit()
+    
+    def _run_frame(self):
+        """Exécute une frame de la boucle principale (événements, mise à jour, dessin, flip)"""
+        fps = self.config.FPS if self.current_state == GameState.MAIN_GAME else 60
+        dt = self.clock.tick(fps) / 1000.0  # Delta time en secondes
+        if self.current_state == GameState.MAIN_GAME:
+            self.main_game.record_frame_time()
+        
+        # Gérer les événements
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+        
+        try:
+            if self.current_state == GameState.MAIN_GAME:
+                # Le jeu principal traite tous les événements de la frame d'un coup
+                self.main_game.handle_events(events)
+            else:
+                for event in events:
+                    if event.type != pygame.QUIT:
+                        self._handle_event(event)
             
             # Mettre à jour l'état actuel
             self._update(dt)
             
-            # Dessiner l'état actuel
-            self._draw()
-            
-            # Mettre à jour l'affichage
+            # Dessiner l'état actuel (la première frame du menu fait partie du démarrage)
+            with StartupTrace.phase("first_draw"):
+                self._draw()
+        except Exception as e:
+            if self.current_state != GameState.MAIN_GAME:
+                raise
+            print(f"Erreur dans le jeu principal: {e}")
+            self._end_main_game()
+            return
+        
+        # Mettre à jour l'affichage
+        with StartupTrace.phase("first_flip"):
             pygame.display.flip()
+        self._report_startup_latency()
+        self._report_launch_latency()
         
-        # Nettoyage à la fermeture
-        pygame.quit()
-        sys.exit()
+        if self.module_warm_up is None:
+            self.module_warm_up = threading.Thread(target=self._warm_up_game_modules, daemon=True)
+            self.module_warm_up.start()
+            # Décoder et redimensionner en arrière-plan les images du preset actif
+            AssetCache.start_warm_up(get_preset_assets(self.config))
+        
+        # Conversion au format d'affichage des images préchargées (thread principal uniquement)
+        AssetCache.integrate_decoded()
+        FontRegistry.end_frame()  # Polices créées pendant cette frame (0 en régime établi)
+    
+    def _warm_up_game_modules(self):
+        """Importe les modules du jeu principal pendant que le joueur parcourt la carte de démarrage"""
+        started_at = time.perf_counter()
+        for module_name in self.GAME_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                # L'import sera refait (et l'erreur levée) au lancement de la partie
+                print(f"⚠️ Préchargement du module {module_name} impossible: {e}")
+                return
+        print(f"📦 Modules du jeu préchargés en {1000 * (time.perf_counter() - started_at):.1f} ms")
     
     def _handle_event(self, event):
         """Gère les événements selon l'état actuel"""
@@ -84,16 +153,6 @@ class GameManager:
                 action = self.start_map.get_selected_action()
                 self._handle_start_map_action(action)
         
-        elif self.current_state == GameState.MAIN_GAME:
-            if self.main_game:
-                # Laisser le jeu principal gérer les événements
-                # Ajouter une touche pour revenir au menu principal
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    self._return_to_start_map()
-                else:
-                    # Le jeu principal gère ses propres événements dans sa boucle
-                    pass
-        
         elif self.current_state == GameState.OPTIONS:
             # Gérer les événements du menu d'options
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -115,9 +174,11 @@ class GameManager:
                 self._handle_start_map_action(action)
         
         elif self.current_state == GameState.MAIN_GAME:
-            # Le jeu principal gère sa propre boucle de mise à jour
-            # Nous n'avons besoin de rien faire ici
-            pass
+            if self.main_game.running:
+                self.main_game.update()
+            if not self.main_game.running:
+                # Partie quittée (menu de sortie, game over ou fermeture)
+                self._end_main_game()
         
         elif self.current_state == GameState.OPTIONS:
             # Mettre à jour le menu d'options
@@ -129,15 +190,16 @@ class GameManager:
     
     def _draw(self):
         """Dessine l'état actuel"""
+        if self.current_state == GameState.MAIN_GAME:
+            # Le jeu principal remplit lui-même tout l'écran
+            self.main_game.draw()
+            return
+        
         self.screen.fill((0, 0, 0))  # Fond noir
         
         if self.current_state == GameState.START_MAP:
             self.start_map.draw(self.screen)
         
-        elif self.current_state == GameState.MAIN_GAME:
-            # Le jeu principal gère son propre dessin
-            pass
-        
         elif self.current_state == GameState.OPTIONS:
             self._draw_options_menu()
         
@@ -164,38 +226,82 @@ class GameManager:
     
     def _start_main_game(self):
         """Lance le jeu principal"""
+        self.launch_started_at = time.perf_counter()
+        
         # Récupérer le profil sélectionné dans la carte de démarrage
         selected_profile = self.start_map.player_profile
         
         # Ajouter le type de profil à la configuration
         self.config.PLAYER_SPRITE_TYPE = selected_profile.profile_id
         
-        # Créer une nouvelle instance du jeu principal
-        self.main_game = Game(self.config)
+        # Appliquer les réglages sauvegardés, modifiables depuis la carte (touches, échelle de rendu,
+        # résolution dynamique, effets, traces)
+        if self.game_settings:
+            self.game_settings.apply_to_config(self.config)
+        
+        # Le jeu principal est créé une seule fois puis réutilisé : fenêtre, polices et icônes restent chargées
+        if self.main_game is None:
+            # Normalement déjà importé par le préchargement ; sinon le verrou d'import attend sa fin
+            from game import Game
+            self.main_game = Game(self.config, self.screen, self.clock)
+        else:
+            self.main_game.start_session()
         self.current_state = GameState.MAIN_GAME
+    
+    def _report_startup_latency(self):
+        """Affiche le délai entre l'entrée dans main() et la première frame du menu affichée"""
+        if StartupTrace.finished_ms is not None:
+            return
+        StartupTrace.finish()
+        StartupTrace.stats.update(AssetCache.disk_stats())
+        if AssetCache.disk_dir is not None:
+            print(f"💾 Cache disque des sprites : {AssetCache.disk_hits} relus, {AssetCache.disk_misses} décodés")
+        if AssetCache.bundle is not None:
+            print(f"📦 Paquet d'assets : {AssetCache.bundle_loads} images lues, {AssetCache.file_decodes} PNG décodés")
+        if self.config.STARTUP_TRACE_FILE:
+            StartupTrace.save(self.config.STARTUP_TRACE_FILE)
         
-        # Lancer la boucle du jeu principal
-        # Le jeu principal va prendre le contrôle complet
-        try:
-            self.main_game.run()
-        except Exception as e:
-            print(f"Erreur dans le jeu principal: {e}")
-        finally:
-            # Une fois le jeu principal terminé, revenir à la carte de démarrage
-            self._return_to_start_map()
+        if self.startup_started_at is None:
+            return
+        self.last_startup_latency_ms = 1000 * (time.perf_counter() - self.startup_started_at)
+        self.startup_started_at = None
+        print(f"⏱️ Démarrage : {self.last_startup_latency_ms:.1f} ms jusqu'à la première frame du menu")
+    
+    def _report_launch_latency(self):
+        """Affiche le délai entre l'action "play" et la première frame du jeu affichée"""
+        if self.launch_started_at is None or self.current_state != GameState.MAIN_GAME:
+            return
+        self.last_launch_latency_ms = 1000 * (time.perf_counter() - self.launch_started_at)
+        self.launch_started_at = None
+        print(f"⏱️ Lancement de la partie : {self.last_launch_latency_ms:.1f} ms jusqu'à la première frame")
+    
+    def _save_game_settings(self):
+        """Sauvegarde les réglages de rendu changés en jeu (F4 / F5 / F6)"""
+        if not self.game_settings or not self.main_game:
+            return
+        dynamic_resolution = self.main_game.resolution_controller.enabled
+        if self.game_settings.get_dynamic_resolution() != dynamic_resolution:
+            self.game_settings.set_dynamic_resolution(dynamic_resolution)
+        # L'échelle choisie par le contrôleur dynamique n'est pas un choix de l'utilisateur
+        if not dynamic_resolution and self.game_settings.get_render_scale() != self.config.RENDER_SCALE:
+            self.game_settings.set_render_scale(self.config.RENDER_SCALE)
+        if self.game_settings.get_particles_quality() != self.main_game.effect_quality.mode:
+            self.game_settings.set_particles_quality(self.main_game.effect_quality.mode)
+    
+    def _end_main_game(self):
+        """Termine la partie en cours et revient à la carte de démarrage"""
+        self._save_game_settings()
+        self._return_to_start_map()
     
     def _return_to_start_map(self):
         """Retourne à la carte de démarrage"""
         self.current_state = GameState.START_MAP
-        # Nettoyer l'instance du jeu principal si elle existe
-        self.main_game = None
-        
-        # Recréer la carte de démarrage pour repartir sur une base propre
-        self.start_map = StartMap(self.config)
+        # La carte de démarrage et le jeu principal sont conservés pour la prochaine partie
+        self.start_map.reset()
     
     def _draw_options_menu(self):
         """Dessine le menu d'options (placeholder)"""
-        font = pygame.font.Font(None, 48)
+        font = FontRegistry.get(48)
         
         # Titre
         title_text = font.render("OPTIONS", True, (255, 255, 255))
@@ -203,7 +309,7 @@ class GameManager:
         self.screen.blit(title_text, title_rect)
         
         # Contenu placeholder
-        content_font = pygame.font.Font(None, 32)
+        content_font = FontRegistry.get(32)
         content_lines = [
             "Menu d'options en développement",
             "",
@@ -224,7 +330,7 @@ class GameManager:
     
     def _draw_minigames_menu(self):
         """Dessine le menu des mini-jeux (placeholder)"""
-        font = pygame.font.Font(None, 48)
+        font = FontRegistry.get(48)
         
         # Titre
         title_text = font.render("MINI-JEUX", True, (255, 255, 255))
@@ -232,7 +338,7 @@ class GameManager:
         self.screen.blit(title_text, title_rect)
         
         # Contenu placeholder
-        content_font = pygame.font.Font(None, 32)
+        content_font = FontRegistry.get(32)
         content_lines = [
             "Mini-jeux en développement",
             "",
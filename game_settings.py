@@ -27,9 +27,12 @@ class GameSettings:
                 "move_right": "d"
             },
             "graphics": {
-                "particles_quality": "high",  # "low", "medium", "high"
+                "particles_quality": "high",  # "low", "medium", "high", "auto" (selon le temps de frame)
                 "screen_shake": True,
-                "camera_smooth": True
+                "camera_smooth": True,
+                "render_scale": 1.0,  # Résolution interne du monde (1.0 ou 0.5)
+                "dynamic_resolution": False,  # Ajuster la résolution interne selon le temps de frame
+                "ground_decals": False  # Cendres et explosions laissent des traces au sol qui s'estompent
             }
         }
         self.settings = self.load_settings()
@@ -123,6 +126,63 @@ class GameSettings:
         """Définit la taille d'écran"""
         self.set("screen_size", size)
     
+    def get_render_scale(self) -> float:
+        """Récupère l'échelle de rendu interne du monde"""
+        return self.get("graphics.render_scale", 1.0)
+    
+    def set_render_scale(self, scale: float) -> None:
+        """Définit l'échelle de rendu interne du monde (1.0 = résolution native)"""
+        if 0.25 <= scale <= 1.0:
+            self.set("graphics.render_scale", scale)
+            print(f"🖥️ Échelle de rendu {int(scale * 100)}% sauvegardée")
+        else:
+            print(f"⚠️ Échelle de rendu invalide: {scale}")
+    
+    def get_dynamic_resolution(self) -> bool:
+        """Indique si la résolution interne s'adapte au temps de frame"""
+        return self.get("graphics.dynamic_resolution", False)
+    
+    def set_dynamic_resolution(self, enabled: bool) -> None:
+        """Active ou désactive la résolution dynamique"""
+        self.set("graphics.dynamic_resolution", bool(enabled))
+        print(f"🖥️ Résolution dynamique {'activée' if enabled else 'désactivée'} et sauvegardée")
+    
+    def get_particles_quality(self) -> str:
+        """Récupère la qualité des effets ("low", "medium", "high" ou "auto")"""
+        return self.get("graphics.particles_quality", "high")
+    
+    def set_particles_quality(self, quality: str) -> None:
+        """Définit la qualité des effets"""
+        if quality in ["low", "medium", "high", "auto"]:
+            self.set("graphics.particles_quality", quality)
+            print(f"✨ Qualité des effets '{quality}' sauvegardée")
+        else:
+            print(f"⚠️ Qualité des effets invalide: {quality}")
+    
+    def get_controls(self) -> Dict[str, str]:
+        """Récupère les touches de déplacement {action: nom de touche pygame}"""
+        return dict(self.get("controls", {}))
+    
+    def get_ground_decals(self) -> bool:
+        """Indique si les effets terminés laissent des traces au sol"""
+        return self.get("graphics.ground_decals", False)
+    
+    def apply_to_config(self, config: Any) -> None:
+        """Applique les paramètres sauvegardés à la configuration (touches et réglages graphiques)
+        
+        Utilisé par GameManager (carte de démarrage et lancement d'une partie) et par la
+        simulation sans affichage, pour que les deux chemins jouent avec les mêmes réglages.
+        """
+        config.CONTROLS.update(self.get_controls())
+        # Échelle sauvegardée ramenée à la plus grande échelle proposée qui ne la dépasse pas
+        # (les anciennes échelles 75 % et 66 %, plus coûteuses à agrandir, deviennent 50 %)
+        saved_scale = self.get_render_scale()
+        config.RENDER_SCALE = max((scale for scale in config.RENDER_SCALES if scale <= saved_scale),
+                                  default=min(config.RENDER_SCALES))
+        config.DYNAMIC_RESOLUTION = self.get_dynamic_resolution()
+        config.PARTICLES_QUALITY = self.get_particles_quality()
+        config.GROUND_DECALS = self.get_ground_decals()
+    
     def reset_to_defaults(self) -> None:
         """Remet tous les paramètres aux valeurs par défaut"""
         self.settings = self.default_settings.copy()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Simulation sans affichage
+=========================
+
+Fait tourner la logique du jeu (Game.update) sans fenêtre ni rendu, aussi vite que le
+processeur le permet : pas de Game.draw, pas de clock.tick(FPS). Les surfaces sont
+créées avec le driver SDL "dummy" (convert_alpha fonctionne sans écran) et le clavier
+est remplacé par des entrées synthétiques reproductibles (graine). Base des benchmarks
+en CI, des tests d'endurance et des réglages d'équilibrage sur des serveurs sans écran :
+
+    python main.py --headless --frames 36000 --seed 42
+
+La logique du jeu avance par frame : une frame simulée vaut 1/Config.FPS seconde de
+jeu. Les transitions d'écran sont terminées immédiatement et les upgrades choisis au
+hasard (même graine). Le chronomètre de survie affiché par le jeu reste basé sur
+l'horloge réelle ; le rapport donne la durée simulée.
+
+Les sprites passent par le même AssetCache que le jeu fenêtré (cache disque, atlas,
+paquet d'assets) : Game, créé sans écran, appelle lui-même AssetCache.configure.
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from input_manager import DEFAULT_CONTROLS
+
+HOLD_FRAMES = (15, 90)  # Durée (frames) pendant laquelle une direction synthétique est maintenue
+
+
+class SyntheticInput:
+    """Clavier simulé : marche aléatoire reproductible sur les touches de déplacement
+    
+    S'utilise comme InputManager.key_source : l'appel avance d'une frame et retourne
+    l'état des touches, indexable par code de touche comme pygame.key.get_pressed().
+    """
+    
+    def __init__(self, input_manager, seed=None):
+        self.random = random.Random(seed)  # Générateur propre : n'altère pas celui du jeu
+        # Première touche liée à chaque action (celle de Config.CONTROLS)
+        self.keys = {action: input_manager.bindings[action][0] for action in DEFAULT_CONTROLS}
+        self.pressed = set()
+        self.frames_left = 0
+    
+    def __call__(self):
+        if self.frames_left <= 0:
+            self._choose_direction()
+        self.frames_left -= 1
+        return self
+    
+    def __getitem__(self, key):
+        return key in self.pressed
+    
+    def _choose_direction(self):
+        """Nouvelle direction (ou immobilité) maintenue pendant quelques frames"""
+        move_x = self.random.choice((None, "move_left", "move_right"))
+        move_y = self.random.choice((None, "move_up", "move_down"))
+        self.pressed = {self.keys[action] for action in (move_x, move_y) if action}
+        self.frames_left = self.random.randint(*HOLD_FRAMES)
+
+
+def choose_upgrade(game, rng):
+    """Choisit un upgrade au hasard et ferme l'écran d'upgrade (comme un clic du joueur)"""
+    selected_upgrade = None
+    if game.upgrade_options:
+        selected_upgrade = rng.choice(game.upgrade_options)
+        game.apply_upgrade(selected_upgrade)
+    game.transition_from_upgrade_screen()
+    game.transition_manager.finish()
+    return selected_upgrade
+
+
+def run_headless(config, frames=3600, seed=None, stop_on_game_over=False):
+    """Simule frames frames de jeu sans rendu ; retourne le rapport de la simulation"""
+    from game import Game
+    
+    if seed is not None:
+        # Avant la création du jeu : la génération de la carte tire son propre seed de random
+        random.seed(seed)
+        np.random.seed(seed)
+    rng = random.Random(seed)
+    
+    game = Game(config)  # Sans écran fourni : configure AssetCache comme un lancement autonome
+    game.input.key_source = SyntheticInput(game.input, seed)
+    
+    games_over = 0  # Parties terminées
+    best_wave = 0
+    enemies_killed = 0  # Ennemis tués dans les parties terminées (la partie en cours est ajoutée à la fin)
+    upgrades = 0
+    start = time.perf_counter()
+    frame = 0
+    while frame < frames and game.running:
+        game.update()
+        frame += 1
+        
+        # Pas d'animation d'écran sans rendu : appliquer l'état final tout de suite
+        game.transition_manager.finish()
+        if game.show_upgrade_screen and choose_upgrade(game, rng):
+            upgrades += 1
+        
+        if game.game_over:
+            games_over += 1
+            best_wave = max(best_wave, game.wave_number)
+            enemies_killed += game.enemies_killed
+            print(f"💀 Partie {games_over} terminée à la frame {frame}")
+            if stop_on_game_over:
+                break
+            game.restart_game()
+        
+        if frame % config.FPS == 0:
+            pygame.event.pump()  # Garder la file d'événements SDL vide
+    elapsed = time.perf_counter() - start
+    
+    report = {
+        "frames": frame,
+        "simulated_seconds": frame / config.FPS,
+        "wall_seconds": elapsed,
+        "updates_per_second": frame / elapsed if elapsed > 0 else 0.0,
+        "games_over": games_over,
+        "wave": max(best_wave, game.wave_number),
+        "level": game.level,
+        "score": game.score,
+        "enemies_killed": enemies_killed + (0 if game.game_over else game.enemies_killed),
+        "upgrades": upgrades,
+    }
+    print(f"📊 Simulation sans affichage : {report['frames']} frames "
+          f"({report['simulated_seconds']:.0f} s de jeu) en {elapsed:.2f} s, "
+          f"{report['updates_per_second']:.0f} mises à jour/s "
+          f"(x{report['simulated_seconds'] / elapsed if elapsed > 0 else 0:.0f} temps réel)")
+    print(f"   Vague max {report['wave']}, niveau {report['level']}, score {report['score']}, "
+          f"ennemis tués {report['enemies_killed']}, upgrades {report['upgrades']}, "
+          f"parties terminées {report['games_over']}")
+    return report
@@ -0,0 +1,106 @@
+"""
+Gestion des entrées
+===================
+
+Traduit l'état du clavier en actions du joueur (déplacements, interaction), lu une
+seule fois par frame. Les touches de déplacement viennent de GameSettings.controls
+(Config.CONTROLS), complétées par les touches QWERTY et les flèches. Les actions
+ponctuelles sont détectées sur front montant (une fois par appui) avec un
+anti-rebond temporel : aucune entrée ne bloque la boucle de jeu.
+"""
+
+import time
+
+import pygame
+
+# Actions configurables (GameSettings.controls) et leurs touches par défaut (AZERTY)
+DEFAULT_CONTROLS = {
+    "move_up": "z",
+    "move_down": "s",
+    "move_left": "q",
+    "move_right": "d",
+}
+
+# Touches toujours actives en plus de celles de Config.CONTROLS
+ALTERNATE_KEYS = {
+    "move_up": (pygame.K_w, pygame.K_UP),  # QWERTY et flèches
+    "move_down": (pygame.K_DOWN,),
+    "move_left": (pygame.K_a, pygame.K_LEFT),
+    "move_right": (pygame.K_RIGHT,),
+    "interact": (pygame.K_e, pygame.K_SPACE),
+}
+
+DEBOUNCE_DELAY = 0.2  # Délai minimal entre deux déclenchements d'une même action (s)
+
+
+class InputManager:
+    """Actions du joueur pour la frame courante : maintenues, appuyées et anti-rebond"""
+
+    def __init__(self, controls=None):
+        self.bindings = {}  # {action: (touches,)}
+        self.set_controls(controls or DEFAULT_CONTROLS)
+        self.held = set()  # Actions maintenues cette frame
+        self.previous = set()  # Actions maintenues à la frame précédente
+        self.last_triggered = {}  # {action: instant du dernier déclenchement (perf_counter)}
+        self.key_source = pygame.key.get_pressed  # État du clavier (remplaçable : entrées synthétiques)
+
+    def set_controls(self, controls):
+        """Construit les touches de chaque action depuis {action: nom de touche pygame}"""
+        self.bindings = {action: tuple(keys) for action, keys in ALTERNATE_KEYS.items()}
+        for action, default_name in DEFAULT_CONTROLS.items():
+            key_name = controls.get(action, default_name)
+            try:
+                key = pygame.key.key_code(key_name)
+            except ValueError:
+                print(f"⚠️ Touche inconnue '{key_name}' pour {action}, '{default_name}' utilisée")
+                key = pygame.key.key_code(default_name)
+            self.bindings[action] = (key,) + self.bindings[action]
+
+    def update(self, keys=None):
+        """Lit le clavier une fois par frame (keys : état fourni, ex. entrées synthétiques)"""
+        if keys is None:
+            keys = self.key_source()
+        self.previous = self.held
+        self.held = {action for action, bound_keys in self.bindings.items()
+                     if any(keys[key] for key in bound_keys)}
+
+    def reset(self):
+        """Oublie les appuis en cours (retour à un écran : une touche déjà maintenue ne déclenche rien)"""
+        self.update()
+        self.previous = self.held
+
+    def is_held(self, action):
+        """Vrai tant que l'action est maintenue"""
+        return action in self.held
+
+    def just_pressed(self, action):
+        """Vrai seulement à la frame où l'action commence (front montant)"""
+        return action in self.held and action not in self.previous
+
+    def trigger(self, action, delay=DEBOUNCE_DELAY):
+        """Front montant filtré par un anti-rebond temporel (sans attendre)"""
+        if not self.just_pressed(action):
+            return False
+        now = time.perf_counter()
+        if now - self.last_triggered.get(action, float("-inf")) < delay:
+            return False
+        self.last_triggered[action] = now
+        return True
+
+    def matches(self, action, key):
+        """Vrai si la touche d'un événement KEYDOWN correspond à l'action"""
+        return key in self.bindings.get(action, ())
+
+    def movement(self):
+        """Direction demandée (-1, 0 ou 1 sur chaque axe ; bas et droite l'emportent)"""
+        move_x = 0
+        move_y = 0
+        if "move_up" in self.held:
+            move_y = -1
+        if "move_down" in self.held:
+            move_y = 1
+        if "move_left" in self.held:
+            move_x = -1
+        if "move_right" in self.held:
+            move_x = 1
+        return move_x, move_y
@@ -1,33 +1,72 @@
 #!/usr/bin/env python3
 """
 Last Man Standing - Jeu d'Action 2D
+
+Usage : python main.py [--headless [--frames N] [--seed S] [--preset 1|2|3] [--stop-on-game-over]]
 """
 
-import pygame
+import argparse
+import os
 import sys
-from game_manager import GameManager
-from config import Config
-from game_settings import GameSettings
+import time
+from startup_trace import StartupTrace  # En premier : la chronologie mesure aussi les imports
+
+with StartupTrace.phase("imports"):
+    with StartupTrace.phase("import_pygame"):
+        import pygame
+    with StartupTrace.phase("import_game"):
+        from game_manager import GameManager
+        from config import Config
+        from game_settings import GameSettings
+
+def parse_arguments():
+    """Options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Last Man Standing")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulation sans fenêtre ni rendu, à vitesse maximale (voir headless.py)")
+    parser.add_argument("--frames", type=int, default=3600, help="frames simulées en mode --headless")
+    parser.add_argument("--seed", type=int, default=None, help="graine de la simulation --headless")
+    parser.add_argument("--preset", type=int, choices=(1, 2, 3), default=None,
+                        help="preset de résolution (par défaut : celui des paramètres)")
+    parser.add_argument("--stop-on-game-over", action="store_true",
+                        help="arrêter la simulation --headless à la première fin de partie")
+    return parser.parse_args()
 
 def main():
     """Fonction principale du jeu"""
+    started_at = time.perf_counter()  # Référence du délai jusqu'à la première frame du menu
+    args = parse_arguments()
+    if args.headless:
+        # Avant pygame.init : surfaces sans fenêtre (convert_alpha fonctionne) et pas de son
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    
     # Charger les paramètres de jeu
-    game_settings = GameSettings()
+    with StartupTrace.phase("settings"):
+        game_settings = GameSettings()
     
     # === CONFIGURATION DE LA RESOLUTION ===
     # Utiliser la configuration sauvegardée ou forcer en 1440p pour les tests
-    screen_size = game_settings.get_screen_size()
+    screen_size = args.preset or game_settings.get_screen_size()
     if screen_size is None:
         screen_size = 3  # Test en 1440p pour ajustements
     
     try:
-        pygame.init()
+        with StartupTrace.phase("pygame_init"):
+            pygame.init()
         
         # Créer la configuration
-        config = Config(forced_screen_size=screen_size)
+        with StartupTrace.phase("config"):
+            config = Config(forced_screen_size=screen_size)
+        
+        if args.headless:
+            from headless import run_headless
+            game_settings.apply_to_config(config)
+            run_headless(config, args.frames, args.seed, args.stop_on_game_over)
+            return
         
         # Créer et lancer le gestionnaire de jeu avec les paramètres
-        game_manager = GameManager(config, game_settings)
+        game_manager = GameManager(config, game_settings, started_at)
         game_manager.run()
         
     except KeyboardInterrupt:
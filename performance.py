@@ -0,0 +1,310 @@
+"""
+Outils de performance en jeu
+============================
+
+Mesure du temps de frame et contrôleurs qui adaptent le rendu à la charge.
+"""
+
+from collections import deque
+
+from entities import AshPool
+
+
+class FrameTimeWindow:
+    """Fenêtre glissante de temps de frame (ms) partagée par les contrôleurs adaptatifs"""
+
+    def __init__(self, size):
+        self.frame_times = deque(maxlen=size)
+
+    def add(self, frame_time_ms):
+        self.frame_times.append(frame_time_ms)
+
+    def clear(self):
+        self.frame_times.clear()
+
+    def is_full(self):
+        return len(self.frame_times) == self.frame_times.maxlen
+
+    def average(self):
+        """Temps de frame moyen sur la fenêtre (ms)"""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+
+class DynamicResolutionController:
+    """Ajuste Config.RENDER_SCALE selon le temps de frame mesuré
+
+    Le contrôleur observe une fenêtre glissante de temps de frame (travail hors attente
+    de clock.tick). Si la moyenne dépasse le budget (1000 / FPS) d'une marge, l'échelle
+    descend d'un cran ; s'il reste assez de marge, elle remonte d'un cran. Après chaque
+    changement, la fenêtre est vidée et un délai de stabilisation évite les oscillations.
+
+    Une échelle plus basse n'est pas toujours moins chère (l'agrandissement logiciel
+    d'un facteur non entier coûte plusieurs ms) : après une descente, la moyenne mesurée
+    à la nouvelle échelle est comparée à celle d'avant. Sans gain d'au moins
+    DYNAMIC_RESOLUTION_MIN_GAIN, l'échelle précédente est rétablie et l'échelle essayée
+    est ignorée pendant DYNAMIC_RESOLUTION_RETRY_FRAMES frames.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.enabled = config.DYNAMIC_RESOLUTION
+        self.frame_budget_ms = 1000.0 / config.FPS
+        self.frame_times = FrameTimeWindow(config.DYNAMIC_RESOLUTION_WINDOW)
+        self.cooldown = 0  # Frames restantes avant la prochaine décision
+        self.decision_log = deque(maxlen=config.DYNAMIC_RESOLUTION_LOG_SIZE)
+        self.frame_count = 0
+        self.pending_check = None  # (échelle précédente, moyenne avant la descente) à vérifier
+        self.ineffective_scales = {}  # {échelle sans gain: frame à partir de laquelle la réessayer}
+
+    def toggle(self):
+        """Active ou désactive le contrôleur"""
+        self.enabled = not self.enabled
+        self.frame_times.clear()
+        self.cooldown = 0
+        self.pending_check = None
+        self.ineffective_scales.clear()
+        self._log(f"{'activé' if self.enabled else 'désactivé'}")
+
+    def get_average_frame_time(self):
+        """Temps de frame moyen sur la fenêtre glissante (ms)"""
+        return self.frame_times.average()
+
+    def record_frame(self, frame_time_ms):
+        """Enregistre le temps de la dernière frame et ajuste l'échelle si nécessaire"""
+        self.frame_count += 1
+        if not self.enabled:
+            return
+
+        self.frame_times.add(frame_time_ms)
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+        if not self.frame_times.is_full():
+            return  # Attendre une fenêtre complète avant de décider
+
+        average = self.get_average_frame_time()
+        if self.pending_check is not None and self._check_last_step_down(average):
+            return
+
+        scales = self.config.RENDER_SCALES  # Du plus grand au plus petit
+        current = self.config.RENDER_SCALE
+        index = scales.index(current) if current in scales else 0
+
+        if average > self.frame_budget_ms * self.config.DYNAMIC_RESOLUTION_DOWN_THRESHOLD:
+            lower = self._next_scale(scales[index + 1:])
+            if lower is not None:
+                self._change_scale(lower, f"{average:.1f} ms > budget")
+                self.pending_check = (current, average)
+        elif average < self.frame_budget_ms * self.config.DYNAMIC_RESOLUTION_UP_THRESHOLD:
+            higher = self._next_scale(reversed(scales[:index]))
+            if higher is not None:
+                self._change_scale(higher, f"{average:.1f} ms, marge disponible")
+
+    def _check_last_step_down(self, average):
+        """Vérifie que la dernière descente a réduit le temps de frame, sinon la défait
+
+        Retourne True si l'échelle précédente a été rétablie.
+        """
+        previous_scale, previous_average = self.pending_check
+        self.pending_check = None
+        if average < previous_average * (1.0 - self.config.DYNAMIC_RESOLUTION_MIN_GAIN):
+            return False
+
+        tried_scale = self.config.RENDER_SCALE
+        self.ineffective_scales[tried_scale] = self.frame_count + self.config.DYNAMIC_RESOLUTION_RETRY_FRAMES
+        self._change_scale(previous_scale, f"{average:.1f} ms à {int(tried_scale * 100)}% "
+                                           f"contre {previous_average:.1f} ms : aucun gain")
+        return True
+
+    def _next_scale(self, candidates):
+        """Première échelle candidate qui n'est pas marquée sans gain (None s'il n'y en a pas)"""
+        for scale in candidates:
+            retry_frame = self.ineffective_scales.get(scale)
+            if retry_frame is None or self.frame_count >= retry_frame:
+                self.ineffective_scales.pop(scale, None)
+                return scale
+        return None
+
+    def _change_scale(self, new_scale, reason):
+        """Applique une nouvelle échelle et démarre la période de stabilisation"""
+        old_scale = self.config.RENDER_SCALE
+        self.config.RENDER_SCALE = new_scale
+        self.frame_times.clear()
+        self.cooldown = self.config.DYNAMIC_RESOLUTION_COOLDOWN
+        self._log(f"{int(old_scale * 100)}% -> {int(new_scale * 100)}% ({reason})")
+
+    def _log(self, message):
+        """Ajoute une décision au journal (affiché dans l'overlay de debug)"""
+        entry = f"[{self.frame_count}] {message}"
+        self.decision_log.append(entry)
+        print(f"🖥️ Résolution dynamique : {entry}")
+
+
+class EffectQualityGovernor:
+    """Applique graphics.particles_quality aux effets (particules, cendres, soudure, morts)
+
+    Le niveau actif est écrit dans Config.EFFECT_QUALITY ; les budgets de chaque niveau
+    sont décrits dans Config.EFFECT_QUALITY_LEVELS. En mode "auto", le niveau baisse
+    d'un cran quand le temps de frame moyen approche du budget et remonte quand il
+    reste de la marge, avec la même fenêtre et la même stabilisation que la résolution
+    dynamique.
+    """
+
+    MODES = ("high", "medium", "low", "auto")
+
+    def __init__(self, config):
+        self.config = config
+        self.frame_budget_ms = 1000.0 / config.FPS
+        self.frame_times = FrameTimeWindow(config.DYNAMIC_RESOLUTION_WINDOW)
+        self.cooldown = 0
+        self.mode = None
+        self.set_mode(config.PARTICLES_QUALITY)
+
+    @property
+    def level(self):
+        """Budget du niveau actif (dictionnaire de Config.EFFECT_QUALITY_LEVELS)"""
+        return self.config.EFFECT_QUALITY_LEVELS[self.config.EFFECT_QUALITY]
+
+    def set_mode(self, mode):
+        """Choisit un niveau fixe (low, medium, high) ou le mode auto"""
+        if mode not in self.MODES:
+            print(f"⚠️ Qualité des effets invalide: {mode}")
+            mode = "high"
+        self.mode = mode
+        self.config.PARTICLES_QUALITY = mode
+        # Le mode auto démarre au niveau le plus riche et descend si nécessaire
+        self.config.EFFECT_QUALITY = self.config.EFFECT_QUALITY_ORDER[0] if mode == "auto" else mode
+        self.frame_times.clear()
+        self.cooldown = 0
+
+    def cycle_mode(self):
+        """Passe au mode suivant (high -> medium -> low -> auto)"""
+        index = self.MODES.index(self.mode)
+        self.set_mode(self.MODES[(index + 1) % len(self.MODES)])
+        print(f"✨ Qualité des effets : {self.mode}")
+
+    def scale_count(self, count, minimum=0):
+        """Nombre d'éléments à émettre pour un effet au niveau actif (0 si count vaut 0)"""
+        if count <= 0:
+            return 0
+        return max(minimum, int(count * self.level["particle_scale"]))
+
+    def has_room(self, live_particles):
+        """Indique si le plafond de particules vivantes du niveau actif est atteint"""
+        return live_particles < self.level["max_particles"]
+
+    def record_frame(self, frame_time_ms):
+        """Enregistre le temps de la dernière frame (seulement utile en mode auto)"""
+        if self.mode != "auto":
+            return
+
+        self.frame_times.add(frame_time_ms)
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+        if not self.frame_times.is_full():
+            return
+
+        average = self.frame_times.average()
+        order = self.config.EFFECT_QUALITY_ORDER
+        index = order.index(self.config.EFFECT_QUALITY)
+
+        if average > self.frame_budget_ms * self.config.EFFECT_QUALITY_DOWN_THRESHOLD and index < len(order) - 1:
+            self._change_level(order[index + 1], average)
+        elif average < self.frame_budget_ms * self.config.EFFECT_QUALITY_UP_THRESHOLD and index > 0:
+            self._change_level(order[index - 1], average)
+
+    def _change_level(self, new_level, average):
+        """Applique un nouveau niveau et démarre la période de stabilisation"""
+        print(f"✨ Qualité des effets (auto) : {self.config.EFFECT_QUALITY} -> {new_level} ({average:.1f} ms)")
+        self.config.EFFECT_QUALITY = new_level
+        self.frame_times.clear()
+        self.cooldown = self.config.DYNAMIC_RESOLUTION_COOLDOWN
+
+
+class EffectBudget:
+    """Budget global des effets visuels avec éviction par priorité
+
+    Chaque catégorie (liste d'effets de Game) a une limite en primitives vivantes
+    (particule, sprite, cendre ou crâne) et un rang dans Config.EFFECT_PRIORITIES.
+    Quand une limite ou le plafond global est dépassé, les effets les plus éloignés
+    du joueur sont évincés en premier, puis les plus anciens, en commençant par les
+    catégories les moins prioritaires. Les évictions sont comptées pour l'overlay.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.evictions = {}  # Effets évincés lors du dernier passage, par catégorie
+        self.total_evictions = 0  # Effets évincés depuis le début de la partie
+        self.total_cost = 0  # Primitives vivantes après le dernier passage
+
+    def reset(self):
+        """Remet les compteurs à zéro (redémarrage de partie)"""
+        self.evictions = {}
+        self.total_evictions = 0
+        self.total_cost = 0
+
+    def enforce(self, game):
+        """Applique les limites par catégorie puis le plafond global (une fois par frame)"""
+        self.evictions = {}
+        player_x = game.player.x + game.player.size / 2
+        player_y = game.player.y + game.player.size / 2
+        ash_counts = AshPool.counts_by_owner() if game.beam_death_effects else {}
+
+        costs = {}
+        for category in self.config.EFFECT_PRIORITIES:
+            category_costs = self._costs(category, getattr(game, category), ash_counts)
+            limit = self.config.EFFECT_BUDGET_LIMITS[category]
+            costs[category] = self._evict(game, category, category_costs, limit, player_x, player_y)
+
+        # Plafond global : décimer d'abord les catégories les moins prioritaires
+        excess = sum(sum(category_costs) for category_costs in costs.values()) - self.config.EFFECT_BUDGET_TOTAL
+        for category in reversed(self.config.EFFECT_PRIORITIES):
+            if excess <= 0:
+                break
+            category_cost = sum(costs[category])
+            costs[category] = self._evict(game, category, costs[category], category_cost - excess, player_x, player_y)
+            excess -= category_cost - sum(costs[category])
+
+        self.total_cost = sum(sum(category_costs) for category_costs in costs.values())
+
+    def _costs(self, category, effects, ash_counts):
+        """Coût de chaque effet d'une catégorie, en primitives dessinées"""
+        if category == "beam_death_effects":
+            return [ash_counts.get(effect.owner_id, 0) for effect in effects]
+        if category == "boss_death_effects":
+            return [len(effect.skulls) for effect in effects]
+        return [1] * len(effects)
+
+    def _evict(self, game, category, costs, max_cost, player_x, player_y):
+        """Évince les effets les moins importants jusqu'à max_cost ; retourne les coûts restants"""
+        total = sum(costs)
+        if total <= max_cost:
+            return costs
+
+        effects = getattr(game, category)
+        near_radius = self.config.EFFECT_NEAR_RADIUS
+
+        def eviction_key(index):
+            # Tranche de distance au joueur la plus grande d'abord, puis le plus ancien
+            effect = effects[index]
+            dx = getattr(effect, 'x', getattr(effect, 'boss_x', player_x)) - player_x
+            dy = getattr(effect, 'y', getattr(effect, 'boss_y', player_y)) - player_y
+            return (-int((dx * dx + dy * dy) ** 0.5 // near_radius), index)
+
+        evicted = set()
+        for index in sorted(range(len(effects)), key=eviction_key):
+            if total <= max_cost:
+                break
+            evicted.add(index)
+            total -= costs[index]
+
+        if category == "beam_death_effects":
+            AshPool.remove_owners({effects[index].owner_id for index in evicted})
+        setattr(game, category, [effect for index, effect in enumerate(effects) if index not in evicted])
+
+        self.evictions[category] = self.evictions.get(category, 0) + len(evicted)
+        self.total_evictions += len(evicted)
+        return [cost for index, cost in enumerate(costs) if index not in evicted]
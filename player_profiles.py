@@ -7,9 +7,6 @@ Chaque profil peut avoir des armes de départ différentes, des modificateurs de
 des compétences spéciales, etc.
 """
 
-from weapons import CannonWeapon, LightningWeapon, OrbWeapon, BeamWeapon
-from weapons import SpeedSkill, RegenSkill, ShieldSkill, MagnetSkill
-
 
 class PlayerProfile:
     """Classe de base pour un profil de joueur"""
@@ -19,8 +16,8 @@ class PlayerProfile:
         self.description = description
         self.profile_id = profile_id  # ID numérique du profil
         
-        # Arme de départ
-        self.starting_weapon_class = CannonWeapon
+        # Arme de départ (nom de la classe dans weapons.py, importé seulement au lancement d'une partie)
+        self.starting_weapon_class = "CannonWeapon"
         self.weapon_modifications = {}  # Modifications spécifiques aux armes
         
         # Modificateurs de stats de base
@@ -55,7 +52,8 @@ class PlayerProfile:
     
     def get_starting_weapon(self):
         """Retourne l'arme de départ configurée pour ce profil"""
-        weapon = self.starting_weapon_class()
+        import weapons  # Import différé : la carte de démarrage n'a pas besoin des armes
+        weapon = getattr(weapons, self.starting_weapon_class)()
         self.apply_weapon_modifications(weapon)
         return weapon
     
@@ -75,7 +73,7 @@ class WarriorProfile(PlayerProfile):
         super().__init__("Guerrier", "Spécialiste défensif avec orbes protectrices", profile_id=1)
         
         # Arme de départ : Orb
-        self.starting_weapon_class = OrbWeapon
+        self.starting_weapon_class = "OrbWeapon"
         
         # Stats : Plus de vie, un peu plus lent
         self.health_multiplier = 1.3  # +30% de vie
@@ -95,7 +93,7 @@ class MageProfile(PlayerProfile):
         super().__init__("Mage", "Combattant équilibré avec armes projectiles", profile_id=2)
         
         # Arme de départ : Canon
-        self.starting_weapon_class = CannonWeapon
+        self.starting_weapon_class = "CannonWeapon"
         
         # Modifications du Canon pour le Mage
         self.weapon_modifications = {
@@ -120,7 +118,7 @@ class AssassinProfile(PlayerProfile):
         super().__init__("Assassin", "Combattant rapide avec éclairs destructeurs", profile_id=3)
         
         # Arme de départ : Lightning
-        self.starting_weapon_class = LightningWeapon
+        self.starting_weapon_class = "LightningWeapon"
         
         # Lightning modifié pour l'Assassin
         self.weapon_modifications = {
@@ -0,0 +1,171 @@
+"""
+File de rendu par couches
+=========================
+
+Les entités soumettent leurs blits (surface, position) dans une couche, puis la file
+dessine chaque couche dans l'ordre avec un seul appel Surface.blits (ou fblits sur
+pygame-ce) par série de blits consécutifs. Les entités qui dessinent des primitives
+soumettent un appel de dessin, exécuté à sa place pour conserver l'ordre.
+
+À une échelle de rendu interne < 1, toutes les couches sont dessinées dans la surface
+réduite du monde, dans le même ordre : sprites redimensionnés une seule fois par échelle
+(les rotations sont appliquées au sprite déjà réduit) et appels de dessin appelés avec
+scale=échelle pour tracer leurs primitives à la même résolution. Seul le HUD reste natif.
+"""
+
+import pygame
+
+# Ordre de dessin des couches (identique à l'ordre historique de Game.draw_entities)
+LAYER_ORDER = (
+    "ground_decals",   # Décalcomanies au sol
+    "enemies",         # Ennemis
+    "enemy_bars",      # Barres de vie des ennemis (au-dessus de tous les sprites d'ennemis)
+    "boss",            # Boss et sa barre de vie (au-dessus des ennemis et de leurs barres)
+    "projectiles",     # Projectiles du canon, des ennemis et du boss
+    "effects",         # Éclairs, beams, particules, orbes, effets de mort
+    "collectibles",    # Coeurs, pièces
+    "player",          # Joueur (toujours au premier plan)
+)
+
+# fblits (pygame-ce) évite de construire la liste des rectangles retournés
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# Sprites redimensionnés gardés par échelle ; le cache est vidé au-delà (éclairs et effets
+# de mort ont chacun leur surface, ils ne doivent pas s'accumuler)
+MAX_SCALED_SPRITES = 2048
+
+
+class RenderQueue:
+    """File de rendu : regroupe les blits de chaque couche en appels groupés
+
+    Les éléments d'une couche sont des tuples : (surface, position) pour un blit, déjà
+    au format de Surface.blits, (surface, centre, angle, alpha) pour un sprite tourné et
+    (None, fonction, arguments) pour un appel de dessin. Une couche qui ne contient que
+    des blits est passée telle quelle à Surface.blits, sans parcours en Python.
+    """
+
+    def __init__(self):
+        self.layers = {layer: [] for layer in LAYER_ORDER}
+        self.mixed_layers = set()  # Couches contenant des sprites tournés ou des appels de dessin
+        self.blit_count = 0  # Blits groupés lors du dernier flush
+        self.batch_count = 0  # Appels blits/fblits lors du dernier flush
+        self.call_count = 0  # Appels de dessin individuels lors du dernier flush
+        # Sprites redimensionnés à l'échelle courante {surface source: surface}
+        self.scaled_sprites = {}
+        self.scaled_sprites_scale = None
+
+    def blit(self, layer, surface, dest):
+        """Soumet un blit simple (surface, position) dans une couche"""
+        self.layers[layer].append((surface, dest))
+
+    def blit_rotated(self, layer, surface, angle, center, alpha=None):
+        """Soumet un sprite tourné de angle degrés et centré sur center (alpha : opacité de la copie tournée)
+
+        La rotation est faite au flush, sur le sprite déjà redimensionné à l'échelle de rendu.
+        """
+        self.layers[layer].append((surface, center, angle, alpha))
+        self.mixed_layers.add(layer)
+
+    def draw(self, layer, draw_function, *args):
+        """Soumet un appel de dessin draw_function(screen, *args) exécuté à sa place dans la couche
+
+        La fonction est appelée avec l'argument nommé scale (échelle de la surface de dessin).
+        """
+        self.layers[layer].append((None, draw_function, args))
+        self.mixed_layers.add(layer)
+
+    def clear(self):
+        """Vide toutes les couches sans dessiner"""
+        for items in self.layers.values():
+            items.clear()
+        self.mixed_layers.clear()
+
+    def flush(self, screen, scale=1.0):
+        """Dessine toutes les couches dans l'ordre puis vide la file
+
+        À une échelle < 1 (surface du monde réduite), les sprites viennent du cache
+        redimensionné, les positions sont multipliées par scale et les appels de dessin
+        reçoivent scale pour tracer leurs primitives à la même échelle.
+        """
+        self.blit_count = 0
+        self.batch_count = 0
+        self.call_count = 0
+        get_scaled = self.get_scaled
+
+        for layer in LAYER_ORDER:
+            items = self.layers[layer]
+            if not items:
+                continue
+            if layer not in self.mixed_layers:
+                if scale == 1.0:
+                    self._blit_batch(screen, items)
+                else:
+                    self._blit_batch(screen, [(get_scaled(sprite, scale), (int(dest[0] * scale), int(dest[1] * scale)))
+                                              for sprite, dest in items])
+                items.clear()
+                continue
+
+            batch = []
+            for item in items:
+                surface = item[0]
+                if surface is None:
+                    # Appel de dessin : vider d'abord les blits qui le précèdent
+                    if batch:
+                        self._blit_batch(screen, batch)
+                        batch = []
+                    item[1](screen, *item[2], scale=scale)
+                    self.call_count += 1
+                elif len(item) == 2:
+                    if scale == 1.0:
+                        batch.append(item)
+                    else:
+                        dest = item[1]
+                        batch.append((get_scaled(surface, scale), (int(dest[0] * scale), int(dest[1] * scale))))
+                else:
+                    center = item[1]
+                    batch.append(self._rotated(surface, (center[0] * scale, center[1] * scale),
+                                               item[2], item[3], scale))
+
+            if batch:
+                self._blit_batch(screen, batch)
+            items.clear()
+        self.mixed_layers.clear()
+
+    def get_scaled(self, surface, scale):
+        """Sprite redimensionné à l'échelle de rendu (calculé une fois par sprite et par échelle)"""
+        if scale == 1.0:
+            return surface
+        if scale != self.scaled_sprites_scale:
+            self.scaled_sprites.clear()
+            self.scaled_sprites_scale = scale
+        scaled_surface = self.scaled_sprites.get(surface)
+        if scaled_surface is None:
+            if len(self.scaled_sprites) >= MAX_SCALED_SPRITES:
+                self.scaled_sprites.clear()
+            width, height = surface.get_size()
+            scaled_surface = pygame.transform.scale(
+                surface, (max(1, round(width * scale)), max(1, round(height * scale))))
+            self.scaled_sprites[surface] = scaled_surface
+        # Opacité de la source (fondus des éclairs et des effets), qui change d'une frame à l'autre
+        alpha = surface.get_alpha()
+        if scaled_surface.get_alpha() != alpha:
+            scaled_surface.set_alpha(alpha)
+        return scaled_surface
+
+    def _rotated(self, surface, center, angle, alpha, scale=1.0):
+        """Retourne (sprite tourné, rectangle centré sur center) à l'échelle de rendu"""
+        rotated_sprite = pygame.transform.rotate(self.get_scaled(surface, scale), angle)
+        if alpha is not None:
+            rotated_sprite.set_alpha(alpha)
+        rotated_rect = rotated_sprite.get_rect()
+        rotated_rect.center = center
+        return rotated_sprite, rotated_rect
+
+    def _blit_batch(self, screen, batch):
+        """Envoie une série de blits en un seul appel"""
+        if HAS_FBLITS:
+            screen.fblits(batch)
+        else:
+            screen.blits(batch, doreturn=False)
+        self.blit_count += len(batch)
+        self.batch_count += 1
@@ -8,90 +8,62 @@ pour accéder aux options du jeu.
 
 import pygame
 import math
+import copy
 from entities import Player
 from background import Background
 from player_profiles import PlayerProfileManager
+from startup_trace import StartupTrace
+from asset_cache import AssetCache
+from font_registry import FontRegistry
+from input_manager import InputManager
 
 
 class PlayerSelector:
     """Gère la sélection visuelle des joueurs"""
     
+    PLAYER_SIZE = 64  # Taille du joueur affiché dans le sélecteur (au lieu de Config.PLAYER_SIZE)
+    
     def __init__(self, config):
         self.config = config
         self.selected_player_id = 1  # ID du joueur sélectionné
         self.player_sprites = {}
-        self.player_entities = {}  # Entités Player pour l'animation
+        self.player_entities = {}  # Entités Player pour l'animation, créées au premier affichage
         self.animation_time = 0.0
-        self.load_player_sprites()
     
-    def load_player_sprites(self):
-        """Charge les sprites des 3 joueurs et crée des entités pour l'animation"""
-        sprite_configs = {
-            1: ("assets/player/player2.png", 1),  # Guerrier
-            2: ("assets/player/player3.png", 2),  # Mage  
-            3: ("assets/player/player4.png", 3)   # Assassin
-        }
-        
-        for player_id, (sprite_path, sprite_type) in sprite_configs.items():
-            try:
-                # Créer une configuration complète en copiant la config principale
-                temp_config = type('TempConfig', (), {})()
-                
-                # Copier tous les attributs nécessaires de la config principale
-                for attr in dir(self.config):
-                    if not attr.startswith('_'):
-                        setattr(temp_config, attr, getattr(self.config, attr))
-                
-                # Modifier les attributs spécifiques
-                temp_config.PLAYER_SPRITE_TYPE = sprite_type
-                temp_config.PLAYER_SIZE = 64  # Taille plus grande pour l'affichage
-                
-                # Créer le joueur temporaire
-                temp_player = Player(0, 0, temp_config)
-                self.player_entities[player_id] = temp_player
-                
-                print(f"Entité joueur {player_id} créée pour animation")
-            except Exception as e:
-                print(f"Erreur création entité joueur {player_id}: {e}")
-                # Créer un sprite de remplacement simple
-                fallback_sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
-                color = [(255, 100, 100), (100, 255, 100), (100, 100, 255)][player_id - 1]
-                pygame.draw.circle(fallback_sprite, color, (32, 32), 30)
-                self.player_sprites[player_id] = fallback_sprite
+    def get_player_entity(self, player_id):
+        """Retourne l'entité animée d'un joueur (créée à la demande, frames partagées avec le jeu)"""
+        if player_id in self.player_entities or player_id in self.player_sprites:
+            return self.player_entities.get(player_id)
+        
+        try:
+            # Copie légère de la config : seuls le type et la taille d'affichage changent
+            temp_config = copy.copy(self.config)
+            temp_config.PLAYER_SPRITE_TYPE = player_id  # 1 Guerrier, 2 Mage, 3 Assassin
+            temp_config.PLAYER_SIZE = self.PLAYER_SIZE  # Taille plus grande pour l'affichage
+            
+            self.player_entities[player_id] = Player(0, 0, temp_config)
+            print(f"Entité joueur {player_id} créée pour animation")
+        except Exception as e:
+            print(f"Erreur création entité joueur {player_id}: {e}")
+            # Créer un sprite de remplacement simple
+            fallback_sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
+            color = [(255, 100, 100), (100, 255, 100), (100, 100, 255)][player_id - 1]
+            pygame.draw.circle(fallback_sprite, color, (32, 32), 30)
+            self.player_sprites[player_id] = fallback_sprite
+        return self.player_entities.get(player_id)
     
     def update(self, dt):
         """Met à jour les animations des joueurs"""
         self.animation_time += dt
         
-        # Mettre à jour les animations de tous les joueurs
-        for player_id, player_entity in self.player_entities.items():
-            if hasattr(player_entity, 'update'):
-                # Créer un objet simulant les touches pressées pour forcer l'animation
-                class FakeKeys:
-                    def __getitem__(self, key):
-                        # Simuler une touche pressée pour déclencher l'animation
-                        import pygame
-                        if key == pygame.K_DOWN:  # Toujours "presser" la touche BAS
-                            return True
-                        return False
-                
-                fake_keys = FakeKeys()
-                
-                # Forcer l'animation en simulant un mouvement
-                old_x, old_y = player_entity.x, player_entity.y
-                player_entity.vel_x = 0
-                player_entity.vel_y = 0.1  # Très léger mouvement pour déclencher l'animation
-                
-                # Mettre à jour avec les fausses touches (Player.update prend seulement keys)
-                player_entity.update(fake_keys)
-                
-                # Restaurer la position exacte (pas de mouvement réel)
-                player_entity.x, player_entity.y = old_x, old_y
+        # Mettre à jour les animations des joueurs déjà affichés (sur place, sans déplacement)
+        for player_entity in self.player_entities.values():
+            player_entity.animate()
     
     def draw(self, screen, zone_x, zone_y, zone_width, zone_height):
         """Dessine la sélection de joueur dans la zone spécifiée"""
         # Dessiner le titre "SELECTION DU JOUEUR" en haut de la zone
-        title_font = pygame.font.Font(None, 28)
+        title_font = FontRegistry.get(28)
         title_text = title_font.render("SELECTION DU JOUEUR", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(zone_x + zone_width // 2, zone_y + 25))
         screen.blit(title_text, title_rect)
@@ -123,22 +95,15 @@ class PlayerSelector:
                 pygame.draw.rect(screen, (100, 100, 100), selection_rect, 2)
             
             # Dessiner l'entité animée du joueur
-            if player_id in self.player_entities:
-                player_entity = self.player_entities[player_id]
-                # Sauvegarder la position originale
-                orig_x, orig_y = player_entity.x, player_entity.y
-                # Positionner temporairement pour le dessin
-                player_entity.x = sprite_x
-                player_entity.y = sprite_y
-                # Dessiner le joueur animé
-                player_entity.draw(screen)
-                # Restaurer la position originale
-                player_entity.x, player_entity.y = orig_x, orig_y
+            player_entity = self.get_player_entity(player_id)
+            if player_entity:
+                # Dessiner le joueur animé à la position du sprite (offset explicite, sans modifier l'entité)
+                player_entity.draw(screen, camera_x=player_entity.x - sprite_x, camera_y=player_entity.y - sprite_y)
             
             # Nom du profil sous le sprite (plus bas)
             from player_profiles import PlayerProfileManager
             profile = PlayerProfileManager.get_profile(player_id)
-            name_font = pygame.font.Font(None, 24)
+            name_font = FontRegistry.get(24)
             name_text = name_font.render(profile.name, True, (255, 255, 255))
             name_rect = name_text.get_rect(center=(sprite_x + sprite_size // 2, sprite_y + sprite_size + 35))
             screen.blit(name_text, name_rect)
@@ -232,8 +197,8 @@ class StartMapZone:
     def _draw_zone_text(self, screen, screen_x, screen_y):
         """Dessine le titre et la description de la zone"""
         # Police pour le titre
-        title_font = pygame.font.Font(None, 48)
-        desc_font = pygame.font.Font(None, 32)
+        title_font = FontRegistry.get(48)
+        desc_font = FontRegistry.get(32)
         
         # Dessiner le titre si présent
         if self.title:
@@ -260,8 +225,12 @@ class StartMap:
         self.map_height = 30
         self.tile_size = 64
         
+        # Entrées du joueur (touches de GameSettings.controls, lues une fois par frame)
+        self.input = InputManager(config.CONTROLS)
+        
         # Configurer le curseur de souris comme dans le jeu principal
-        self._setup_mouse_cursor()
+        with StartupTrace.phase("cursor"):
+            self._setup_mouse_cursor()
         
         # Créer le sélecteur de joueur
         self.player_selector = PlayerSelector(config)
@@ -290,12 +259,8 @@ class StartMap:
         # Accélérer le joueur x4 pour la navigation dans le menu
         self.player.speed *= 4
         
-        # Créer un arrière-plan pour la carte de démarrage
-        self.background = Background(config)
-        
-        # Forcer la taille de la carte pour le menu
-        self.background.map_width = self.map_width
-        self.background.map_height = self.map_height
+        # Créer un arrière-plan à la taille de la carte du menu (pas de génération 100x100 inutile)
+        self.background = Background(config, self.map_width, self.map_height)
         
         # Caméra
         self.camera_x = 0
@@ -308,9 +273,9 @@ class StartMap:
         self.current_zone = None
         
         # Police pour le texte
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_large = FontRegistry.get(48)
+        self.font_medium = FontRegistry.get(32)
+        self.font_small = FontRegistry.get(24)
         
         # Action sélectionnée (None tant qu'aucune zone n'est activée)
         self.selected_action = None
@@ -415,27 +380,14 @@ class StartMap:
         # Mettre à jour les animations du sélecteur de joueur
         self.player_selector.update(dt)
         
-        # Gérer les entrées du joueur
-        keys = pygame.key.get_pressed()
+        # Gérer les entrées du joueur (une seule lecture du clavier par frame)
+        self.input.update()
         
         # Mouvement du joueur
-        vel_x, vel_y = 0, 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            vel_x = -self.player.speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            vel_x = self.player.speed
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            vel_y = -self.player.speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            vel_y = self.player.speed
-        
-        # Appliquer le mouvement
-        self.player.vel_x = vel_x
-        self.player.vel_y = vel_y
-        
-        # Obtenir l'état du clavier pour la méthode update du joueur
-        keys = pygame.key.get_pressed()
-        self.player.update(keys)
+        move_x, move_y = self.input.movement()
+        self.player.vel_x = move_x * self.player.speed
+        self.player.vel_y = move_y * self.player.speed
+        self.player.update(self.input)
         
         # Limiter le joueur aux bordures de la carte
         world_width = self.map_width * self.tile_size
@@ -445,7 +397,7 @@ class StartMap:
         self.player.y = max(0, min(world_height - self.player.size, self.player.y))
         
         # Vérifier les collisions avec les sprites de sélection
-        self._check_sprite_collision(keys)
+        self._check_sprite_collision()
         
         # Mettre à jour la caméra pour suivre le joueur
         self._update_camera()
@@ -469,7 +421,7 @@ class StartMap:
         self.camera_x = max(0, min(world_width - self.config.WINDOW_WIDTH, target_camera_x))
         self.camera_y = max(0, min(world_height - self.config.WINDOW_HEIGHT, target_camera_y))
     
-    def _check_sprite_collision(self, keys):
+    def _check_sprite_collision(self):
         """Vérifie les collisions avec les sprites de sélection de joueur"""
         # Trouver la zone de sélection de joueur
         player_select_zone = None
@@ -493,16 +445,12 @@ class StartMap:
         # Vérifier les collisions avec chaque sprite
         for player_id, sprite_rect in sprite_positions.items():
             if player_rect.colliderect(sprite_rect):
-                # Collision détectée ! Vérifier si E ou Space est pressé
-                if keys[pygame.K_e] or keys[pygame.K_SPACE]:
+                # Collision détectée ! Un appui sur E ou Espace (anti-rebond, sans bloquer) change de profil
+                if self.input.trigger("interact"):
                     if self.player_selector.selected_player_id != player_id:
                         self.player_selector.selected_player_id = player_id
                         self._update_player_profile()
-                        from player_profiles import PlayerProfileManager
                         print(f"🎮 Profil changé par collision: {PlayerProfileManager.get_profile(player_id).name}")
-                        # Attendre un court délai pour éviter les changements répétés
-                        import time
-                        time.sleep(0.2)
                 break
     
     def _check_zone_hover(self):
@@ -524,15 +472,14 @@ class StartMap:
     
     def _check_zone_interaction(self):
         """Vérifie les interactions avec les zones"""
-        # Interaction avec Espace ou E
-        keys = pygame.key.get_pressed()
-        if self.current_zone and (keys[pygame.K_SPACE] or keys[pygame.K_e]):
+        # Interaction avec Espace ou E (au moment de l'appui)
+        if self.current_zone and self.input.just_pressed("interact"):
             self.selected_action = self.current_zone.action
     
     def handle_event(self, event):
         """Gère les événements de la carte de démarrage"""
         if event.type == pygame.KEYDOWN:
-            if self.current_zone and (event.key == pygame.K_SPACE or event.key == pygame.K_e):
+            if self.current_zone and self.input.matches("interact", event.key):
                 # Gestion spéciale pour la zone de sélection de joueur
                 if self.current_zone.action == "player_select":
                     # Dans la zone de sélection, E/Space ne fait rien de spécial
@@ -610,26 +557,43 @@ class StartMap:
         for zone in self.zones:
             zone.draw(screen, self.camera_x, self.camera_y)
             
-            # Dessiner la sélection de joueur si c'est la zone appropriée
+            # Dessiner la sélection de joueur si c'est la zone appropriée (et qu'elle est à l'écran)
             if zone.action == "player_select":
                 screen_x = zone.x - self.camera_x
                 screen_y = zone.y - self.camera_y
+                if not screen.get_rect().colliderect((screen_x, screen_y, zone.width, zone.height)):
+                    continue
                 self.player_selector.draw(screen, screen_x, screen_y, zone.width, zone.height)
         
         # Dessiner le joueur avec offset de caméra
-        temp_x, temp_y = self.player.x, self.player.y
-        self.player.x -= self.camera_x
-        self.player.y -= self.camera_y
-        self.player.draw(screen)  # La méthode draw du joueur ne prend que screen et optionnellement shield_hits
-        self.player.x, self.player.y = temp_x, temp_y
+        self.player.draw(screen, camera_x=self.camera_x, camera_y=self.camera_y)
+        
+        # Avancement du préchargement des images du jeu
+        self._draw_loading_progress(screen)
         
         # Dessiner le curseur de souris
         # Pas besoin de le dessiner car on utilise le curseur système maintenant
 
+    def _draw_loading_progress(self, screen):
+        """Dessine une barre de chargement discrète tant que le préchargement des assets n'est pas fini"""
+        progress = AssetCache.progress()
+        if progress >= 1.0:
+            return
+        
+        bar_width, bar_height = 240, 10
+        bar_x = 20
+        bar_y = self.config.WINDOW_HEIGHT - 30
+        pygame.draw.rect(screen, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height), border_radius=5)
+        pygame.draw.rect(screen, (100, 200, 100), (bar_x, bar_y, int(bar_width * progress), bar_height), border_radius=5)
+        pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 1, border_radius=5)
+        
+        label = self.font_small.render(f"Chargement des assets... {int(progress * 100)}%", True, (220, 220, 220))
+        screen.blit(label, (bar_x, bar_y - label.get_height() - 4))
+    
     def _setup_mouse_cursor(self):
         """Configure le curseur de souris personnalisé comme dans le jeu principal"""
         try:
-            cursor_image = pygame.image.load("assets/player/pointer2.png").convert_alpha()
+            cursor_image = AssetCache.get_image("assets/player/pointer2.png")
             # Taille adaptative selon la config
             cursor_size = max(48, int(48 * getattr(self.config, 'font_scale', 1.0)))
             cursor_image = pygame.transform.scale(cursor_image, (cursor_size, cursor_size))
@@ -647,6 +611,16 @@ class StartMap:
         """Curseur géré par le système maintenant"""
         pass
     
+    def reset(self):
+        """Replace le joueur au centre de la carte au retour d'une partie (sprites et fond restent chargés)"""
+        self.player.x = self.map_width * self.tile_size // 2
+        self.player.y = self.map_height * self.tile_size // 2
+        self.player.vel_x = 0
+        self.player.vel_y = 0
+        self.current_zone = None
+        self.selected_action = None
+        self.input.reset()  # E ou Espace encore maintenu depuis la partie ne déclenche pas de zone
+    
     def get_selected_action(self):
         """Retourne l'action sélectionnée et la remet à None"""
         action = self.selected_action
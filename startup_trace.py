@@ -0,0 +1,81 @@
+"""
+Chronologie du démarrage
+========================
+
+Enregistre la durée de chaque phase du lancement (imports, initialisation de
+l'affichage, chargement des assets, génération du terrain, premier flip) et
+l'écrit dans un fichier JSON. Ce module n'importe que la bibliothèque standard
+pour pouvoir mesurer les imports de pygame et du jeu.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+
+
+class StartupTrace:
+    """Chronologie du démarrage partagée par tous les modules (jusqu'au premier flip)"""
+
+    origin = time.perf_counter()  # Début de la mesure (import de ce module)
+    phases = []  # [{"name", "start_ms", "duration_ms", "depth"}] dans l'ordre de début
+    depth = 0  # Profondeur des phases imbriquées en cours
+    finished_ms = None  # Instant du premier flip (None tant que le démarrage n'est pas terminé)
+    stats = {}  # Compteurs ajoutés au rapport (ex. succès du cache disque des sprites)
+
+    @classmethod
+    def elapsed_ms(cls):
+        """Temps écoulé depuis le début de la mesure (ms)"""
+        return 1000 * (time.perf_counter() - cls.origin)
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name):
+        """Mesure un bloc ; sans effet une fois le démarrage terminé (rechargements en jeu)"""
+        if cls.finished_ms is not None:
+            yield
+            return
+
+        entry = {"name": name, "start_ms": cls.elapsed_ms(), "duration_ms": None, "depth": cls.depth}
+        cls.phases.append(entry)
+        cls.depth += 1
+        try:
+            yield
+        finally:
+            cls.depth -= 1
+            entry["duration_ms"] = cls.elapsed_ms() - entry["start_ms"]
+
+    @classmethod
+    def finish(cls):
+        """Termine la chronologie (appelé après le premier flip) ; retourne la durée totale"""
+        if cls.finished_ms is None:
+            cls.finished_ms = cls.elapsed_ms()
+        return cls.finished_ms
+
+    @classmethod
+    def totals_by_phase(cls):
+        """Durée cumulée par nom de phase (ms), plus "total" jusqu'au premier flip"""
+        totals = {}
+        for entry in cls.phases:
+            if entry["duration_ms"] is not None:
+                totals[entry["name"]] = totals.get(entry["name"], 0.0) + entry["duration_ms"]
+        if cls.finished_ms is not None:
+            totals["total"] = cls.finished_ms
+        return totals
+
+    @classmethod
+    def save(cls, path):
+        """Écrit la chronologie dans un fichier JSON"""
+        timeline = {
+            "total_ms": cls.finished_ms,
+            "phases": cls.phases,
+            "totals_ms": cls.totals_by_phase(),
+            "stats": cls.stats
+        }
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(timeline, f, indent=4, ensure_ascii=False)
+            print(f"⏱️ Chronologie du démarrage écrite dans {path}")
+            return True
+        except OSError as e:
+            print(f"⚠️ Impossible d'écrire la chronologie du démarrage: {e}")
+            return False
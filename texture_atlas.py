@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Atlas de textures
+=================
+
+Les sprites des ennemis, les drops et les icônes d'interface sont regroupés hors ligne
+dans un atlas par couche de rendu (une image PNG), décrit par un index JSON des
+sous-rectangles de chaque sprite. Après modification d'un de ces sprites, reconstruire
+les atlas avec :
+
+    python texture_atlas.py
+
+Au lancement, AssetCache lit l'index et distribue des vues (subsurface) des atlas au
+lieu d'ouvrir et de décoder chaque fichier. Les sprites redimensionnés d'une couche
+sont copiés dans des pages partagées (AtlasPage) : la file de rendu blitte ainsi
+depuis une seule surface source par couche.
+"""
+
+import json
+import os
+import sys
+
+import pygame
+
+from asset_bundle import resolve_asset_path
+
+ATLAS_INDEX_FILE = "atlas.json"
+ATLAS_INDEX_VERSION = 1
+ATLAS_PADDING = 2  # Marge transparente entre deux sprites (px)
+ATLAS_MAX_WIDTH = 1024  # Largeur maximale d'un atlas empaqueté
+
+# Sprites de chaque atlas (une couche de rendu chacun), chemins relatifs au dossier des assets
+ATLAS_GROUPS = {
+    "enemies": [f"enemy/{i}.png" for i in range(1, 24)] + ["enemy/boss1.png", "enemy/mort.png"],
+    "drops": ["drops/heart.png", "drops/coin.png"],
+    "ui": ["weapons/canon.png", "weapons/orb.png", "weapons/lightning.png", "weapons/beam.png",
+           "competences/vitesse.png", "competences/régénération.png", "competences/bouclier.png",
+           "competences/aimant.png"],
+}
+
+
+def pack_rects(sizes, max_width=ATLAS_MAX_WIDTH, padding=ATLAS_PADDING):
+    """Empaquetage par étagères, sprites triés par hauteur : ([(x, y)] dans l'ordre de sizes, (largeur, hauteur))"""
+    positions = [None] * len(sizes)
+    shelf_x = shelf_y = shelf_height = atlas_width = 0
+    for index in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0])):
+        width, height = sizes[index]
+        if shelf_x > 0 and shelf_x + width > max_width:
+            # Étagère pleine : passer à la suivante
+            shelf_y += shelf_height + padding
+            shelf_x = shelf_height = 0
+        positions[index] = (shelf_x, shelf_y)
+        shelf_x += width + padding
+        shelf_height = max(shelf_height, height)
+        atlas_width = max(atlas_width, shelf_x - padding)
+    return positions, (atlas_width, shelf_y + shelf_height)
+
+
+def build_atlases(assets_dir="assets", output_dir=os.path.join("assets", "atlas")):
+    """Étape hors ligne : empaquette ATLAS_GROUPS en PNG et écrit l'index JSON"""
+    from asset_cache import AssetCache
+
+    output_dir = resolve_asset_path(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    index = {"version": ATLAS_INDEX_VERSION, "atlases": {}}
+    for group, names in ATLAS_GROUPS.items():
+        # Pixels RGBA d'origine (même conversion que le chargement individuel)
+        images = [AssetCache._decode(resolve_asset_path(os.path.join(assets_dir, name))) for name in names]
+        positions, atlas_size = pack_rects([image.get_size() for image in images])
+
+        atlas = pygame.Surface(atlas_size, pygame.SRCALPHA, 32)
+        sprites = {}
+        for name, image, (x, y) in zip(names, images, positions):
+            atlas.blit(image, (x, y))  # Copie exacte sur les pixels transparents
+            sprites[name] = [x, y, image.get_width(), image.get_height()]
+
+        image_file = f"{group}.png"
+        pygame.image.save(atlas, os.path.join(output_dir, image_file))
+        index["atlases"][group] = {"image": image_file, "sprites": sprites}
+        print(f"🧩 Atlas {group} : {len(names)} sprites, {atlas_size[0]}x{atlas_size[1]} px")
+
+    with open(os.path.join(output_dir, ATLAS_INDEX_FILE), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=4, ensure_ascii=False)
+    print(f"✅ Index des atlas écrit dans {os.path.join(output_dir, ATLAS_INDEX_FILE)}")
+
+
+def load_atlas_index(atlas_dir):
+    """Lit l'index des atlas : {nom du sprite: (chemin de l'atlas, couche, (x, y, largeur, hauteur))}"""
+    index_file = resolve_asset_path(os.path.join(atlas_dir, ATLAS_INDEX_FILE))
+    try:
+        with open(index_file, encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        print(f"📄 Index des atlas non trouvé ({index_file}), chargement des sprites fichier par fichier")
+        return {}
+    if index.get("version") != ATLAS_INDEX_VERSION:
+        print(f"⚠️ Version de l'index des atlas non supportée, relancer python texture_atlas.py")
+        return {}
+
+    regions = {}
+    for group, atlas in index["atlases"].items():
+        atlas_path = f"{atlas_dir}/{atlas['image']}"
+        for name, rect in atlas["sprites"].items():
+            regions[name] = (atlas_path, group, tuple(rect))
+    return regions
+
+
+class AtlasPage:
+    """Page d'atlas remplie à l'exécution (sprites redimensionnés d'une couche), par étagères"""
+
+    SIZE = 1024  # Côté d'une page (4 Mo en RGBA)
+
+    def __init__(self):
+        self.surface = pygame.Surface((self.SIZE, self.SIZE), pygame.SRCALPHA, 32).convert_alpha()
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def insert(self, image):
+        """Copie l'image dans la page et retourne sa vue (subsurface) ; None si elle n'y tient pas"""
+        width, height = image.get_size()
+        if width > self.SIZE or height > self.SIZE:
+            return None
+        if self.shelf_x + width > self.SIZE:
+            self.shelf_y += self.shelf_height + ATLAS_PADDING
+            self.shelf_x = self.shelf_height = 0
+        if self.shelf_y + height > self.SIZE:
+            return None
+
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.surface.blit(image, rect)  # Copie exacte sur les pixels transparents de la page
+        self.shelf_x += width + ATLAS_PADDING
+        self.shelf_height = max(self.shelf_height, height)
+        return self.surface.subsurface(rect)
+
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))  # Chemins relatifs comme le jeu
+    build_atlases(*sys.argv[1:3])
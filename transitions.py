@@ -7,6 +7,68 @@ Effets de transition style Star Wars pour les changements d'écrans
 
 import pygame
 import math
+import numpy as np
+
+
+class TransitionMasks:
+    """Champs de distance précalculés (un par type et par taille d'écran) pour les transitions
+
+    Chaque pixel porte sa « distance » à l'origine de l'effet : distance radiale au carré
+    depuis le centre pour l'iris, distance projetée sur la diagonale pour les wipes
+    diagonaux. Le masque d'une frame est un simple seuil de ce champ, appliqué avec
+    surfarray : le coût est le même pour tous les effets et ne dépend pas de la
+    progression.
+    """
+
+    def __init__(self):
+        self.fields = {}  # {(type, (largeur, hauteur)): tableau indexé [x, y]}
+        self.masks = {}  # {(largeur, hauteur): masque booléen préalloué, même disposition que les champs}
+
+    def get_field(self, kind, size):
+        """Retourne (et calcule une seule fois) le champ de distance d'un type pour une taille"""
+        key = (kind, size)
+        if key not in self.fields:
+            width, height = size
+            # Construit en (hauteur, largeur) puis transposé : même disposition mémoire que
+            # surfarray.pixels2d (lignes de pixels contiguës), ce qui rend le seuil et la copie rapides
+            x = np.arange(width, dtype=np.int32)[None, :]
+            y = np.arange(height, dtype=np.int32)[:, None]
+            if kind == "radial":
+                # Distance au carré : comparaison exacte avec le rayon entier au carré
+                dx = x - width // 2
+                dy = y - height // 2
+                field = (dx * dx + dy * dy).astype(np.uint32)
+            elif kind == "diagonal":
+                field = (x + y).astype(np.uint16)
+            else:  # "diagonal_reverse"
+                field = ((width - 1 - x) + (height - 1 - y)).astype(np.uint16)
+            self.fields[key] = field.T
+        return self.fields[key]
+
+    def get_mask(self, size):
+        """Retourne le tampon de masque (réutilisé à chaque frame) pour une taille d'écran"""
+        mask = self.masks.get(size)
+        if mask is None:
+            width, height = size
+            mask = self.masks[size] = np.empty((height, width), dtype=bool).T
+        return mask
+
+    def clear(self):
+        """Libère les champs et les masques (changement de taille d'écran)"""
+        self.fields.clear()
+        self.masks.clear()
+
+    def apply(self, screen, source, kind, threshold):
+        """Copie sur l'écran les pixels de la source dont la distance est < threshold"""
+        size = screen.get_size()
+        field = self.get_field(kind, size)
+        mask = self.get_mask(size)
+        np.less(field, threshold, out=mask)  # Seuil écrit dans le tampon, sans allocation
+        screen_pixels = pygame.surfarray.pixels2d(screen)
+        source_pixels = pygame.surfarray.pixels2d(source)
+        np.copyto(screen_pixels, source_pixels, where=mask)
+        # Libérer les vues pour déverrouiller les surfaces
+        del screen_pixels, source_pixels
 
 class TransitionManager:
     """Gestionnaire des effets de transition entre écrans"""
@@ -22,7 +84,8 @@ class TransitionManager:
         self.start_time = 0
         self.current_effect = None
         
-        # Surfaces pour la transition
+        # Surfaces pour la transition : tampons préalloués, réutilisés d'une transition à l'autre
+        # (recréés seulement si la taille de l'écran change)
         self.surface_old = None
         self.surface_new = None
         
@@ -31,6 +94,17 @@ class TransitionManager:
         
         # Surface de référence pour les captures d'écran
         self.screen_surface = None
+        
+        # Champs de distance des effets iris et diagonaux
+        self.masks = TransitionMasks()
+
+    def _ensure_buffers(self, size):
+        """Alloue les tampons de capture à la taille de l'écran (une seule fois par taille)"""
+        if self.surface_old is None or self.surface_old.get_size() != size:
+            self.surface_old = pygame.Surface(size).convert()
+            self.surface_new = pygame.Surface(size).convert()
+            self.screen_width, self.screen_height = size
+            self.masks.clear()
 
     def start_transition(self, transition_type="wipe_horizontal", duration=0.2, on_complete=None):
         """
@@ -46,14 +120,14 @@ class TransitionManager:
             
         # Capturer l'écran actuel si une surface de référence est disponible
         if self.screen_surface:
-            self.surface_old = self.screen_surface.copy()
+            self._ensure_buffers(self.screen_surface.get_size())
+            self.surface_old.blit(self.screen_surface, (0, 0))
         else:
-            # Créer une surface vide si aucune référence
-            self.surface_old = pygame.Surface((self.screen_width, self.screen_height))
+            # Surface vide si aucune référence
+            self._ensure_buffers((self.screen_width, self.screen_height))
             self.surface_old.fill((0, 0, 0))
         
         # Pour l'instant, surface nouvelle = surface noire (sera mise à jour après callback)
-        self.surface_new = pygame.Surface((self.screen_width, self.screen_height))
         self.surface_new.fill((0, 0, 0))
         
         self.current_effect = transition_type
@@ -69,7 +143,7 @@ class TransitionManager:
     def update_new_surface(self, new_surface):
         """Met à jour la surface 'nouvelle' pendant la transition"""
         if self.is_active and new_surface:
-            self.surface_new = new_surface.copy()
+            self.surface_new.blit(new_surface, (0, 0))
     
     def set_screen_reference(self, screen_surface):
         """Définit la surface d'écran de référence pour les captures"""
@@ -89,8 +163,9 @@ class TransitionManager:
         if self.is_active:
             return False  # Une transition est déjà en cours
             
-        self.surface_old = old_surface.copy()
-        self.surface_new = new_surface.copy()
+        self._ensure_buffers(old_surface.get_size())
+        self.surface_old.blit(old_surface, (0, 0))
+        self.surface_new.blit(new_surface, (0, 0))
         self.current_effect = effect_name
         self.duration = duration
         self.on_complete_callback = on_complete
@@ -140,235 +215,170 @@ class TransitionManager:
             if hasattr(self, '_callback_executed'):
                 delattr(self, '_callback_executed')
             
-            # Nettoyer les surfaces pour économiser la mémoire
-            self.surface_old = None
-            self.surface_new = None
+            # Les tampons de capture sont conservés pour la prochaine transition
             self.on_complete_callback = None
             
             return True  # Transition terminée
         
         return False  # Transition en cours
     
+    def finish(self):
+        """Termine immédiatement la transition en cours, callback compris (mode sans affichage)"""
+        if self.is_active:
+            self.start_time = pygame.time.get_ticks() - int(self.duration * 1000) - 1
+            self.update()
+    
     def render(self, screen):
-        """Rend la transition sur l'écran"""
-        if not self.is_active or not self.surface_old or not self.surface_new:
+        """Rend la transition directement sur l'écran (aucune surface plein écran allouée par frame)"""
+        if not self.is_active or self.surface_old is None:
             return
+        if screen.get_size() != self.surface_old.get_size():
+            return  # Fenêtre redimensionnée pendant la transition : captures obsolètes
             
         # Appliquer l'effet de transition
-        result_surface = self._apply_effect(self.surface_old, self.surface_new, self.progress, self.current_effect)
-        screen.blit(result_surface, (0, 0))
+        self._apply_effect(screen, self.surface_old, self.surface_new, self.progress, self.current_effect)
     
-    def _apply_effect(self, surface_old, surface_new, progress, effect_name):
-        """Applique l'effet de transition spécifié"""
+    def _apply_effect(self, screen, surface_old, surface_new, progress, effect_name):
+        """Compose l'effet de transition spécifié sur l'écran"""
         
         # Mapping des noms d'effets complets vers les méthodes
         if effect_name == "wipe_horizontal_left_to_right" or effect_name == "wipe_horizontal":
-            return self._wipe_horizontal_left_to_right(surface_old, surface_new, progress)
+            self._wipe_horizontal_left_to_right(screen, surface_old, surface_new, progress)
         elif effect_name == "wipe_horizontal_right_to_left" or effect_name == "wipe_horizontal_reverse":
-            return self._wipe_horizontal_right_to_left(surface_old, surface_new, progress)
+            self._wipe_horizontal_right_to_left(screen, surface_old, surface_new, progress)
         elif effect_name == "wipe_vertical_top_to_bottom" or effect_name == "wipe_vertical":
-            return self._wipe_vertical_top_to_bottom(surface_old, surface_new, progress)
+            self._wipe_vertical_top_to_bottom(screen, surface_old, surface_new, progress)
         elif effect_name == "wipe_vertical_bottom_to_top":
-            return self._wipe_vertical_bottom_to_top(surface_old, surface_new, progress)
+            self._wipe_vertical_bottom_to_top(screen, surface_old, surface_new, progress)
         elif effect_name == "wipe_vertical_split":
-            return self._wipe_vertical_split(surface_old, surface_new, progress)
+            self._wipe_vertical_split(screen, surface_old, surface_new, progress)
         elif effect_name == "wipe_vertical_split_reverse":
-            return self._wipe_vertical_split_reverse(surface_old, surface_new, progress)
+            self._wipe_vertical_split_reverse(screen, surface_old, surface_new, progress)
         elif effect_name == "diagonal_top_left_to_bottom_right" or effect_name == "wipe_diagonal":
-            return self._wipe_diagonal(surface_old, surface_new, progress)
+            self._wipe_diagonal(screen, surface_old, surface_new, progress)
         elif effect_name == "diagonal_bottom_right_to_top_left" or effect_name == "wipe_diagonal_reverse":
-            return self._wipe_diagonal_reverse(surface_old, surface_new, progress)
+            self._wipe_diagonal_reverse(screen, surface_old, surface_new, progress)
         elif effect_name == "diagonal_top_right_to_bottom_left":
-            return self._wipe_diagonal_reverse(surface_old, surface_new, progress)  # Utiliser la même méthode pour l'instant
+            self._wipe_diagonal_reverse(screen, surface_old, surface_new, progress)  # Utiliser la même méthode pour l'instant
         elif effect_name == "diagonal_bottom_left_to_top_right":
-            return self._wipe_diagonal(surface_old, surface_new, progress)  # Utiliser la même méthode pour l'instant
+            self._wipe_diagonal(screen, surface_old, surface_new, progress)  # Utiliser la même méthode pour l'instant
         elif effect_name == "iris_close":
-            return self._iris_close(surface_old, surface_new, progress)
+            self._iris_close(screen, surface_old, surface_new, progress)
         elif effect_name == "iris_open":
-            return self._iris_open(surface_old, surface_new, progress)
+            self._iris_open(screen, surface_old, surface_new, progress)
         elif effect_name == "fade":
-            return self._fade(surface_old, surface_new, progress)
+            self._fade(screen, surface_old, surface_new, progress)
         else:
             # Effet par défaut : fade
-            return self._fade(surface_old, surface_new, progress)
+            self._fade(screen, surface_old, surface_new, progress)
     
-    def _wipe_horizontal_left_to_right(self, surface_old, surface_new, progress):
+    def _blit_area(self, screen, source, x, y, width, height):
+        """Copie une zone de la source à la même position sur l'écran (blit découpé)"""
+        if width > 0 and height > 0:
+            screen.blit(source, (x, y), (x, y, width, height))
+    
+    def _wipe_horizontal_left_to_right(self, screen, surface_old, surface_new, progress):
         """Transition wipe horizontale de gauche à droite (classique Star Wars)"""
         wipe_x = int(self.screen_width * progress)
         
-        return_surface = surface_old.copy()
-        
-        if wipe_x > 0:
-            new_rect = pygame.Rect(0, 0, wipe_x, self.screen_height)
-            return_surface.blit(surface_new, (0, 0), new_rect)
-            
-        return return_surface
+        self._blit_area(screen, surface_new, 0, 0, wipe_x, self.screen_height)
+        self._blit_area(screen, surface_old, wipe_x, 0, self.screen_width - wipe_x, self.screen_height)
     
-    def _wipe_horizontal_right_to_left(self, surface_old, surface_new, progress):
+    def _wipe_horizontal_right_to_left(self, screen, surface_old, surface_new, progress):
         """Transition wipe horizontale de droite à gauche"""
         wipe_x = int(self.screen_width * (1 - progress))
         
-        return_surface = surface_old.copy()
-        
-        if wipe_x < self.screen_width:
-            new_rect = pygame.Rect(wipe_x, 0, self.screen_width - wipe_x, self.screen_height)
-            return_surface.blit(surface_new, (wipe_x, 0), new_rect)
-            
-        return return_surface
+        self._blit_area(screen, surface_old, 0, 0, wipe_x, self.screen_height)
+        self._blit_area(screen, surface_new, wipe_x, 0, self.screen_width - wipe_x, self.screen_height)
     
-    def _wipe_vertical_top_to_bottom(self, surface_old, surface_new, progress):
+    def _wipe_vertical_top_to_bottom(self, screen, surface_old, surface_new, progress):
         """Transition wipe verticale de haut en bas"""
         wipe_y = int(self.screen_height * progress)
         
-        return_surface = surface_old.copy()
-        
-        if wipe_y > 0:
-            new_rect = pygame.Rect(0, 0, self.screen_width, wipe_y)
-            return_surface.blit(surface_new, (0, 0), new_rect)
-            
-        return return_surface
+        self._blit_area(screen, surface_new, 0, 0, self.screen_width, wipe_y)
+        self._blit_area(screen, surface_old, 0, wipe_y, self.screen_width, self.screen_height - wipe_y)
     
-    def _wipe_vertical_bottom_to_top(self, surface_old, surface_new, progress):
+    def _wipe_vertical_bottom_to_top(self, screen, surface_old, surface_new, progress):
         """Transition wipe verticale de bas en haut"""
-        wipe_height = int(self.screen_height * progress)
-        wipe_y = self.screen_height - wipe_height
+        wipe_y = self.screen_height - int(self.screen_height * progress)
         
-        return_surface = surface_old.copy()
-        
-        if wipe_height > 0:
-            new_rect = pygame.Rect(0, wipe_y, self.screen_width, wipe_height)
-            return_surface.blit(surface_new, (0, wipe_y), new_rect)
-            
-        return return_surface
+        self._blit_area(screen, surface_old, 0, 0, self.screen_width, wipe_y)
+        self._blit_area(screen, surface_new, 0, wipe_y, self.screen_width, self.screen_height - wipe_y)
     
-    def _wipe_vertical_split(self, surface_old, surface_new, progress):
+    def _wipe_vertical_split(self, screen, surface_old, surface_new, progress):
         """Transition wipe verticale double : gauche de haut en bas, droite de bas en haut"""
-        return_surface = surface_old.copy()
-        
+        half_width = self.screen_width // 2
+        right_width = self.screen_width - half_width
         wipe_y_top = int(self.screen_height * progress)
         wipe_y_bottom = int(self.screen_height * (1 - progress))
         
         # Moitié gauche : wipe de haut en bas
-        if wipe_y_top > 0:
-            left_rect = pygame.Rect(0, 0, self.screen_width // 2, wipe_y_top)
-            return_surface.blit(surface_new, (0, 0), left_rect)
+        self._blit_area(screen, surface_new, 0, 0, half_width, wipe_y_top)
+        self._blit_area(screen, surface_old, 0, wipe_y_top, half_width, self.screen_height - wipe_y_top)
         
         # Moitié droite : wipe de bas en haut
-        if wipe_y_bottom < self.screen_height:
-            right_rect = pygame.Rect(self.screen_width // 2, wipe_y_bottom, 
-                                   self.screen_width // 2, self.screen_height - wipe_y_bottom)
-            return_surface.blit(surface_new, (self.screen_width // 2, wipe_y_bottom), right_rect)
-        
-        return return_surface
+        self._blit_area(screen, surface_old, half_width, 0, right_width, wipe_y_bottom)
+        self._blit_area(screen, surface_new, half_width, wipe_y_bottom, right_width, self.screen_height - wipe_y_bottom)
     
-    def _wipe_vertical_split_reverse(self, surface_old, surface_new, progress):
+    def _wipe_vertical_split_reverse(self, screen, surface_old, surface_new, progress):
         """Transition wipe verticale double inverse : gauche de bas en haut, droite de haut en bas"""
-        return_surface = surface_old.copy()
-        
-        wipe_y_bottom = int(self.screen_height * progress)
-        wipe_y_top = int(self.screen_height * (1 - progress))
+        half_width = self.screen_width // 2
+        right_width = self.screen_width - half_width
+        wipe_y_left = self.screen_height - int(self.screen_height * progress)
+        wipe_y_right = self.screen_height - int(self.screen_height * (1 - progress))
         
         # Moitié gauche : wipe de bas en haut
-        if wipe_y_bottom > 0:
-            left_rect = pygame.Rect(0, self.screen_height - wipe_y_bottom, self.screen_width // 2, wipe_y_bottom)
-            return_surface.blit(surface_new, (0, self.screen_height - wipe_y_bottom), left_rect)
+        self._blit_area(screen, surface_old, 0, 0, half_width, wipe_y_left)
+        self._blit_area(screen, surface_new, 0, wipe_y_left, half_width, self.screen_height - wipe_y_left)
         
         # Moitié droite : wipe de haut en bas
-        if wipe_y_top < self.screen_height:
-            right_rect = pygame.Rect(self.screen_width // 2, 0, 
-                                   self.screen_width // 2, self.screen_height - wipe_y_top)
-            return_surface.blit(surface_new, (self.screen_width // 2, 0), right_rect)
-        
-        return return_surface
+        self._blit_area(screen, surface_new, half_width, 0, right_width, wipe_y_right)
+        self._blit_area(screen, surface_old, half_width, wipe_y_right, right_width, self.screen_height - wipe_y_right)
     
-    def _wipe_diagonal(self, surface_old, surface_new, progress):
+    def _wipe_diagonal(self, screen, surface_old, surface_new, progress):
         """Transition wipe diagonale simple (de haut-gauche vers bas-droite)"""
-        return_surface = surface_old.copy()
+        screen.blit(surface_old, (0, 0))
         
-        # Calculer la position de la ligne diagonale
+        # Les pixels tels que x + y < position de la ligne diagonale sont déjà recouverts
         diagonal_pos = int((self.screen_width + self.screen_height) * progress)
-        
-        # Méthode simple : dessiner ligne par ligne
-        for y in range(self.screen_height):
-            line_end_x = diagonal_pos - y
-            if line_end_x > 0:
-                line_width = min(line_end_x, self.screen_width)
-                if line_width > 0:
-                    # Copier une ligne de la nouvelle surface
-                    line_rect = pygame.Rect(0, y, line_width, 1)
-                    return_surface.blit(surface_new, (0, y), line_rect)
-        
-        return return_surface
+        self.masks.apply(screen, surface_new, "diagonal", diagonal_pos)
     
-    def _wipe_diagonal_reverse(self, surface_old, surface_new, progress):
+    def _wipe_diagonal_reverse(self, screen, surface_old, surface_new, progress):
         """Transition wipe diagonale inverse (de bas-droite vers haut-gauche)"""
-        return_surface = surface_old.copy()
+        screen.blit(surface_old, (0, 0))
         
-        # Calculer la position de la ligne diagonale (depuis le bas-droite)
+        # Même seuil, distance mesurée depuis le coin bas-droite
         diagonal_pos = int((self.screen_width + self.screen_height) * progress)
-        
-        # Méthode simple : dessiner ligne par ligne depuis le bas
-        for y in range(self.screen_height):
-            line_start_x = self.screen_width - (diagonal_pos - (self.screen_height - 1 - y))
-            if line_start_x < self.screen_width:
-                line_start_x = max(0, line_start_x)
-                line_width = self.screen_width - line_start_x
-                if line_width > 0:
-                    # Copier une ligne de la nouvelle surface
-                    line_rect = pygame.Rect(line_start_x, y, line_width, 1)
-                    return_surface.blit(surface_new, (line_start_x, y), line_rect)
-        
-        return return_surface
+        self.masks.apply(screen, surface_new, "diagonal_reverse", diagonal_pos)
     
-    def _iris_close(self, surface_old, surface_new, progress):
+    def _iris_close(self, screen, surface_old, surface_new, progress):
         """Transition iris qui se ferme (cercle qui rétrécit)"""
-        return_surface = surface_new.copy()
+        screen.blit(surface_new, (0, 0))
         
         max_radius = math.sqrt(self.screen_width**2 + self.screen_height**2) / 2
         current_radius = int(max_radius * (1 - progress))
         
-        center_x = self.screen_width // 2
-        center_y = self.screen_height // 2
-        
         if current_radius > 0:
-            for x in range(max(0, center_x - current_radius), min(self.screen_width, center_x + current_radius + 1)):
-                for y in range(max(0, center_y - current_radius), min(self.screen_height, center_y + current_radius + 1)):
-                    distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                    if distance <= current_radius:
-                        pixel_color = surface_old.get_at((x, y))
-                        return_surface.set_at((x, y), pixel_color)
-        
-        return return_surface
+            self.masks.apply(screen, surface_old, "radial", current_radius * current_radius + 1)
     
-    def _iris_open(self, surface_old, surface_new, progress):
+    def _iris_open(self, screen, surface_old, surface_new, progress):
         """Transition iris qui s'ouvre (cercle qui grandit)"""
-        return_surface = surface_old.copy()
+        screen.blit(surface_old, (0, 0))
         
         max_radius = math.sqrt(self.screen_width**2 + self.screen_height**2) / 2
         current_radius = int(max_radius * progress)
         
-        center_x = self.screen_width // 2
-        center_y = self.screen_height // 2
-        
         if current_radius > 0:
-            for x in range(max(0, center_x - current_radius), min(self.screen_width, center_x + current_radius + 1)):
-                for y in range(max(0, center_y - current_radius), min(self.screen_height, center_y + current_radius + 1)):
-                    distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                    if distance <= current_radius:
-                        pixel_color = surface_new.get_at((x, y))
-                        return_surface.set_at((x, y), pixel_color)
-        
-        return return_surface
+            self.masks.apply(screen, surface_new, "radial", current_radius * current_radius + 1)
     
-    def _fade(self, surface_old, surface_new, progress):
+    def _fade(self, screen, surface_old, surface_new, progress):
         """Transition fondu enchaîné"""
-        return_surface = surface_old.copy()
-        
-        alpha_surface = surface_new.copy()
-        alpha_surface.set_alpha(int(255 * progress))
+        screen.blit(surface_old, (0, 0))
         
-        return_surface.blit(alpha_surface, (0, 0))
-        return return_surface
+        # Alpha de surface sur le tampon de capture lui-même (pas de copie)
+        surface_new.set_alpha(int(255 * progress))
+        screen.blit(surface_new, (0, 0))
+        surface_new.set_alpha(None)
 
 # Types de transitions disponibles avec leurs noms d'usage
 TRANSITION_TYPES = {